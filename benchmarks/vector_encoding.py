@@ -0,0 +1,62 @@
+"""
+Microbenchmark for encoding float vectors into protobuf Values.
+
+Compares the original list based path (ndarray.tolist() followed by a per-element
+float() cast into FloatData) against the fast path in conversions.toVectorDbValue,
+which extends FloatData with the list built by the C implemented tolist methods.
+
+Usage:
+    python benchmarks/vector_encoding.py [--dimensions 768] [--number 20000]
+"""
+
+import argparse
+import array
+import timeit
+
+import numpy
+
+from aerospike_vector_search.shared import conversions
+from aerospike_vector_search.shared.proto_generated import types_pb2
+
+
+def list_based(vector):
+    return types_pb2.Value(
+        vectorValue=types_pb2.Vector(
+            floatData={"value": [float(x) for x in vector.tolist()]}
+        )
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dimensions", type=int, default=768)
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+
+    vector = numpy.random.rand(args.dimensions).astype(numpy.float32)
+    candidates = {
+        "list based (ndarray)": lambda: list_based(vector),
+        "fast path (float32 ndarray)": lambda: conversions.toVectorDbValue(vector),
+        "fast path (float64 ndarray)": (
+            lambda v=vector.astype(numpy.float64): conversions.toVectorDbValue(v)
+        ),
+        "fast path (array.array('f'))": (
+            lambda v=array.array("f", vector.tobytes()): conversions.toVectorDbValue(v)
+        ),
+        "fast path (float32 memoryview)": (
+            lambda v=memoryview(vector): conversions.toVectorDbValue(v)
+        ),
+    }
+
+    baseline = None
+    print(f"{args.dimensions} dimensions, {args.number} encodings per candidate")
+    for name, candidate in candidates.items():
+        seconds = min(timeit.repeat(candidate, number=args.number, repeat=3))
+        per_call = seconds / args.number * 1e6
+        if baseline is None:
+            baseline = per_call
+        print(f"{name:35} {per_call:8.2f} us/op  {baseline / per_call:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
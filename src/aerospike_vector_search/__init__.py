@@ -1,14 +1,26 @@
 from .client import Client
 from .admin import Client as AdminClient
+from .metrics import ClientMetrics, MetricsSink, PrometheusTextSink
 from .types import (
     HostPort,
     Key,
     RecordWithKey,
     Neighbor,
+    NeighborArrays,
     VectorDistanceMetric,
+    LoadBalancingPolicy,
+    ChannelOptions,
+    RetryPolicy,
+    HedgePolicy,
+    CachePolicy,
+    VectorSearchCachePolicy,
+    CacheStats,
+    IndexCompletionProgress,
+    PhaseTiming,
     HnswBatchingParams,
     HnswParams,
     HnswSearchParams,
     AVSError,
     AVSServerError,
+    AVSDeadlineExceededError,
 )
@@ -4,6 +4,7 @@ import time
 from typing import Any, Optional, Union
 import grpc
 
+from . import metrics
 from . import types
 from .internal import channel_provider
 from .shared.admin_helpers import BaseClient
@@ -24,6 +25,16 @@ class Client(BaseClient):
         seeds: Union[types.HostPort, tuple[types.HostPort, ...]],
         listener_name: Optional[str] = None,
         is_loadbalancer: Optional[bool] = False,
+        tend_interval: Optional[float] = 1,
+        channel_options: Optional[types.ChannelOptions] = None,
+        metrics: Optional[metrics.ClientMetrics] = None,
+        interceptors: Optional[
+            list[
+                Union[
+                    grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor
+                ]
+            ]
+        ] = None,
     ) -> None:
         """
         Initialize the Aerospike Vector Search Admin Client.
@@ -32,6 +43,14 @@ class Client(BaseClient):
             seeds (Union[types.HostPort, tuple[types.HostPort, ...]]): Used to create appropriate gRPC channels for interacting with Aerospike Vector Search.
             listener_name (Optional[str], optional): Advertised listener for the client. Defaults to None.
             is_loadbalancer (bool, optional): If true, the first seed address will be treated as a load balancer node.
+            tend_interval (float, optional): Time in seconds between cluster tends, which refresh the node list and partition map.
+                Tends back off up to 30 seconds while the cluster is unreachable. Defaults to 1.
+            channel_options (types.ChannelOptions, optional): Keepalive, message size, HTTP/2 flow-control and compression options of the gRPC channels.
+                Defaults to None, which keeps the gRPC defaults.
+            metrics (Optional[metrics.ClientMetrics], optional): Collects latency histograms, error counts, in-flight calls
+                and message sizes of every RPC, per method and node. Defaults to None, which collects nothing.
+            interceptors (Optional[list[Union[grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor]]], optional): gRPC client interceptors wrapping every channel
+                of the client, including the channels opened when the cluster changes. Defaults to None.
 
         Raises:
             Exception: Raised when no seed host is provided.
@@ -40,7 +59,13 @@ class Client(BaseClient):
         seeds = self._prepare_seeds(seeds)
 
         self._channel_provider = channel_provider.ChannelProvider(
-            seeds, listener_name, is_loadbalancer
+            seeds,
+            listener_name,
+            is_loadbalancer,
+            tend_interval,
+            channel_options=channel_options,
+            metrics=metrics,
+            interceptors=interceptors,
         )
 
     def index_create(
@@ -96,8 +121,7 @@ class Client(BaseClient):
         try:
             index_stub.Create(index_create_request)
         except grpc.RpcError as e:
-            logger.error("Failed with error: %s", e)
-            raise types.AVSServerError(rpc_error=e)
+            raise self._handle_rpc_error(e, logger)
         try:
             self._wait_for_index_creation(
                 namespace=namespace, name=name, timeout=100_000
@@ -128,8 +152,7 @@ class Client(BaseClient):
         try:
             index_stub.Drop(index_drop_request)
         except grpc.RpcError as e:
-            logger.error("Failed with error: %s", e)
-            raise types.AVSServerError(rpc_error=e)
+            raise self._handle_rpc_error(e, logger)
         try:
             self._wait_for_index_deletion(
                 namespace=namespace, name=name, timeout=100_000
@@ -153,8 +176,7 @@ class Client(BaseClient):
         try:
             response = index_stub.List(index_list_request)
         except grpc.RpcError as e:
-            logger.error("Failed with error: %s", e)
-            raise types.AVSServerError(rpc_error=e)
+            raise self._handle_rpc_error(e, logger)
         return self._respond_index_list(response)
 
     def index_get(self, *, namespace: str, name: str) -> dict[str, Union[int, str]]:
@@ -179,8 +201,7 @@ class Client(BaseClient):
         try:
             response = index_stub.Get(index_get_request)
         except grpc.RpcError as e:
-            logger.error("Failed with error: %s", e)
-            raise types.AVSServerError(rpc_error=e)
+            raise self._handle_rpc_error(e, logger)
         return self._respond_index_get(response)
 
     def index_get_status(self, *, namespace: str, name: str) -> int:
@@ -210,8 +231,7 @@ class Client(BaseClient):
         try:
             response = index_stub.GetStatus(index_get_status_request)
         except grpc.RpcError as e:
-            logger.error("Failed with error: %s", e)
-            raise types.AVSServerError(rpc_error=e)
+            raise self._handle_rpc_error(e, logger)
 
         return self._respond_index_get_status(response)
 
@@ -242,8 +262,7 @@ class Client(BaseClient):
                     # Wait for some more time.
                     time.sleep(wait_interval)
                 else:
-                    logger.error("Failed with error: %s", e)
-                    raise types.AVSServerError(rpc_error=e)
+                    raise self._handle_rpc_error(e, logger)
 
     def _wait_for_index_deletion(
         self,
@@ -4,8 +4,11 @@ import sys
 from typing import Any, Optional, Union
 import grpc
 
+from .. import metrics
 from .. import types
 from .internal import channel_provider
+from .internal import index_poller
+from ..shared import index_wait
 from ..shared.admin_helpers import BaseClient
 
 logger = logging.getLogger(__name__)
@@ -24,6 +27,10 @@ class Client(BaseClient):
         seeds: Union[types.HostPort, tuple[types.HostPort, ...]],
         listener_name: Optional[str] = None,
         is_loadbalancer: Optional[bool] = False,
+        tend_interval: Optional[float] = 1,
+        channel_options: Optional[types.ChannelOptions] = None,
+        metrics: Optional[metrics.ClientMetrics] = None,
+        interceptors: Optional[list[grpc.aio.ClientInterceptor]] = None,
     ) -> None:
         """
         Initialize the Aerospike Vector Search Admin Client.
@@ -32,6 +39,15 @@ class Client(BaseClient):
             seeds (Union[types.HostPort, tuple[types.HostPort, ...]]): Used to create appropriate gRPC channels for interacting with Aerospike Vector Search.
             listener_name (Optional[str], optional): Advertised listener for the client. Defaults to None.
             is_loadbalancer (bool, optional): If true, the first seed address will be treated as a load balancer node.
+            tend_interval (float, optional): Time in seconds between cluster tends, which refresh the node list and partition map.
+                Tends back off up to 30 seconds while the cluster is unreachable. Defaults to 1.
+            channel_options (types.ChannelOptions, optional): Keepalive, message size, HTTP/2 flow-control and compression options of the gRPC channels.
+                Defaults to None, which keeps the gRPC defaults.
+            metrics (Optional[metrics.ClientMetrics], optional): Collects latency histograms, error counts, in-flight calls
+                and message sizes of every RPC, per method and node. Defaults to None, which collects nothing.
+            interceptors (Optional[list[grpc.aio.ClientInterceptor]], optional): gRPC client interceptors wrapping every channel
+                of the client, including the channels opened when the cluster changes. grpc.aio needs a separate
+                interceptor object for unary and for streaming calls. Defaults to None.
 
         Raises:
             Exception: Raised when no seed host is provided.
@@ -40,8 +56,15 @@ class Client(BaseClient):
         seeds = self._prepare_seeds(seeds)
 
         self._channel_provider = channel_provider.ChannelProvider(
-            seeds, listener_name, is_loadbalancer
+            seeds,
+            listener_name,
+            is_loadbalancer,
+            tend_interval,
+            channel_options=channel_options,
+            metrics=metrics,
+            interceptors=interceptors,
         )
+        self._index_poller: Optional[index_poller.IndexStatusPoller] = None
 
     async def index_create(
         self,
@@ -100,8 +123,7 @@ class Client(BaseClient):
         try:
             await index_stub.Create(index_create_request)
         except grpc.RpcError as e:
-            logger.error("Failed with error: %s", e)
-            raise types.AVSServerError(rpc_error=e)
+            raise self._handle_rpc_error(e, logger)
         try:
             await self._wait_for_index_creation(
                 namespace=namespace, name=name, timeout=100_000
@@ -134,8 +156,7 @@ class Client(BaseClient):
         try:
             await index_stub.Drop(index_drop_request)
         except grpc.RpcError as e:
-            logger.error("Failed with error: %s", e)
-            raise types.AVSServerError(rpc_error=e)
+            raise self._handle_rpc_error(e, logger)
         try:
             await self._wait_for_index_deletion(
                 namespace=namespace, name=name, timeout=100_000
@@ -161,8 +182,7 @@ class Client(BaseClient):
         try:
             response = await index_stub.List(index_list_request)
         except grpc.RpcError as e:
-            logger.error("Failed with error: %s", e)
-            raise types.AVSServerError(rpc_error=e)
+            raise self._handle_rpc_error(e, logger)
         return self._respond_index_list(response)
 
     async def index_get(
@@ -191,8 +211,7 @@ class Client(BaseClient):
         try:
             response = await index_stub.Get(index_get_request)
         except grpc.RpcError as e:
-            logger.error("Failed with error: %s", e)
-            raise types.AVSServerError(rpc_error=e)
+            raise self._handle_rpc_error(e, logger)
         return self._respond_index_get(response)
 
     async def index_get_status(self, *, namespace: str, name: str) -> int:
@@ -224,8 +243,7 @@ class Client(BaseClient):
         try:
             response = await index_stub.GetStatus(index_get_status_request)
         except grpc.RpcError as e:
-            logger.error("Failed with error: %s", e)
-            raise types.AVSServerError(rpc_error=e)
+            raise self._handle_rpc_error(e, logger)
 
         return self._respond_index_get_status(response)
 
@@ -239,27 +257,15 @@ class Client(BaseClient):
     ) -> None:
         """
         Wait for the index to be created.
-        """
-        await self._channel_provider._is_ready()
 
-        (index_stub, wait_interval, start_time, _, _, index_creation_request) = (
-            self._prepare_wait_for_index_waiting(namespace, name, wait_interval)
+        Indexes created concurrently are polled together by the client's shared status poller.
+        """
+        await self._get_index_poller().watch(
+            index_wait.IndexCreationWait(
+                namespace, name, timeout=timeout, wait_interval=wait_interval
+            )
         )
-        while True:
-            self._check_timeout(start_time, timeout)
-            try:
-                await index_stub.GetStatus(index_creation_request)
-                logger.debug("Index created succesfully")
-                # Index has been created
-                return
-            except grpc.RpcError as e:
-                if e.code() in (grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.NOT_FOUND):
-
-                    # Wait for some more time.
-                    await asyncio.sleep(wait_interval)
-                else:
-                    logger.error("Failed with error: %s", e)
-                    raise types.AVSServerError(rpc_error=e)
+        logger.debug("Index created succesfully")
 
     async def _wait_for_index_deletion(
         self,
@@ -294,6 +300,11 @@ class Client(BaseClient):
                 else:
                     raise types.AVSServerError(rpc_error=e)
 
+    def _get_index_poller(self) -> index_poller.IndexStatusPoller:
+        if self._index_poller is None:
+            self._index_poller = index_poller.IndexStatusPoller(self)
+        return self._index_poller
+
     async def close(self):
         """
         Close the Aerospike Vector Search Admin Client.
@@ -303,6 +314,8 @@ class Client(BaseClient):
         Note:
             This method should be called when the VectorDbAdminClient is no longer needed to release resources.
         """
+        if self._index_poller is not None:
+            await self._index_poller.close()
         await self._channel_provider.close()
 
     async def __aenter__(self):
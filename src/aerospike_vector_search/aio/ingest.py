@@ -0,0 +1,85 @@
+from typing import Callable, Optional, Union
+
+from ..ingest import (
+    _check_chunk,
+    _check_ingest_path,
+    _chunk_records,
+    _read_checkpoint,
+    _write_checkpoint,
+    count_vectors,
+    iter_vector_chunks,
+)
+
+
+async def ingest(
+    client,
+    *,
+    namespace: str,
+    path: str,
+    vector_field: str,
+    set_name: Optional[str] = None,
+    key_function: Optional[Callable[[int], Union[int, str, bytes, bytearray]]] = None,
+    column: Optional[str] = None,
+    chunk_size: int = 1000,
+    max_in_flight: int = 64,
+    progress: Optional[Callable[[int, int], None]] = None,
+    checkpoint_path: Optional[str] = None,
+    timeout: Optional[float] = None,
+) -> int:
+    """
+    Upsert every vector of a file into Aerospike Vector Search.
+
+    The file is streamed in chunks with aerospike_vector_search.ingest.iter_vector_chunks. The records of a
+    chunk are upserted with Client.upsert_many, which keeps at most max_in_flight requests outstanding, and the
+    next chunk is only read once the current one is written, so memory use does not grow with the file size.
+
+    When checkpoint_path is given, the index of the next vector to write is saved there after each chunk,
+    and a later call with the same checkpoint_path resumes from it.
+
+    Args:
+        client (Client): The asyncio client used to write the records.
+        namespace (str): The namespace for the records.
+        path (str): Path of a .fvecs, .bvecs, .npy or .parquet file.
+        vector_field (str): The record field the vectors are written to.
+        set_name (Optional[str], optional): The name of the set to which the records belong. Defaults to None.
+        key_function (Optional[Callable[[int], Union[int, str, bytes, bytearray]]], optional): Maps the index
+        of a vector in the file to its record key. If None, the index is the key. Defaults to None.
+        column (Optional[str], optional): The Parquet column holding the vectors.
+        If None, the first column is used. Defaults to None.
+        chunk_size (int, optional): The number of vectors read and written at a time. Defaults to 1000.
+        max_in_flight (int, optional): The maximum number of outstanding put requests. Defaults to 64.
+        progress (Optional[Callable[[int, int], None]], optional): Called with the number of vectors written
+        so far and the total number of vectors after each chunk. Defaults to None.
+        checkpoint_path (Optional[str], optional): File recording the progress of the ingest. Defaults to None.
+        timeout (Optional[float], optional): Time in seconds to wait for each call before it fails with
+        types.AVSDeadlineExceededError. Defaults to None, which uses the timeout given to the client.
+
+    Returns:
+        int: The number of vectors written by this call.
+
+    Raises:
+        types.AVSServerError: Raised with the first failed put of a chunk. The checkpoint is left at the
+        start of that chunk, so the ingest can be resumed.
+        Exception: Raised if an .ivecs file is given. Its integer elements, usually neighbor ids, are not vectors.
+    """
+    _check_ingest_path(path)
+    start = _read_checkpoint(checkpoint_path, path)
+    total = count_vectors(path)
+    written = 0
+    for offset, chunk in iter_vector_chunks(
+        path, chunk_size, start=start, column=column
+    ):
+        errors = await client.upsert_many(
+            namespace=namespace,
+            records=_chunk_records(chunk, offset, vector_field, key_function),
+            set_name=set_name,
+            max_in_flight=max_in_flight,
+            timeout=timeout,
+        )
+        _check_chunk(errors, offset)
+
+        written += len(chunk)
+        _write_checkpoint(checkpoint_path, path, offset + len(chunk))
+        if progress is not None:
+            progress(offset + len(chunk), total)
+    return written
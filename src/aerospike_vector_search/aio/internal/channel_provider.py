@@ -1,16 +1,19 @@
 import re
 import asyncio
 import logging
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
 import google.protobuf.empty_pb2
 import grpc
 import random
 
+from ... import metrics
 from ... import types
 from ...shared.proto_generated import vector_db_pb2
 from ...shared.proto_generated import vector_db_pb2_grpc
 from ...shared import base_channel_provider
+from ...shared import load_balancing
+from ...shared import metrics_interceptors
 
 empty = google.protobuf.empty_pb2.Empty()
 
@@ -25,24 +28,45 @@ class ChannelProvider(base_channel_provider.BaseChannelProvider):
         seeds: tuple[types.HostPort, ...],
         listener_name: Optional[str] = None,
         is_loadbalancer: Optional[bool] = False,
+        tend_interval: Optional[float] = 1,
+        load_balancing_policy: Optional[
+            types.LoadBalancingPolicy
+        ] = types.LoadBalancingPolicy.RANDOM,
+        connections_per_node: Optional[int] = 1,
+        channel_options: Optional[types.ChannelOptions] = None,
+        metrics: Optional[metrics.ClientMetrics] = None,
+        interceptors: Optional[list] = None,
     ) -> None:
-        super().__init__(seeds, listener_name, is_loadbalancer)
+        super().__init__(
+            seeds,
+            listener_name,
+            is_loadbalancer,
+            tend_interval,
+            load_balancing_policy,
+            connections_per_node,
+            channel_options,
+            metrics,
+            interceptors,
+        )
         asyncio.create_task(self._tend())
         self._tend_initalized: asyncio.Event = asyncio.Event()
+        self._tend_requested: asyncio.Event = asyncio.Event()
 
         self._tend_ended: asyncio.Event = asyncio.Event()
         self._task: Optional[asyncio.Task] = None
 
     async def close(self):
         self._closed = True
+        self._tend_requested.set()
         await self._tend_ended.wait()
 
         for channel in self._seedChannels:
             await channel.close()
 
         for k, channelEndpoints in self._node_channels.items():
-            if channelEndpoints.channel:
-                await channelEndpoints.channel.close()
+            for channel in channelEndpoints.channels:
+                if channel:
+                    await channel.close()
 
         if self._task != None:
             await self._task
@@ -50,10 +74,17 @@ class ChannelProvider(base_channel_provider.BaseChannelProvider):
     async def _is_ready(self):
         await self._tend_initalized.wait()
 
+    def request_tend(self):
+        if self.should_request_tend():
+            self._tend_requested.set()
+
     async def _tend(self):
+        self._tend_requested.clear()
         (temp_endpoints, update_endpoints_stub, channels, end_tend) = self.init_tend()
 
         if end_tend:
+            # Requests go straight to the seed when tend is skipped.
+            self._tend_initalized.set()
             self._tend_ended.set()
             return
 
@@ -72,9 +103,16 @@ class ChannelProvider(base_channel_provider.BaseChannelProvider):
                     "While tending, failed to get cluster id with error:" + str(e)
                 )
 
-        new_cluster_ids = await asyncio.gather(*tasks)
+        new_cluster_ids = await asyncio.gather(*tasks, return_exceptions=True)
+        cluster_reachable = False
 
         for index, value in enumerate(new_cluster_ids):
+            if isinstance(value, Exception):
+                logger.debug(
+                    "While tending, failed to get cluster id with error:" + str(value)
+                )
+                continue
+            cluster_reachable = True
             if self.check_cluster_id(value.id):
                 update_endpoints_stub = stubs[index]
                 break
@@ -93,6 +131,16 @@ class ChannelProvider(base_channel_provider.BaseChannelProvider):
                     + str(e)
                 )
 
+            try:
+                response = await update_endpoints_stub.GetOwnedPartitions(empty)
+                self.update_partition_owners(response)
+            except Exception as e:
+                # Requests are routed to random nodes until the map is known.
+                self._partition_owners = None
+                logger.debug(
+                    "While tending, failed to get owned partitions with error:" + str(e)
+                )
+
             tasks = []
             add_new_channel_info = []
 
@@ -104,7 +152,11 @@ class ChannelProvider(base_channel_provider.BaseChannelProvider):
                 if add_new_channel:
                     try:
                         # TODO: Wait for all calls to drain
-                        tasks.append(channel_endpoints.channel.close())
+                        tasks.extend(
+                            channel.close()
+                            for channel in channel_endpoints.channels
+                            if channel
+                        )
                     except Exception as e:
                         logger.debug(
                             "While tending, failed to close GRPC channel:" + str(e)
@@ -115,10 +167,14 @@ class ChannelProvider(base_channel_provider.BaseChannelProvider):
                 self.add_new_channel_to_node_channels(node, newEndpoints)
 
             for node, channel_endpoints in list(self._node_channels.items()):
-                if not self._node_channels.get(node):
+                if temp_endpoints and node not in temp_endpoints:
                     try:
                         # TODO: Wait for all calls to drain
-                        tasks.append(channel_endpoints.channel.close())
+                        tasks.extend(
+                            channel.close()
+                            for channel in channel_endpoints.channels
+                            if channel
+                        )
                         del self._node_channels[node]
 
                     except Exception as e:
@@ -130,11 +186,49 @@ class ChannelProvider(base_channel_provider.BaseChannelProvider):
 
         self._tend_initalized.set()
 
-        # TODO: check tend interval.
-        await asyncio.sleep(1)
+        try:
+            # Sleep until the next tend unless one is requested earlier.
+            await asyncio.wait_for(
+                self._tend_requested.wait(), self.next_tend_delay(cluster_reachable)
+            )
+        except asyncio.TimeoutError:
+            pass
         self._task = asyncio.create_task(self._tend())
 
-    def _create_channel(self, host: str, port: int, is_tls: bool) -> grpc.aio.Channel:
+    def _create_channel(
+        self,
+        host: str,
+        port: int,
+        is_tls: bool,
+        interceptors: Optional[list] = None,
+        options: Optional[list[tuple[str, Any]]] = None,
+    ) -> grpc.aio.Channel:
         # TODO: Take care of TLS
         host = re.sub(r"%.*", "", host)
-        return grpc.aio.insecure_channel(f"{host}:{port}")
+        # Outermost, so user interceptors see every call as the client made it.
+        interceptors = self._interceptors + list(interceptors or [])
+        if self._metrics is not None:
+            # Innermost, so only the time spent in gRPC is measured.
+            node = f"{host}:{port}"
+            interceptors = list(interceptors or []) + [
+                metrics_interceptors.AioUnaryUnaryMetricsInterceptor(
+                    self._metrics, node
+                ),
+                metrics_interceptors.AioUnaryStreamMetricsInterceptor(
+                    self._metrics, node
+                ),
+            ]
+        return grpc.aio.insecure_channel(
+            f"{host}:{port}",
+            options=self._get_channel_options(options),
+            compression=grpc.Compression.Gzip if self._compression else None,
+            interceptors=interceptors,
+        )
+
+    def _create_node_stats_interceptors(
+        self, stats: load_balancing.NodeStats
+    ) -> list[grpc.aio.ClientInterceptor]:
+        return [
+            load_balancing.AioUnaryUnaryNodeStatsInterceptor(stats),
+            load_balancing.AioUnaryStreamNodeStatsInterceptor(stats),
+        ]
@@ -0,0 +1,133 @@
+import asyncio
+import logging
+import time
+from typing import Callable, Optional
+
+import grpc
+
+from ... import types
+
+logger = logging.getLogger(__name__)
+
+
+class IndexWatch(object):
+    def __init__(
+        self,
+        wait,
+        future: asyncio.Future,
+        progress: Optional[Callable[[types.IndexCompletionProgress], None]],
+    ) -> None:
+        self.wait = wait
+        self.future = future
+        self.progress = progress
+
+
+class IndexStatusPoller(object):
+    """
+    Polls the status of every watched index from a single task.
+
+    Each watch is a wait from shared.index_wait with its own poll schedule. On every round the poller
+    sends the GetStatus requests of all watches that are due concurrently, then sleeps until the next
+    one is due or a new watch is added.
+    """
+
+    def __init__(self, client, rpc_timeout: Optional[float] = None) -> None:
+        self._client = client
+        self._rpc_timeout = rpc_timeout
+        self._watches: list[IndexWatch] = []
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+
+    def watch(
+        self,
+        wait,
+        progress: Optional[Callable[[types.IndexCompletionProgress], None]] = None,
+    ) -> asyncio.Future:
+        """
+        Returns a future resolved when the wait is done, or failed with the error that ended it.
+
+        Cancelling the future stops polling its index.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._watches.append(IndexWatch(wait, future, progress))
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+        else:
+            self._wakeup.set()
+        return future
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        for watch in self._watches:
+            watch.future.cancel()
+        self._watches = []
+
+    async def _run(self) -> None:
+        try:
+            await self._poll_watches()
+        except Exception as e:
+            for watch in self._watches:
+                if not watch.future.done():
+                    watch.future.set_exception(e)
+            self._watches = []
+
+    async def _poll_watches(self) -> None:
+        await self._client._channel_provider._is_ready()
+
+        while True:
+            self._watches = [
+                watch for watch in self._watches if not watch.future.done()
+            ]
+            if not self._watches:
+                return
+
+            now = time.monotonic()
+            due = [watch for watch in self._watches if watch.wait.next_poll <= now]
+            if due:
+                index_stub = self._client._get_index_stub()
+                await asyncio.gather(*(self._poll(index_stub, watch) for watch in due))
+                continue
+
+            self._wakeup.clear()
+            next_poll = min(watch.wait.next_poll for watch in self._watches)
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), next_poll - now)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _poll(self, index_stub, watch: IndexWatch) -> None:
+        wait = watch.wait
+        try:
+            wait.check_timeout()
+            try:
+                index_status = await index_stub.GetStatus(
+                    wait.index_id, timeout=self._rpc_timeout
+                )
+            except grpc.RpcError as e:
+                code = e.code()
+                if code == grpc.StatusCode.UNAVAILABLE or (
+                    code == grpc.StatusCode.NOT_FOUND and wait.retries_not_found
+                ):
+                    logger.debug(
+                        "Index status unavailable: namespace=%s, name=%s",
+                        wait.namespace,
+                        wait.name,
+                    )
+                    self._client._channel_provider.on_rpc_error(e)
+                    wait.on_unavailable()
+                    return
+                raise self._client._handle_rpc_error(e, logger)
+
+            index_progress = wait.on_status(index_status.unmergedRecordCount)
+            if watch.progress is not None and index_progress is not None:
+                watch.progress(index_progress)
+            if wait.done and not watch.future.done():
+                watch.future.set_result(None)
+        except Exception as e:
+            if not watch.future.done():
+                watch.future.set_exception(e)
@@ -1,10 +1,14 @@
+import collections
+import concurrent.futures
 import logging
 import sys
 import time
-from typing import Any, Optional, Union
+from typing import Any, Callable, Iterable, Optional, Union
 
 import grpc
+import numpy as np
 
+from . import metrics
 from . import types
 from .internal import channel_provider
 from .shared.client_helpers import BaseClient
@@ -27,6 +31,27 @@ class Client(BaseClient):
         seeds: Union[types.HostPort, tuple[types.HostPort, ...]],
         listener_name: Optional[str] = None,
         is_loadbalancer: Optional[bool] = False,
+        tend_interval: Optional[float] = 1,
+        load_balancing_policy: Optional[
+            types.LoadBalancingPolicy
+        ] = types.LoadBalancingPolicy.RANDOM,
+        connections_per_node: Optional[int] = 1,
+        channel_options: Optional[types.ChannelOptions] = None,
+        timeout: Optional[float] = None,
+        retry_policy: Optional[types.RetryPolicy] = None,
+        hedge_policy: Optional[types.HedgePolicy] = None,
+        vector_search_cache: Optional[types.VectorSearchCachePolicy] = None,
+        record_cache: Optional[types.CachePolicy] = None,
+        debug_log_sample_rate: float = 1,
+        metrics: Optional[metrics.ClientMetrics] = None,
+        phase_timing: Optional[Callable[[types.PhaseTiming], None]] = None,
+        interceptors: Optional[
+            list[
+                Union[
+                    grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor
+                ]
+            ]
+        ] = None,
     ) -> None:
         """
         Initialize the Aerospike Vector Search Vector Client.
@@ -38,13 +63,72 @@ class Client(BaseClient):
                 Advertised listener for the client. Defaults to None.
             is_loadbalancer (bool, optional):
                 If true, the first seed address will be treated as a load balancer node.
+            tend_interval (float, optional):
+                Time in seconds between cluster tends, which refresh the node list and partition map.
+                Tends back off up to 30 seconds while the cluster is unreachable. Defaults to 1.
+            load_balancing_policy (types.LoadBalancingPolicy, optional):
+                How requests that are not routed to a key's partition owner are spread across nodes.
+                Defaults to types.LoadBalancingPolicy.RANDOM.
+            connections_per_node (int, optional):
+                Number of connections opened to each node. Requests are spread across them,
+                which raises the concurrent stream and flow control limits of a single connection.
+                Defaults to 1.
+            channel_options (types.ChannelOptions, optional):
+                Keepalive, message size, HTTP/2 flow-control and compression options of the gRPC channels.
+                Defaults to None, which keeps the gRPC defaults.
+            timeout (Optional[float], optional):
+                Default time in seconds each operation waits for the server, overridable per call.
+                Defaults to None, meaning operations wait indefinitely.
+            retry_policy (Optional[types.RetryPolicy], optional):
+                How failed idempotent reads are retried, for example types.RetryPolicy().
+                Defaults to None, which disables retries.
+            hedge_policy (Optional[types.HedgePolicy], optional):
+                When to send a second attempt of a slow get or vector_search to another node.
+                Defaults to None, which disables hedging.
+            vector_search_cache (Optional[types.VectorSearchCachePolicy], optional):
+                Caches vector_search results on the client. Cached results are not refreshed when records change,
+                use invalidate_vector_search_cache or a short ttl. Defaults to None, which disables the cache.
+            record_cache (Optional[types.CachePolicy], optional):
+                Caches records read by get, per key and field names. Writes and deletes made through this client
+                drop the cached record, writes made by others are seen once the entry expires.
+                Defaults to None, which disables the cache.
+            debug_log_sample_rate (float, optional):
+                Fraction of operations whose DEBUG messages are logged, from 0 to 1. Lower it to keep DEBUG
+                logging on under production load. Defaults to 1.
+            metrics (Optional[metrics.ClientMetrics], optional):
+                Collects latency histograms, error counts, in-flight calls and message sizes of every RPC,
+                per method and node. Defaults to None, which collects nothing.
+            phase_timing (Optional[Callable[[types.PhaseTiming], None]], optional):
+                Called with the time spent preparing the request, waiting for the first response,
+                draining the response stream and decoding the results of each get and vector_search
+                sent to the server. Defaults to None, which times nothing.
+            interceptors (Optional[list[Union[grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor]]], optional):
+                gRPC client interceptors wrapping every channel of the client, including the channels opened
+                when the cluster changes, for example to add tracing metadata to each call.
+                Defaults to None.
 
         Raises:
-            Exception: Raised when no seed host is provided.
+            Exception: Raised when no seed host is provided, connections_per_node is less than 1
+            or debug_log_sample_rate is not between 0 and 1.
         """
         seeds = self._prepare_seeds(seeds)
+        self._timeout = timeout
+        self._prepare_retry(retry_policy, hedge_policy)
+        self._prepare_vector_search_cache(vector_search_cache)
+        self._prepare_record_cache(record_cache)
+        self._prepare_debug_log(debug_log_sample_rate)
+        self._prepare_phase_timing(phase_timing)
+        self._hedge_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
         self._channel_provider = channel_provider.ChannelProvider(
-            seeds, listener_name, is_loadbalancer
+            seeds,
+            listener_name,
+            is_loadbalancer,
+            tend_interval,
+            load_balancing_policy,
+            connections_per_node,
+            channel_options,
+            metrics,
+            interceptors,
         )
 
     def insert(
@@ -54,6 +138,7 @@ class Client(BaseClient):
         key: Union[int, str, bytes, bytearray],
         record_data: dict[str, Any],
         set_name: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> None:
         """
         Insert a record into Aerospike Vector Search.
@@ -66,8 +151,11 @@ class Client(BaseClient):
             key (Union[int, str, bytes, bytearray]): The key for the record.
             record_data (dict[str, Any]): The data to be stored in the record.
             set_name (Optional[str], optional): The name of the set to which the record belongs. Defaults to None.
+            timeout (Optional[float], optional): Time in seconds to wait for the call before it fails with
+            types.AVSDeadlineExceededError. Defaults to None, which uses the timeout given to the client.
 
         Raises:
+            types.AVSDeadlineExceededError: Raised if the server does not respond before the timeout expires.
             grpc.RpcError: Raised if an error occurs during the RPC communication with the server while attempting to create the index.
             This error could occur due to various reasons such as network issues, server-side failures, or invalid request parameters.
 
@@ -77,10 +165,11 @@ class Client(BaseClient):
         )
 
         try:
-            transact_stub.Put(insert_request)
+            transact_stub.Put(insert_request, timeout=self._get_timeout(timeout))
         except grpc.RpcError as e:
-            logger.error("Failed with error: %s", e)
-            raise types.AVSServerError(rpc_error=e)
+            raise self._handle_rpc_error(e, logger)
+        finally:
+            self._invalidate_cached_record(insert_request.key)
 
     def update(
         self,
@@ -89,6 +178,7 @@ class Client(BaseClient):
         key: Union[int, str, bytes, bytearray],
         record_data: dict[str, Any],
         set_name: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> None:
         """
         Update a record in Aerospike Vector Search.
@@ -101,8 +191,11 @@ class Client(BaseClient):
             key (Union[int, str, bytes, bytearray]): The key for the record.
             record_data (dict[str, Any]): The data to be stored in the record.
             set_name (Optional[str], optional): The name of the set to which the record belongs. Defaults to None.
+            timeout (Optional[float], optional): Time in seconds to wait for the call before it fails with
+            types.AVSDeadlineExceededError. Defaults to None, which uses the timeout given to the client.
 
         Raises:
+            types.AVSDeadlineExceededError: Raised if the server does not respond before the timeout expires.
             grpc.RpcError: Raised if an error occurs during the RPC communication with the server while attempting to create the index.
             This error could occur due to various reasons such as network issues, server-side failures, or invalid request parameters.
 
@@ -112,10 +205,11 @@ class Client(BaseClient):
         )
 
         try:
-            transact_stub.Put(update_request)
+            transact_stub.Put(update_request, timeout=self._get_timeout(timeout))
         except grpc.RpcError as e:
-            logger.error("Failed with error: %s", e)
-            raise types.AVSServerError(rpc_error=e)
+            raise self._handle_rpc_error(e, logger)
+        finally:
+            self._invalidate_cached_record(update_request.key)
 
     def upsert(
         self,
@@ -124,6 +218,7 @@ class Client(BaseClient):
         key: Union[int, str, bytes, bytearray],
         record_data: dict[str, Any],
         set_name: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> None:
         """
         Upsert a record in Aerospike Vector Search.
@@ -136,8 +231,11 @@ class Client(BaseClient):
             key (Union[int, str, bytes, bytearray]): The key for the record.
             record_data (dict[str, Any]): The data to be stored in the record.
             set_name (Optional[str], optional): The name of the set to which the record belongs. Defaults to None.
+            timeout (Optional[float], optional): Time in seconds to wait for the call before it fails with
+            types.AVSDeadlineExceededError. Defaults to None, which uses the timeout given to the client.
 
         Raises:
+            types.AVSDeadlineExceededError: Raised if the server does not respond before the timeout expires.
             grpc.RpcError: Raised if an error occurs during the RPC communication with the server while attempting to create the index.
             This error could occur due to various reasons such as network issues, server-side failures, or invalid request parameters.
 
@@ -147,10 +245,122 @@ class Client(BaseClient):
         )
 
         try:
-            transact_stub.Put(upsert_request)
+            transact_stub.Put(upsert_request, timeout=self._get_timeout(timeout))
         except grpc.RpcError as e:
-            logger.error("Failed with error: %s", e)
-            raise types.AVSServerError(rpc_error=e)
+            raise self._handle_rpc_error(e, logger)
+        finally:
+            self._invalidate_cached_record(upsert_request.key)
+
+    def insert_many(
+        self,
+        *,
+        namespace: str,
+        records: Iterable[tuple[Union[int, str, bytes, bytearray], dict[str, Any]]],
+        set_name: Optional[str] = None,
+        max_in_flight: int = 64,
+        timeout: Optional[float] = None,
+    ) -> list[Optional[types.AVSServerError]]:
+        """
+        Insert many records into Aerospike Vector Search.
+
+        Put requests are pipelined: up to max_in_flight requests are sent before waiting for the oldest response.
+        A failed record does not stop the remaining records from being written.
+
+        Args:
+            namespace (str): The namespace for the records.
+            records (Iterable[tuple[Union[int, str, bytes, bytearray], dict[str, Any]]]): (key, record_data) pairs to be inserted.
+            set_name (Optional[str], optional): The name of the set to which the records belong. Defaults to None.
+            max_in_flight (int, optional): The maximum number of outstanding put requests. Defaults to 64. Must be at least 1.
+            timeout (Optional[float], optional): Time in seconds to wait for each call before it fails with
+            types.AVSDeadlineExceededError. Defaults to None, which uses the timeout given to the client.
+
+        Returns:
+            list[Optional[types.AVSServerError]]: One entry per record, in input order.
+            None if the record was written, otherwise the error raised for that record.
+        """
+        self._validate_max_in_flight(max_in_flight)
+        return self._put_many(
+            namespace,
+            records,
+            set_name,
+            self._prepare_insert,
+            max_in_flight,
+            timeout,
+        )
+
+    def update_many(
+        self,
+        *,
+        namespace: str,
+        records: Iterable[tuple[Union[int, str, bytes, bytearray], dict[str, Any]]],
+        set_name: Optional[str] = None,
+        max_in_flight: int = 64,
+        timeout: Optional[float] = None,
+    ) -> list[Optional[types.AVSServerError]]:
+        """
+        Update many records in Aerospike Vector Search.
+
+        Put requests are pipelined: up to max_in_flight requests are sent before waiting for the oldest response.
+        A failed record does not stop the remaining records from being written.
+
+        Args:
+            namespace (str): The namespace for the records.
+            records (Iterable[tuple[Union[int, str, bytes, bytearray], dict[str, Any]]]): (key, record_data) pairs to be updated.
+            set_name (Optional[str], optional): The name of the set to which the records belong. Defaults to None.
+            max_in_flight (int, optional): The maximum number of outstanding put requests. Defaults to 64. Must be at least 1.
+            timeout (Optional[float], optional): Time in seconds to wait for each call before it fails with
+            types.AVSDeadlineExceededError. Defaults to None, which uses the timeout given to the client.
+
+        Returns:
+            list[Optional[types.AVSServerError]]: One entry per record, in input order.
+            None if the record was written, otherwise the error raised for that record.
+        """
+        self._validate_max_in_flight(max_in_flight)
+        return self._put_many(
+            namespace,
+            records,
+            set_name,
+            self._prepare_update,
+            max_in_flight,
+            timeout,
+        )
+
+    def upsert_many(
+        self,
+        *,
+        namespace: str,
+        records: Iterable[tuple[Union[int, str, bytes, bytearray], dict[str, Any]]],
+        set_name: Optional[str] = None,
+        max_in_flight: int = 64,
+        timeout: Optional[float] = None,
+    ) -> list[Optional[types.AVSServerError]]:
+        """
+        Upsert many records in Aerospike Vector Search.
+
+        Put requests are pipelined: up to max_in_flight requests are sent before waiting for the oldest response.
+        A failed record does not stop the remaining records from being written.
+
+        Args:
+            namespace (str): The namespace for the records.
+            records (Iterable[tuple[Union[int, str, bytes, bytearray], dict[str, Any]]]): (key, record_data) pairs to be upserted.
+            set_name (Optional[str], optional): The name of the set to which the records belong. Defaults to None.
+            max_in_flight (int, optional): The maximum number of outstanding put requests. Defaults to 64. Must be at least 1.
+            timeout (Optional[float], optional): Time in seconds to wait for each call before it fails with
+            types.AVSDeadlineExceededError. Defaults to None, which uses the timeout given to the client.
+
+        Returns:
+            list[Optional[types.AVSServerError]]: One entry per record, in input order.
+            None if the record was written, otherwise the error raised for that record.
+        """
+        self._validate_max_in_flight(max_in_flight)
+        return self._put_many(
+            namespace,
+            records,
+            set_name,
+            self._prepare_upsert,
+            max_in_flight,
+            timeout,
+        )
 
     def get(
         self,
@@ -159,6 +369,7 @@ class Client(BaseClient):
         key: Union[int, str, bytes, bytearray],
         field_names: Optional[list[str]] = None,
         set_name: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> types.RecordWithKey:
         """
         Read a record from Aerospike Vector Search.
@@ -169,27 +380,139 @@ class Client(BaseClient):
             field_names (Optional[list[str]], optional): A list of field names to retrieve from the record.
             If None, all fields are retrieved. Defaults to None.
             set_name (Optional[str], optional): The name of the set from which to read the record. Defaults to None.
+            timeout (Optional[float], optional): Time in seconds to wait for the call before it fails with
+            types.AVSDeadlineExceededError. Defaults to None, which uses the timeout given to the client.
 
         Returns:
             types.RecordWithKey: A record with its associated key.
 
         Raises:
+            types.AVSDeadlineExceededError: Raised if the server does not respond before the timeout expires.
             grpc.RpcError: Raised if an error occurs during the RPC communication with the server while attempting to create the index.
             This error could occur due to various reasons such as network issues, server-side failures, or invalid request parameters.
         """
+        timed = self._phase_timing is not None
+        if timed:
+            start = time.perf_counter_ns()
         (transact_stub, key, get_request) = self._prepare_get(
             namespace, key, field_names, set_name, logger
         )
+        if self._record_cache is not None:
+            cache_key = self._get_record_cache_key(key, field_names)
+            record = self._get_cached_record(cache_key)
+            if record is not None:
+                return record
+            version = self._record_cache.version()
+        if timed:
+            prepared = time.perf_counter_ns()
+
         try:
-            response = transact_stub.Get(get_request)
+            response = self._call_read(
+                "get",
+                transact_stub,
+                lambda stub, timeout: stub.Get.future(get_request, timeout=timeout),
+                self._future_result,
+                timeout,
+                hedge=True,
+            )
         except grpc.RpcError as e:
-            logger.error("Failed with error: %s", e)
-            raise types.AVSServerError(rpc_error=e)
+            raise self._handle_rpc_error(e, logger)
+        if timed:
+            received = time.perf_counter_ns()
+
+        record = self._respond_get(response, key)
+        if timed:
+            self._report_phase_timing(
+                "get", start, prepared, received, received, time.perf_counter_ns(), 1
+            )
+        if self._record_cache is not None:
+            self._cache_record(cache_key, record, version)
+        return record
+
+    def get_many(
+        self,
+        *,
+        namespace: str,
+        keys: Iterable[Union[int, str, bytes, bytearray]],
+        field_names: Optional[list[str]] = None,
+        set_name: Optional[str] = None,
+        max_in_flight: int = 64,
+        timeout: Optional[float] = None,
+    ) -> list[Optional[types.RecordWithKey]]:
+        """
+        Read many records from Aerospike Vector Search.
+
+        Each get is sent to the node owning its key. Up to max_in_flight gets run concurrently,
+        and records cached by the record cache are not requested again.
+
+        Args:
+            namespace (str): The namespace for the records.
+            keys (Iterable[Union[int, str, bytes, bytearray]]): The keys of the records.
+            field_names (Optional[list[str]], optional): A list of field names to retrieve from the records.
+            If None, all fields are retrieved. Defaults to None.
+            set_name (Optional[str], optional): The name of the set from which to read the records. Defaults to None.
+            max_in_flight (int, optional): The maximum number of concurrent gets. Defaults to 64. Must be at least 1.
+            timeout (Optional[float], optional): Time in seconds to wait for each call before it fails with
+            types.AVSDeadlineExceededError. Defaults to None, which uses the timeout given to the client.
+
+        Returns:
+            list[Optional[types.RecordWithKey]]: One entry per key, in input order. None if the record does not exist.
+
+        Raises:
+            types.AVSDeadlineExceededError: Raised if the server does not respond before the timeout expires.
+            grpc.RpcError: Raised if an error occurs during the RPC communication with the server while attempting to create the index.
+            This error could occur due to various reasons such as network issues, server-side failures, or invalid request parameters.
+        """
+        self._validate_max_in_flight(max_in_flight)
+        version = None
+        if self._record_cache is not None:
+            version = self._record_cache.version()
+        records = []
+
+        def start_gets():
+            for (transact_stub, key, get_request) in self._prepare_get_many(
+                namespace, keys, field_names, set_name, logger
+            ):
+                cache_key = None
+                if self._record_cache is not None:
+                    cache_key = self._get_record_cache_key(key, field_names)
+                    record = self._get_cached_record(cache_key)
+                    if record is not None:
+                        records.append(record)
+                        continue
+
+                records.append(None)
+                future = transact_stub.Get.future(
+                    get_request, timeout=self._get_timeout(timeout)
+                )
+                yield (len(records) - 1, key, cache_key, future)
+
+        def finish_get(call):
+            (index, key, cache_key, future) = call
+            try:
+                response = future.result()
+            except grpc.RpcError as e:
+                if e.code() == grpc.StatusCode.NOT_FOUND:
+                    return
+                raise self._handle_rpc_error(e, logger)
+
+            records[index] = self._respond_get(response, key)
+            if cache_key is not None:
+                self._cache_record(cache_key, records[index], version)
 
-        return self._respond_get(response, key)
+        for _ in self._pipeline(
+            start_gets(), max_in_flight, finish_get, lambda call: call[3]
+        ):
+            pass
+        return records
 
     def exists(
-        self, *, namespace: str, key: Any, set_name: Optional[str] = None
+        self,
+        *,
+        namespace: str,
+        key: Any,
+        set_name: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> bool:
         """
         Check if a record exists in Aerospike Vector Search.
@@ -198,11 +521,14 @@ class Client(BaseClient):
             namespace (str): The namespace for the record.
             key (Any): The key for the record.
             set_name (Optional[str], optional): The name of the set to which the record belongs. Defaults to None.
+            timeout (Optional[float], optional): Time in seconds to wait for the call before it fails with
+            types.AVSDeadlineExceededError. Defaults to None, which uses the timeout given to the client.
 
         Returns:
             bool: True if the record exists, False otherwise.
 
         Raises:
+            types.AVSDeadlineExceededError: Raised if the server does not respond before the timeout expires.
             grpc.RpcError: Raised if an error occurs during the RPC communication with the server while attempting to create the index.
             This error could occur due to various reasons such as network issues, server-side failures, or invalid request parameters.
         """
@@ -210,15 +536,76 @@ class Client(BaseClient):
             namespace, key, set_name, logger
         )
         try:
-            response = transact_stub.Exists(exists_request)
+            response = self._call_read(
+                "exists",
+                transact_stub,
+                lambda stub, timeout: stub.Exists.future(
+                    exists_request, timeout=timeout
+                ),
+                self._future_result,
+                timeout,
+            )
         except grpc.RpcError as e:
-            logger.error("Failed with error: %s", e)
-            raise types.AVSServerError(rpc_error=e)
+            raise self._handle_rpc_error(e, logger)
 
         return self._respond_exists(response)
 
+    def exists_many(
+        self,
+        *,
+        namespace: str,
+        keys: Iterable[Union[int, str, bytes, bytearray]],
+        set_name: Optional[str] = None,
+        max_in_flight: int = 64,
+        progress: Optional[Callable[[int], None]] = None,
+        progress_interval: int = 10000,
+        timeout: Optional[float] = None,
+    ) -> np.ndarray:
+        """
+        Check if many records exist in Aerospike Vector Search.
+
+        Each check is sent to the node owning its key and up to max_in_flight checks run concurrently.
+        Keys are consumed lazily, so they can be produced by a generator.
+
+        Args:
+            namespace (str): The namespace for the records.
+            keys (Iterable[Union[int, str, bytes, bytearray]]): The keys of the records.
+            set_name (Optional[str], optional): The name of the set to which the records belong. Defaults to None.
+            max_in_flight (int, optional): The maximum number of concurrent checks. Defaults to 64. Must be at least 1.
+            progress (Optional[Callable[[int], None]], optional): Called with the number of keys checked so far
+            every progress_interval keys and once all keys are checked. Defaults to None.
+            progress_interval (int, optional): The number of keys checked between progress calls. Defaults to 10000. Must be at least 1.
+            timeout (Optional[float], optional): Time in seconds to wait for each call before it fails with
+            types.AVSDeadlineExceededError. Defaults to None, which uses the timeout given to the client.
+
+        Returns:
+            numpy.ndarray: A bool array aligned with keys, True where the record exists.
+
+        Raises:
+            types.AVSDeadlineExceededError: Raised if the server does not respond before the timeout expires.
+            grpc.RpcError: Raised if an error occurs during the RPC communication with the server while attempting to create the index.
+            This error could occur due to various reasons such as network issues, server-side failures, or invalid request parameters.
+        """
+        self._validate_max_in_flight(max_in_flight)
+        self._validate_progress_interval(progress_interval)
+        return self._check_many(
+            self._prepare_exists_many(namespace, keys, set_name, logger),
+            "Exists",
+            self._respond_exists,
+            self._get_key_count(keys),
+            max_in_flight,
+            progress,
+            progress_interval,
+            timeout,
+        )
+
     def delete(
-        self, *, namespace: str, key: Any, set_name: Optional[str] = None
+        self,
+        *,
+        namespace: str,
+        key: Any,
+        set_name: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> None:
         """
         Delete a record from Aerospike Vector Search.
@@ -227,8 +614,11 @@ class Client(BaseClient):
             namespace (str): The namespace for the record.
             key (Any): The key for the record.
             set_name (Optional[str], optional): The name of the set to which the record belongs. Defaults to None.
+            timeout (Optional[float], optional): Time in seconds to wait for the call before it fails with
+            types.AVSDeadlineExceededError. Defaults to None, which uses the timeout given to the client.
 
         Raises:
+            types.AVSDeadlineExceededError: Raised if the server does not respond before the timeout expires.
             grpc.RpcError: Raised if an error occurs during the RPC communication with the server while attempting to create the index.
             This error could occur due to various reasons such as network issues, server-side failures, or invalid request parameters.
         """
@@ -236,10 +626,65 @@ class Client(BaseClient):
             namespace, key, set_name, logger
         )
         try:
-            transact_stub.Delete(delete_request)
+            transact_stub.Delete(delete_request, timeout=self._get_timeout(timeout))
         except grpc.RpcError as e:
-            logger.error("Failed with error: %s", e)
-            raise types.AVSServerError(rpc_error=e)
+            raise self._handle_rpc_error(e, logger)
+        finally:
+            self._invalidate_cached_record(delete_request.key)
+
+    def delete_many(
+        self,
+        *,
+        namespace: str,
+        keys: Iterable[Union[int, str, bytes, bytearray]],
+        set_name: Optional[str] = None,
+        max_in_flight: int = 64,
+        timeout: Optional[float] = None,
+    ) -> list[tuple[Union[int, str, bytes, bytearray], types.AVSServerError]]:
+        """
+        Delete many records from Aerospike Vector Search.
+
+        Each delete is sent to the node owning its key and up to max_in_flight deletes run concurrently.
+        Keys are consumed lazily, so they can be produced by a generator, and a failed delete does not
+        stop the remaining keys from being deleted.
+
+        Args:
+            namespace (str): The namespace for the records.
+            keys (Iterable[Union[int, str, bytes, bytearray]]): The keys of the records.
+            set_name (Optional[str], optional): The name of the set to which the records belong. Defaults to None.
+            max_in_flight (int, optional): The maximum number of outstanding delete requests. Defaults to 64. Must be at least 1.
+            timeout (Optional[float], optional): Time in seconds to wait for each call before it fails with
+            types.AVSDeadlineExceededError. Defaults to None, which uses the timeout given to the client.
+
+        Returns:
+            list[tuple[Union[int, str, bytes, bytearray], types.AVSServerError]]: (key, error) pairs of the
+            deletes that failed, in input order. Empty if every delete succeeded.
+        """
+        self._validate_max_in_flight(max_in_flight)
+
+        def start_deletes():
+            for (key, transact_stub, delete_request) in self._prepare_delete_many(
+                namespace, keys, set_name, logger
+            ):
+                future = transact_stub.Delete.future(
+                    delete_request, timeout=self._get_timeout(timeout)
+                )
+                if self._record_cache is not None:
+                    future.add_done_callback(
+                        self._invalidate_cached_record_callback(delete_request.key)
+                    )
+                yield (key, future)
+
+        return [
+            (key, error)
+            for (key, (_, error)) in self._pipeline(
+                start_deletes(),
+                max_in_flight,
+                lambda call: (call[0], self._resolve_future(call[1])),
+                lambda call: call[1],
+            )
+            if error is not None
+        ]
 
     def is_indexed(
         self,
@@ -249,6 +694,7 @@ class Client(BaseClient):
         index_name: str,
         index_namespace: Optional[str] = None,
         set_name: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> bool:
         """
         Check if a record is indexed in the Vector DB.
@@ -260,11 +706,14 @@ class Client(BaseClient):
             index_namespace (Optional[str], optional): The namespace of the index.
             If None, defaults to the namespace of the record. Defaults to None.
             set_name (Optional[str], optional): The name of the set to which the record belongs. Defaults to None.
+            timeout (Optional[float], optional): Time in seconds to wait for the call before it fails with
+            types.AVSDeadlineExceededError. Defaults to None, which uses the timeout given to the client.
 
         Returns:
             bool: True if the record is indexed, False otherwise.
 
         Raises:
+            types.AVSDeadlineExceededError: Raised if the server does not respond before the timeout expires.
             grpc.RpcError: Raised if an error occurs during the RPC communication with the server while attempting to create the index.
             This error could occur due to various reasons such as network issues, server-side failures, or invalid request parameters.
         """
@@ -272,12 +721,75 @@ class Client(BaseClient):
             namespace, key, index_name, index_namespace, set_name, logger
         )
         try:
-            response = transact_stub.IsIndexed(is_indexed_request)
+            response = self._call_read(
+                "is_indexed",
+                transact_stub,
+                lambda stub, timeout: stub.IsIndexed.future(
+                    is_indexed_request, timeout=timeout
+                ),
+                self._future_result,
+                timeout,
+            )
         except grpc.RpcError as e:
-            logger.error("Failed with error: %s", e)
-            raise types.AVSServerError(rpc_error=e)
+            raise self._handle_rpc_error(e, logger)
         return self._respond_is_indexed(response)
 
+    def is_indexed_many(
+        self,
+        *,
+        namespace: str,
+        keys: Iterable[Union[int, str, bytes, bytearray]],
+        index_name: str,
+        index_namespace: Optional[str] = None,
+        set_name: Optional[str] = None,
+        max_in_flight: int = 64,
+        progress: Optional[Callable[[int], None]] = None,
+        progress_interval: int = 10000,
+        timeout: Optional[float] = None,
+    ) -> np.ndarray:
+        """
+        Check if many records are indexed in the Vector DB.
+
+        Each check is sent to the node owning its key and up to max_in_flight checks run concurrently.
+        Keys are consumed lazily, so they can be produced by a generator.
+
+        Args:
+            namespace (str): The namespace for the records.
+            keys (Iterable[Union[int, str, bytes, bytearray]]): The keys of the records.
+            index_name (str): The name of the index.
+            index_namespace (Optional[str], optional): The namespace of the index.
+            If None, defaults to the namespace of the records. Defaults to None.
+            set_name (Optional[str], optional): The name of the set to which the records belong. Defaults to None.
+            max_in_flight (int, optional): The maximum number of concurrent checks. Defaults to 64. Must be at least 1.
+            progress (Optional[Callable[[int], None]], optional): Called with the number of keys checked so far
+            every progress_interval keys and once all keys are checked. Defaults to None.
+            progress_interval (int, optional): The number of keys checked between progress calls. Defaults to 10000. Must be at least 1.
+            timeout (Optional[float], optional): Time in seconds to wait for each call before it fails with
+            types.AVSDeadlineExceededError. Defaults to None, which uses the timeout given to the client.
+
+        Returns:
+            numpy.ndarray: A bool array aligned with keys, True where the record is indexed.
+
+        Raises:
+            types.AVSDeadlineExceededError: Raised if the server does not respond before the timeout expires.
+            grpc.RpcError: Raised if an error occurs during the RPC communication with the server while attempting to create the index.
+            This error could occur due to various reasons such as network issues, server-side failures, or invalid request parameters.
+        """
+        self._validate_max_in_flight(max_in_flight)
+        self._validate_progress_interval(progress_interval)
+        return self._check_many(
+            self._prepare_is_indexed_many(
+                namespace, keys, index_name, index_namespace, set_name, logger
+            ),
+            "IsIndexed",
+            self._respond_is_indexed,
+            self._get_key_count(keys),
+            max_in_flight,
+            progress,
+            progress_interval,
+            timeout,
+        )
+
     def vector_search(
         self,
         *,
@@ -287,6 +799,7 @@ class Client(BaseClient):
         limit: int,
         search_params: Optional[types.HnswSearchParams] = None,
         field_names: Optional[list[str]] = None,
+        timeout: Optional[float] = None,
     ) -> list[types.Neighbor]:
         """
         Perform a Hierarchical Navigable Small World (HNSW) vector search in Aerospike Vector Search.
@@ -300,23 +813,167 @@ class Client(BaseClient):
             If None, the default parameters for the index are used. Defaults to None.
             field_names (Optional[list[str]], optional): A list of field names to retrieve from the results.
             If None, all fields are retrieved. Defaults to None.
+            timeout (Optional[float], optional): Time in seconds to wait for the call before it fails with
+            types.AVSDeadlineExceededError. Defaults to None, which uses the timeout given to the client.
 
         Returns:
             list[types.Neighbor]: A list of neighbors records found by the search.
 
         Raises:
+            types.AVSDeadlineExceededError: Raised if the server does not respond before the timeout expires.
             grpc.RpcError: Raised if an error occurs during the RPC communication with the server while attempting to create the index.
             This error could occur due to various reasons such as network issues, server-side failures, or invalid request parameters.
         """
-        (transact_stub, vector_search_request) = self._prepare_vector_search(
-            namespace, index_name, query, limit, search_params, field_names, logger
+        if self._vector_search_cache is None:
+            return self._vector_search(
+                namespace, index_name, query, limit, search_params, field_names, timeout
+            )
+
+        cache_key = self._get_vector_search_cache_key(
+            namespace, index_name, query, limit, search_params, field_names
         )
+        neighbors = self._get_cached_neighbors(cache_key)
+        if neighbors is None:
+            # Read before the search, so a result racing an invalidation is not cached.
+            version = self._vector_search_cache.version()
+            neighbors = self._vector_search(
+                namespace, index_name, query, limit, search_params, field_names, timeout
+            )
+            self._cache_neighbors(
+                cache_key, neighbors, (namespace, index_name), version
+            )
+        return neighbors
 
+    def vector_search_many(
+        self,
+        *,
+        namespace: str,
+        index_name: str,
+        queries: Iterable[list[Union[bool, float]]],
+        limit: int,
+        search_params: Optional[types.HnswSearchParams] = None,
+        field_names: Optional[list[str]] = None,
+        max_in_flight: int = 16,
+        timeout: Optional[float] = None,
+    ) -> list[list[types.Neighbor]]:
+        """
+        Perform many Hierarchical Navigable Small World (HNSW) vector searches in Aerospike Vector Search.
+
+        Searches are started on the channels handed out by the channel provider, which spreads them across the
+        cluster nodes. Up to max_in_flight searches run concurrently and their result streams are drained in query order.
+
+        Args:
+            namespace (str): The namespace for the records.
+            index_name (str): The name of the index.
+            queries (Iterable[list[Union[bool, float]]]): The query vectors for the searches, for example the rows of a
+            two dimensional numpy.ndarray.
+            limit (int): The maximum number of neighbors to return for each query. K value.
+            search_params (Optional[types_pb2.HnswSearchParams], optional): Parameters for the HNSW algorithm.
+            If None, the default parameters for the index are used. Defaults to None.
+            field_names (Optional[list[str]], optional): A list of field names to retrieve from the results.
+            If None, all fields are retrieved. Defaults to None.
+            max_in_flight (int, optional): The maximum number of concurrent searches. Defaults to 16. Must be at least 1.
+            timeout (Optional[float], optional): Time in seconds to wait for each call before it fails with
+            types.AVSDeadlineExceededError. Defaults to None, which uses the timeout given to the client.
+
+        Returns:
+            list[list[types.Neighbor]]: The neighbors found for each query, in query order.
+
+        Raises:
+            types.AVSDeadlineExceededError: Raised if the server does not respond before the timeout expires.
+            grpc.RpcError: Raised if an error occurs during the RPC communication with the server while attempting to create the index.
+            This error could occur due to various reasons such as network issues, server-side failures, or invalid request parameters.
+        """
+        self._validate_max_in_flight(max_in_flight)
+
+        def start_searches():
+            for query in queries:
+                (transact_stub, vector_search_request) = self._prepare_vector_search(
+                    namespace,
+                    index_name,
+                    query,
+                    limit,
+                    search_params,
+                    field_names,
+                    logger,
+                )
+                yield transact_stub.VectorSearch(
+                    vector_search_request, timeout=self._get_timeout(timeout)
+                )
+
+        results = []
+        pipeline = self._pipeline(
+            start_searches(), max_in_flight, self._resolve_vector_search
+        )
         try:
-            return [self._respond_neighbor(result) for result in transact_stub.VectorSearch(vector_search_request)]
+            for neighbors, error in pipeline:
+                if error is not None:
+                    raise error
+                results.append(neighbors)
+        finally:
+            pipeline.close()
+        return results
+
+    def vector_search_arrays(
+        self,
+        *,
+        namespace: str,
+        index_name: str,
+        query: list[Union[bool, float]],
+        limit: int,
+        search_params: Optional[types.HnswSearchParams] = None,
+        vector_field_names: Optional[list[str]] = None,
+        timeout: Optional[float] = None,
+    ) -> types.NeighborArrays:
+        """
+        Perform a Hierarchical Navigable Small World (HNSW) vector search and return the results in columnar form.
+
+        Unlike vector_search, no types.Neighbor objects are created. Keys, distances and the requested vector fields
+        are decoded straight from the streamed results into lists and NumPy arrays.
+
+        Args:
+            namespace (str): The namespace for the records.
+            index_name (str): The name of the index.
+            query (list[Union[bool, float]]): The query vector for the search.
+            limit (int): The maximum number of neighbors to return. K value.
+            search_params (Optional[types_pb2.HnswSearchParams], optional): Parameters for the HNSW algorithm.
+            If None, the default parameters for the index are used. Defaults to None.
+            vector_field_names (Optional[list[str]], optional): Vector fields to return as two dimensional arrays.
+            If None, no record fields are retrieved. Defaults to None.
+            timeout (Optional[float], optional): Time in seconds to wait for the call before it fails with
+            types.AVSDeadlineExceededError. Defaults to None, which uses the timeout given to the client.
+
+        Returns:
+            types.NeighborArrays: The keys, distances and vectors of the neighbors found by the search.
+
+        Raises:
+            types.AVSDeadlineExceededError: Raised if the server does not respond before the timeout expires.
+            grpc.RpcError: Raised if an error occurs during the RPC communication with the server while attempting to create the index.
+            This error could occur due to various reasons such as network issues, server-side failures, or invalid request parameters.
+            Exception: Raised if a vector field in vector_field_names does not have the same number of dimensions in
+            every returned record.
+        """
+        (transact_stub, vector_search_request, neighbor_arrays) = (
+            self._prepare_vector_search_arrays(
+                namespace,
+                index_name,
+                query,
+                limit,
+                search_params,
+                vector_field_names,
+                logger,
+            )
+        )
+
+        try:
+            for result in transact_stub.VectorSearch(
+                vector_search_request, timeout=self._get_timeout(timeout)
+            ):
+                neighbor_arrays.add(result)
         except grpc.RpcError as e:
-            logger.error("Failed with error: %s", e)
-            raise types.AVSServerError(rpc_error=e)
+            raise self._handle_rpc_error(e, logger)
+
+        return neighbor_arrays.build()
 
     def wait_for_index_completion(
         self,
@@ -326,6 +983,8 @@ class Client(BaseClient):
         timeout: Optional[int] = sys.maxsize,
         wait_interval: Optional[int] = 12,
         validation_checks: Optional[int] = 2,
+        min_wait_interval: float = 0.5,
+        progress: Optional[Callable[[types.IndexCompletionProgress], None]] = None,
     ) -> None:
         """
         Wait for the index to have no pending index update operations.
@@ -335,8 +994,14 @@ class Client(BaseClient):
             name (str): The name of the index.
             timeout (int, optional): The maximum time (in seconds) to wait for the index to complete.
             Defaults to sys.maxsize.
-            wait_interval (int, optional): The time (in seconds) to wait between index completion status request to the server.
-            Lowering this value increases the chance that the index completion status is incorrect, which can result in poor search accuracy.
+            wait_interval (int, optional): The maximum time (in seconds) between index completion status requests to the server.
+            Defaults to 12.
+            validation_checks (int, optional): The number of extra status requests that must report no pending index
+            update operations before the index is considered complete. Defaults to 2.
+            min_wait_interval (float, optional): The shortest time (in seconds) between index completion status
+            requests to the server. Defaults to 0.5.
+            progress (Optional[Callable[[types.IndexCompletionProgress], None]], optional): Called with the
+            unmerged record count, merge rate and estimated time left after every status request. Defaults to None.
 
         Raises:
             Exception: Raised when the timeout occurs while waiting for index completion.
@@ -344,38 +1009,352 @@ class Client(BaseClient):
             This error could occur due to various reasons such as network issues, server-side failures, or invalid request parameters.
 
         Note:
-            The function polls the index status with a wait interval of 10 seconds until either
-            the timeout is reached or the index has no pending index update operations.
-        """
-        # Wait interval between polling
-        (
-            index_stub,
-            wait_interval,
-            start_time,
-            unmerged_record_initialized,
-            consecutive_index_validations,
-            index_completion_request,
-        ) = self._prepare_wait_for_index_waiting(namespace, name, wait_interval)
+            Status requests start min_wait_interval apart. While the number of unmerged records drops, the interval
+            follows half of the estimated time left. While it is flat, and while the records confirming completion
+            are read, the interval doubles up to wait_interval. Unavailable servers are retried with backoff.
+        """
+        self.wait_for_indexes_completion(
+            indexes=[(namespace, name)],
+            timeout=timeout,
+            wait_interval=wait_interval,
+            validation_checks=validation_checks,
+            min_wait_interval=min_wait_interval,
+            progress=progress,
+        )
+
+    def wait_for_indexes_completion(
+        self,
+        *,
+        indexes: Iterable[tuple[str, str]],
+        timeout: Optional[int] = sys.maxsize,
+        wait_interval: Optional[int] = 12,
+        validation_checks: Optional[int] = 2,
+        min_wait_interval: float = 0.5,
+        progress: Optional[Callable[[types.IndexCompletionProgress], None]] = None,
+    ) -> None:
+        """
+        Wait for many indexes to have no pending index update operations.
+
+        A single poller requests the status of every index still pending, concurrently, each on its own schedule.
+
+        Args:
+            indexes (Iterable[tuple[str, str]]): (namespace, name) pairs of the indexes.
+            timeout (int, optional): The maximum time (in seconds) to wait for the index to complete.
+            Defaults to sys.maxsize.
+            wait_interval (int, optional): The maximum time (in seconds) between index completion status requests to the server.
+            Defaults to 12.
+            validation_checks (int, optional): The number of extra status requests that must report no pending index
+            update operations before the index is considered complete. Defaults to 2.
+            min_wait_interval (float, optional): The shortest time (in seconds) between index completion status
+            requests to the server. Defaults to 0.5.
+            progress (Optional[Callable[[types.IndexCompletionProgress], None]], optional): Called with the
+            unmerged record count, merge rate and estimated time left after every status request. Defaults to None.
+
+        Raises:
+            Exception: Raised when the timeout occurs while waiting for index completion.
+            grpc.RpcError: Raised if an error occurs during the RPC communication with the server while attempting to create the index.
+            This error could occur due to various reasons such as network issues, server-side failures, or invalid request parameters.
+
+        Note:
+            Status requests start min_wait_interval apart. While the number of unmerged records drops, the interval
+            follows half of the estimated time left. While it is flat, and while the records confirming completion
+            are read, the interval doubles up to wait_interval. Unavailable servers are retried with backoff.
+        """
+        waits = self._prepare_index_completion_waits(
+            indexes, timeout, wait_interval, validation_checks, min_wait_interval
+        )
+        while waits:
+            now = time.monotonic()
+            due = [wait for wait in waits if wait.next_poll <= now]
+            for wait in due:
+                wait.check_timeout()
+
+            index_stub = self._get_index_stub()
+            calls = [
+                (
+                    wait,
+                    index_stub.GetStatus.future(
+                        wait.index_id, timeout=self._get_timeout(None)
+                    ),
+                )
+                for wait in due
+            ]
+            for wait, future in calls:
+                try:
+                    index_status = future.result()
+                except grpc.RpcError as e:
+                    if e.code() == grpc.StatusCode.UNAVAILABLE:
+                        self._on_index_status_unavailable(e, wait, logger)
+                        continue
+                    raise self._handle_rpc_error(e, logger)
+                index_progress = wait.on_status(index_status.unmergedRecordCount)
+                if progress is not None:
+                    progress(index_progress)
+
+            waits = [wait for wait in waits if not wait.done]
+            if waits:
+                next_poll = min(wait.next_poll for wait in waits)
+                time.sleep(max(0, next_poll - time.monotonic()))
+
+    def invalidate_vector_search_cache(
+        self, *, namespace: Optional[str] = None, index_name: Optional[str] = None
+    ) -> None:
+        """
+        Drop cached vector_search results.
+
+        Args:
+            namespace (Optional[str], optional): The namespace of the index. Defaults to None.
+            index_name (Optional[str], optional): The index whose cached searches are dropped.
+            If None, every cached search is dropped. Defaults to None.
+        """
+        self._invalidate_vector_search_cache(namespace, index_name)
+
+    def vector_search_cache_stats(self) -> Optional[types.CacheStats]:
+        """
+        Returns the hit, miss and eviction counters of the vector_search cache, or None if it is disabled.
+        """
+        return self._get_vector_search_cache_stats()
+
+    def record_cache_stats(self) -> Optional[types.CacheStats]:
+        """
+        Returns the hit, miss and eviction counters of the get record cache, or None if it is disabled.
+        """
+        return self._get_record_cache_stats()
+
+    def _vector_search(
+        self, namespace, index_name, query, limit, search_params, field_names, timeout
+    ):
+        if self._phase_timing is not None:
+            return self._timed_vector_search(
+                namespace, index_name, query, limit, search_params, field_names, timeout
+            )
+
+        (transact_stub, vector_search_request) = self._prepare_vector_search(
+            namespace, index_name, query, limit, search_params, field_names, logger
+        )
+        return self._call_vector_search(
+            transact_stub, vector_search_request, self._drain_vector_search, timeout
+        )
+
+    def _timed_vector_search(
+        self, namespace, index_name, query, limit, search_params, field_names, timeout
+    ):
+        start = time.perf_counter_ns()
+        (transact_stub, vector_search_request) = self._prepare_vector_search(
+            namespace, index_name, query, limit, search_params, field_names, logger
+        )
+        prepared = time.perf_counter_ns()
+        (results, first_response, drained) = self._call_vector_search(
+            transact_stub, vector_search_request, self._collect_vector_search, timeout
+        )
+        neighbors = [self._respond_neighbor(result) for result in results]
+        self._report_phase_timing(
+            "vector_search",
+            start,
+            prepared,
+            first_response,
+            drained,
+            time.perf_counter_ns(),
+            len(results),
+        )
+        return neighbors
+
+    def _call_vector_search(
+        self, transact_stub, vector_search_request, finish, timeout
+    ):
+        try:
+            return self._call_read(
+                "vector_search",
+                transact_stub,
+                lambda stub, timeout: stub.VectorSearch(
+                    vector_search_request, timeout=timeout
+                ),
+                finish,
+                timeout,
+                hedge=True,
+            )
+        except grpc.RpcError as e:
+            raise self._handle_rpc_error(e, logger)
+
+    def _call_read(self, operation, transact_stub, start, finish, timeout, hedge=False):
+        # Runs an idempotent read under the retry policy, sending each retry
+        # to a node that was not tried yet.
+        # start(stub, timeout) starts one attempt and finish(call) waits for its result.
+        deadline = self._get_deadline(timeout)
+        tried = []
+        attempt = 1
         while True:
             try:
-                index_status = index_stub.GetStatus(index_completion_request)
-
+                if hedge and self._hedge_policy is not None:
+                    return self._hedged_read(
+                        operation, transact_stub, start, finish, deadline, tried
+                    )
+                return finish(start(transact_stub, self._get_remaining(deadline)))
             except grpc.RpcError as e:
-                if e.code() == grpc.StatusCode.UNAVAILABLE:
-                    continue
-                else:
-                    logger.error("Failed with error: %s", e)
-                    raise types.AVSServerError(rpc_error=e)
-            if self._check_completion_condition(
-                start_time, timeout, index_status, unmerged_record_initialized
+                backoff = self._get_retry_backoff(attempt, e, deadline)
+                if backoff is None:
+                    raise
+                logger.debug("Retrying %s after error: %s", operation, e)
+                self._channel_provider.on_rpc_error(e)
+                tried.append(self._channel_provider.node_of_stub(transact_stub))
+                time.sleep(backoff)
+                transact_stub = self._channel_provider.get_stub(
+                    type(transact_stub), exclude=tried
+                )
+                attempt += 1
+
+    def _hedged_read(self, operation, transact_stub, start, finish, deadline, tried):
+        tracker = self._latency_trackers[operation]
+        delay = self._get_hedge_delay(operation)
+        start_time = time.perf_counter()
+        first_call = start(transact_stub, self._get_remaining(deadline))
+        if delay is None:
+            result = finish(first_call)
+            tracker.add(time.perf_counter() - start_time)
+            return result
+
+        # Attempts are finished on executor threads so the first result can be
+        # taken from whichever attempt completes first.
+        executor = self._get_hedge_executor()
+        calls = {executor.submit(finish, first_call): first_call}
+        try:
+            (done, _) = concurrent.futures.wait(calls, timeout=delay)
+            if not done:
+                first_node = self._channel_provider.node_of_stub(transact_stub)
+                hedge_stub = self._channel_provider.get_stub(
+                    type(transact_stub), exclude=tried + [first_node]
+                )
+                hedge_call = start(hedge_stub, self._get_remaining(deadline))
+                calls[executor.submit(finish, hedge_call)] = hedge_call
+
+            error = None
+            for future in concurrent.futures.as_completed(calls):
+                if future.exception() is None:
+                    tracker.add(time.perf_counter() - start_time)
+                    return future.result()
+                if error is None:
+                    error = future.exception()
+            raise error
+        finally:
+            # Cancel the attempt that lost the race.
+            for call in calls.values():
+                call.cancel()
+
+    def _get_hedge_executor(self):
+        if self._hedge_executor is None:
+            self._hedge_executor = concurrent.futures.ThreadPoolExecutor(
+                thread_name_prefix="avs-hedge"
+            )
+        return self._hedge_executor
+
+    def _future_result(self, future):
+        return future.result()
+
+    def _drain_vector_search(self, results):
+        return [self._respond_neighbor(result) for result in results]
+
+    def _collect_vector_search(self, results):
+        # Reads the stream without decoding it, so decoding is timed on its own.
+        first_response = None
+        collected = []
+        for result in results:
+            if first_response is None:
+                first_response = time.perf_counter_ns()
+            collected.append(result)
+        return (collected, first_response, time.perf_counter_ns())
+
+    def _put_many(
+        self, namespace, records, set_name, prepare_put, max_in_flight, timeout
+    ):
+        def start_puts():
+            for key, record_data in records:
+                (transact_stub, put_request) = prepare_put(
+                    namespace, key, record_data, set_name, logger
+                )
+                future = transact_stub.Put.future(
+                    put_request, timeout=self._get_timeout(timeout)
+                )
+                if self._record_cache is not None:
+                    future.add_done_callback(
+                        self._invalidate_cached_record_callback(put_request.key)
+                    )
+                yield future
+
+        return [
+            error
+            for (_, error) in self._pipeline(
+                start_puts(), max_in_flight, self._resolve_future
+            )
+        ]
+
+    def _invalidate_cached_record_callback(self, key):
+        return lambda _: self._invalidate_cached_record(key)
+
+    def _check_many(
+        self,
+        requests,
+        method,
+        respond,
+        count,
+        max_in_flight,
+        progress,
+        progress_interval,
+        timeout,
+    ):
+        # Pipelines the unary method for every (stub, request) pair and packs
+        # the responses into a bool array, reporting progress along the way.
+        def start_checks():
+            for (transact_stub, request) in requests:
+                yield getattr(transact_stub, method).future(
+                    request, timeout=self._get_timeout(timeout)
+                )
+
+        def results():
+            done = 0
+            for response, error in self._pipeline(
+                start_checks(), max_in_flight, self._resolve_future
             ):
-                if consecutive_index_validations == validation_checks:
-                    return
-                else:
-                    consecutive_index_validations += 1
-            else:
-                consecutive_index_validations = 0
-            time.sleep(wait_interval)
+                if error is not None:
+                    raise error
+                done += 1
+                if progress is not None and done % progress_interval == 0:
+                    progress(done)
+                yield respond(response)
+
+            if progress is not None and done % progress_interval != 0:
+                progress(done)
+
+        return np.fromiter(results(), dtype=bool, count=count)
+
+    def _pipeline(self, calls, max_in_flight, resolve, future_of=None):
+        # Keeps at most max_in_flight started RPCs outstanding and yields
+        # their resolved (response, error) pairs in the order they were started.
+        # Calls still outstanding when the consumer stops early, for example
+        # because one of them failed, are cancelled. future_of returns the
+        # gRPC future of a call, for callers that queue it with other state.
+        in_flight = collections.deque()
+        try:
+            for call in calls:
+                in_flight.append(call)
+                if len(in_flight) >= max_in_flight:
+                    yield resolve(in_flight.popleft())
+            while in_flight:
+                yield resolve(in_flight.popleft())
+        finally:
+            for call in in_flight:
+                (call if future_of is None else future_of(call)).cancel()
+
+    def _resolve_future(self, future):
+        try:
+            return (future.result(), None)
+        except grpc.RpcError as e:
+            return (None, self._handle_rpc_error(e, logger))
+
+    def _resolve_vector_search(self, results):
+        try:
+            return ([self._respond_neighbor(result) for result in results], None)
+        except grpc.RpcError as e:
+            return (None, self._handle_rpc_error(e, logger))
 
     def close(self):
         """
@@ -386,6 +1365,8 @@ class Client(BaseClient):
         Note:
             This method should be called when the VectorDbAdminClient is no longer needed to release resources.
         """
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False)
         self._channel_provider.close()
 
     def __enter__(self):
@@ -0,0 +1,283 @@
+import json
+import logging
+import os
+from typing import Any, Callable, Iterator, Optional, Union
+
+import numpy as np
+
+from . import types
+
+logger = logging.getLogger(__name__)
+
+# Element type of the vector files laid out as [int32 dimensions, vector] records.
+VECS_DTYPES = {
+    ".fvecs": np.float32,
+    ".ivecs": np.int32,
+    ".bvecs": np.uint8,
+}
+
+PARQUET_SUFFIXES = (".parquet", ".pq")
+
+
+def open_vectors(path: str) -> np.ndarray:
+    """
+    Memory-map a vector file as a read-only two dimensional array.
+
+    Nothing is read up front. Rows are paged in by the operating system when they are accessed,
+    and slices of the returned array are views of the mapping.
+
+    Args:
+        path (str): Path of a .fvecs, .ivecs, .bvecs or .npy file.
+
+    Returns:
+        numpy.ndarray: An array of shape (vector count, dimensions).
+
+    Raises:
+        Exception: Raised if the file type is not supported or the file is malformed.
+    """
+    suffix = os.path.splitext(path)[1].lower()
+    if suffix == ".npy":
+        vectors = np.load(path, mmap_mode="r")
+        if vectors.ndim != 2:
+            raise Exception(
+                "Expected a two dimensional array in %s, got shape %s"
+                % (path, vectors.shape)
+            )
+        return vectors
+
+    dtype = VECS_DTYPES.get(suffix)
+    if dtype is None:
+        raise Exception("Unsupported vector file type: " + path)
+
+    if os.path.getsize(path) == 0:
+        return np.empty((0, 0), dtype=dtype)
+
+    raw = np.memmap(path, dtype=np.uint8, mode="r")
+    dimensions = int(raw[:4].view("<i4")[0])
+    record_size = 4 + dimensions * np.dtype(dtype).itemsize
+    if dimensions <= 0 or raw.size % record_size != 0:
+        raise Exception("Malformed vector file: " + path)
+
+    records = raw.reshape(-1, record_size)
+    if np.any(records[:, :4].view("<i4") != dimensions):
+        raise Exception("Malformed vector file, dimensions differ: " + path)
+    # Strided view skipping the dimensions header of every record.
+    return records[:, 4:].view(np.dtype(dtype).newbyteorder("<"))
+
+
+def iter_vector_chunks(
+    path: str,
+    chunk_size: int = 1000,
+    *,
+    start: int = 0,
+    column: Optional[str] = None,
+) -> Iterator[tuple[int, np.ndarray]]:
+    """
+    Stream the vectors of a file in fixed-size chunks.
+
+    Chunks of .fvecs, .ivecs, .bvecs and .npy files are views of a memory mapping, so no vector is copied.
+    Parquet files need the optional pyarrow package, and their chunks are views of the decoded
+    record batches.
+
+    Args:
+        path (str): Path of a .fvecs, .ivecs, .bvecs, .npy or .parquet file.
+        chunk_size (int, optional): The number of vectors per chunk. Defaults to 1000.
+        start (int, optional): Index of the first vector to stream. Defaults to 0.
+        column (Optional[str], optional): The Parquet column holding the vectors.
+        If None, the first column is used. Defaults to None.
+
+    Returns:
+        Iterator[tuple[int, numpy.ndarray]]: (index of the first vector, vectors) pairs.
+
+    Raises:
+        Exception: Raised if the file type is not supported or the file is malformed.
+        ImportError: Raised if a Parquet file is given and pyarrow is not installed.
+    """
+    if chunk_size < 1:
+        raise Exception("chunk_size must be at least 1")
+
+    if path.lower().endswith(PARQUET_SUFFIXES):
+        yield from _iter_parquet_chunks(path, chunk_size, start, column)
+        return
+
+    vectors = open_vectors(path)
+    for offset in range(start, len(vectors), chunk_size):
+        yield (offset, vectors[offset : offset + chunk_size])
+
+
+def count_vectors(path: str) -> int:
+    """
+    Return the number of vectors in a file without reading them.
+
+    Args:
+        path (str): Path of a .fvecs, .ivecs, .bvecs, .npy or .parquet file.
+
+    Returns:
+        int: The number of vectors.
+    """
+    if path.lower().endswith(PARQUET_SUFFIXES):
+        return _open_parquet(path).metadata.num_rows
+    return len(open_vectors(path))
+
+
+def ingest(
+    client,
+    *,
+    namespace: str,
+    path: str,
+    vector_field: str,
+    set_name: Optional[str] = None,
+    key_function: Optional[Callable[[int], Union[int, str, bytes, bytearray]]] = None,
+    column: Optional[str] = None,
+    chunk_size: int = 1000,
+    max_in_flight: int = 64,
+    progress: Optional[Callable[[int, int], None]] = None,
+    checkpoint_path: Optional[str] = None,
+    timeout: Optional[float] = None,
+) -> int:
+    """
+    Upsert every vector of a file into Aerospike Vector Search.
+
+    The file is streamed in chunks with iter_vector_chunks. The records of a chunk are upserted with
+    Client.upsert_many, which keeps at most max_in_flight requests outstanding, and the next chunk is
+    only read once the current one is written, so memory use does not grow with the file size.
+
+    When checkpoint_path is given, the index of the next vector to write is saved there after each chunk,
+    and a later call with the same checkpoint_path resumes from it.
+
+    Args:
+        client (Client): The client used to write the records.
+        namespace (str): The namespace for the records.
+        path (str): Path of a .fvecs, .bvecs, .npy or .parquet file.
+        vector_field (str): The record field the vectors are written to.
+        set_name (Optional[str], optional): The name of the set to which the records belong. Defaults to None.
+        key_function (Optional[Callable[[int], Union[int, str, bytes, bytearray]]], optional): Maps the index
+        of a vector in the file to its record key. If None, the index is the key. Defaults to None.
+        column (Optional[str], optional): The Parquet column holding the vectors.
+        If None, the first column is used. Defaults to None.
+        chunk_size (int, optional): The number of vectors read and written at a time. Defaults to 1000.
+        max_in_flight (int, optional): The maximum number of outstanding put requests. Defaults to 64.
+        progress (Optional[Callable[[int, int], None]], optional): Called with the number of vectors written
+        so far and the total number of vectors after each chunk. Defaults to None.
+        checkpoint_path (Optional[str], optional): File recording the progress of the ingest. Defaults to None.
+        timeout (Optional[float], optional): Time in seconds to wait for each call before it fails with
+        types.AVSDeadlineExceededError. Defaults to None, which uses the timeout given to the client.
+
+    Returns:
+        int: The number of vectors written by this call.
+
+    Raises:
+        types.AVSServerError: Raised with the first failed put of a chunk. The checkpoint is left at the
+        start of that chunk, so the ingest can be resumed.
+        Exception: Raised if an .ivecs file is given. Its integer elements, usually neighbor ids, are not vectors.
+    """
+    _check_ingest_path(path)
+    start = _read_checkpoint(checkpoint_path, path)
+    total = count_vectors(path)
+    written = 0
+    for offset, chunk in iter_vector_chunks(
+        path, chunk_size, start=start, column=column
+    ):
+        errors = client.upsert_many(
+            namespace=namespace,
+            records=_chunk_records(chunk, offset, vector_field, key_function),
+            set_name=set_name,
+            max_in_flight=max_in_flight,
+            timeout=timeout,
+        )
+        _check_chunk(errors, offset)
+
+        written += len(chunk)
+        _write_checkpoint(checkpoint_path, path, offset + len(chunk))
+        if progress is not None:
+            progress(offset + len(chunk), total)
+    return written
+
+
+def _check_ingest_path(path: str) -> None:
+    if path.lower().endswith(".ivecs"):
+        raise Exception("Ingesting .ivecs files is not supported: " + path)
+
+
+def _chunk_records(chunk, offset, vector_field, key_function):
+    # Float and bool rows are passed on as views of the chunk, the client
+    # reads their elements while building each request. The uint8 rows of
+    # .bvecs files are widened to float32 so they are written as vectors.
+    if chunk.dtype == np.uint8:
+        chunk = chunk.astype(np.float32)
+    for i, vector in enumerate(chunk):
+        index = offset + i
+        key = index if key_function is None else key_function(index)
+        yield (key, {vector_field: vector})
+
+
+def _check_chunk(errors: list[Optional[types.AVSServerError]], offset: int) -> None:
+    failed = [error for error in errors if error is not None]
+    if failed:
+        logger.error(
+            "%d puts failed in the chunk starting at vector %d", len(failed), offset
+        )
+        raise failed[0]
+
+
+def _read_checkpoint(checkpoint_path: Optional[str], path: str) -> int:
+    if checkpoint_path is None or not os.path.exists(checkpoint_path):
+        return 0
+    with open(checkpoint_path) as file:
+        checkpoint = json.load(file)
+    if checkpoint["path"] != os.path.abspath(path):
+        raise Exception(
+            "Checkpoint %s was written for %s" % (checkpoint_path, checkpoint["path"])
+        )
+    logger.debug("Resuming ingest of %s at vector %d", path, checkpoint["offset"])
+    return checkpoint["offset"]
+
+
+def _write_checkpoint(checkpoint_path: Optional[str], path: str, offset: int) -> None:
+    if checkpoint_path is None:
+        return
+    # Replace the checkpoint atomically so a crash never leaves a partial file.
+    temp_path = checkpoint_path + ".tmp"
+    with open(temp_path, "w") as file:
+        json.dump({"path": os.path.abspath(path), "offset": offset}, file)
+    os.replace(temp_path, checkpoint_path)
+
+
+def _open_parquet(path: str) -> Any:
+    try:
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError("Reading Parquet files requires pyarrow") from e
+    return pyarrow.parquet.ParquetFile(path, memory_map=True)
+
+
+def _iter_parquet_chunks(path, chunk_size, start, column):
+    parquet_file = _open_parquet(path)
+    if column is None:
+        column = parquet_file.schema_arrow.names[0]
+
+    # Skip the row groups before start without decoding them.
+    row_groups = []
+    offset = 0
+    for i in range(parquet_file.num_row_groups):
+        num_rows = parquet_file.metadata.row_group(i).num_rows
+        if offset + num_rows <= start and not row_groups:
+            offset += num_rows
+            continue
+        row_groups.append(i)
+    if not row_groups:
+        return
+
+    for batch in parquet_file.iter_batches(
+        batch_size=chunk_size, row_groups=row_groups, columns=[column]
+    ):
+        vectors = batch.column(0)
+        if offset < start:
+            skipped = min(start - offset, len(vectors))
+            vectors = vectors.slice(skipped)
+            offset += skipped
+        if len(vectors) == 0:
+            continue
+        values = vectors.flatten().to_numpy(zero_copy_only=False)
+        yield (offset, values.reshape(len(vectors), -1))
+        offset += len(vectors)
@@ -2,15 +2,18 @@ import re
 import time
 import logging
 import threading
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
 import google.protobuf.empty_pb2
 import grpc
 
+from .. import metrics
 from .. import types
 from ..shared.proto_generated import vector_db_pb2
 from ..shared.proto_generated import vector_db_pb2_grpc
 from ..shared import base_channel_provider
+from ..shared import load_balancing
+from ..shared import metrics_interceptors
 
 empty = google.protobuf.empty_pb2.Empty()
 
@@ -25,39 +28,88 @@ class ChannelProvider(base_channel_provider.BaseChannelProvider):
         seeds: tuple[types.HostPort, ...],
         listener_name: Optional[str] = None,
         is_loadbalancer: Optional[bool] = False,
+        tend_interval: Optional[float] = 1,
+        load_balancing_policy: Optional[
+            types.LoadBalancingPolicy
+        ] = types.LoadBalancingPolicy.RANDOM,
+        connections_per_node: Optional[int] = 1,
+        channel_options: Optional[types.ChannelOptions] = None,
+        metrics: Optional[metrics.ClientMetrics] = None,
+        interceptors: Optional[list] = None,
     ) -> None:
-        super().__init__(seeds, listener_name, is_loadbalancer)
-        self._tend_ended = threading.Event()
-        self._timer = None
-        self._tend()
+        super().__init__(
+            seeds,
+            listener_name,
+            is_loadbalancer,
+            tend_interval,
+            load_balancing_policy,
+            connections_per_node,
+            channel_options,
+            metrics,
+            interceptors,
+        )
+        # Guards _closed and _tend_requested, and wakes the tend thread up.
+        self._tend_condition = threading.Condition()
+        self._tend_requested = False
+        self._tend_thread: Optional[threading.Thread] = None
+
+        # The first tend runs inline so nodes are known before the first request.
+        if self._tend():
+            self._tend_thread = threading.Thread(
+                target=self._tend_loop, name="avs-tend", daemon=True
+            )
+            self._tend_thread.start()
 
     def close(self):
-        self._closed = True
-        self._tend_ended.wait()
+        with self._tend_condition:
+            self._closed = True
+            self._tend_condition.notify()
+
+        if self._tend_thread is not None:
+            self._tend_thread.join()
 
         for channel in self._seedChannels:
             channel.close()
 
         for k, channelEndpoints in self._node_channels.items():
-            if channelEndpoints.channel:
-                channelEndpoints.channel.close()
-
-        if self._timer != None:
-            self._timer.join()
-
-    def _tend(self):
+            for channel in channelEndpoints.channels:
+                if channel:
+                    channel.close()
+
+    def request_tend(self):
+        if self.should_request_tend():
+            with self._tend_condition:
+                self._tend_requested = True
+                self._tend_condition.notify()
+
+    def _tend_loop(self):
+        while True:
+            with self._tend_condition:
+                self._tend_condition.wait_for(
+                    lambda: self._closed or self._tend_requested, self._tend_delay
+                )
+                self._tend_requested = False
+            if not self._tend():
+                return
+
+    def _tend(self) -> bool:
+        """
+        Runs one tend pass. Returns False once tending should stop.
+        """
         (temp_endpoints, update_endpoints_stub, channels, end_tend) = self.init_tend()
 
         if end_tend:
-            self._tend_ended.set()
-
-            return
-        for channel in channels:
+            return False
 
-            stub = vector_db_pb2_grpc.ClusterInfoStub(channel)
+        # Probe all seeds and nodes concurrently.
+        stubs = [vector_db_pb2_grpc.ClusterInfoStub(channel) for channel in channels]
+        cluster_id_futures = [stub.GetClusterId.future(empty) for stub in stubs]
+        cluster_reachable = False
 
+        for stub, cluster_id_future in zip(stubs, cluster_id_futures):
             try:
-                new_cluster_id = stub.GetClusterId(empty).id
+                new_cluster_id = cluster_id_future.result().id
+                cluster_reachable = True
                 if self.check_cluster_id(new_cluster_id):
                     update_endpoints_stub = stub
                     break
@@ -71,7 +123,7 @@ class ChannelProvider(base_channel_provider.BaseChannelProvider):
 
         if update_endpoints_stub:
             try:
-                response = stub.GetClusterEndpoints(
+                response = update_endpoints_stub.GetClusterEndpoints(
                     vector_db_pb2.ClusterNodeEndpointsRequest(
                         listenerName=self.listener_name
                     )
@@ -83,6 +135,16 @@ class ChannelProvider(base_channel_provider.BaseChannelProvider):
                     + str(e)
                 )
 
+            try:
+                response = update_endpoints_stub.GetOwnedPartitions(empty)
+                self.update_partition_owners(response)
+            except Exception as e:
+                # Requests are routed to random nodes until the map is known.
+                self._partition_owners = None
+                logger.debug(
+                    "While tending, failed to get owned partitions with error:" + str(e)
+                )
+
             for node, newEndpoints in temp_endpoints.items():
                 (channel_endpoints, add_new_channel) = self.check_for_new_endpoints(
                     node, newEndpoints
@@ -91,7 +153,9 @@ class ChannelProvider(base_channel_provider.BaseChannelProvider):
                 if add_new_channel:
                     try:
                         # TODO: Wait for all calls to drain
-                        channel_endpoints.channel.close()
+                        for channel in channel_endpoints.channels:
+                            if channel:
+                                channel.close()
                     except Exception as e:
                         logger.debug(
                             "While tending, failed to close GRPC channel:" + str(e)
@@ -100,20 +164,48 @@ class ChannelProvider(base_channel_provider.BaseChannelProvider):
                     self.add_new_channel_to_node_channels(node, newEndpoints)
 
             for node, channel_endpoints in list(self._node_channels.items()):
-                if not self._node_channels.get(node):
+                if temp_endpoints and node not in temp_endpoints:
                     try:
                         # TODO: Wait for all calls to drain
-                        channel_endpoints.channel.close()
+                        for channel in channel_endpoints.channels:
+                            if channel:
+                                channel.close()
                         del self._node_channels[node]
 
                     except Exception as e:
                         logger.debug(
                             "While tending, failed to close GRPC channel:" + str(e)
                         )
-        # TODO: check tend interval.
-        self._timer = threading.Timer(1, self._tend).start()
+        self.next_tend_delay(cluster_reachable)
+        return True
 
-    def _create_channel(self, host: str, port: int, is_tls: bool) -> grpc.Channel:
+    def _create_channel(
+        self,
+        host: str,
+        port: int,
+        is_tls: bool,
+        interceptors: Optional[list] = None,
+        options: Optional[list[tuple[str, Any]]] = None,
+    ) -> grpc.Channel:
         # TODO: Take care of TLS
         host = re.sub(r"%.*", "", host)
-        return grpc.insecure_channel(f"{host}:{port}")
+        # Outermost, so user interceptors see every call as the client made it.
+        interceptors = self._interceptors + list(interceptors or [])
+        channel = grpc.insecure_channel(
+            f"{host}:{port}",
+            options=self._get_channel_options(options),
+            compression=grpc.Compression.Gzip if self._compression else None,
+        )
+        if self._metrics is not None:
+            # Innermost, so only the time spent in gRPC is measured.
+            interceptors = list(interceptors or []) + [
+                metrics_interceptors.MetricsInterceptor(self._metrics, f"{host}:{port}")
+            ]
+        if interceptors:
+            channel = grpc.intercept_channel(channel, *interceptors)
+        return channel
+
+    def _create_node_stats_interceptors(
+        self, stats: load_balancing.NodeStats
+    ) -> list[grpc.UnaryUnaryClientInterceptor]:
+        return [load_balancing.NodeStatsInterceptor(stats)]
@@ -0,0 +1,287 @@
+import abc
+import math
+import threading
+from typing import Callable, Optional
+
+import grpc
+
+# Every power of two of the recorded values is split into 2**(SUB_BUCKET_BITS - 1) linear
+# sub-buckets, so bucket bounds are within 1 / 2**(SUB_BUCKET_BITS - 1) of the recorded values.
+SUB_BUCKET_BITS = 7
+_SUB_BUCKET_HALF = 1 << (SUB_BUCKET_BITS - 1)
+
+# Quantiles exported for each latency histogram.
+EXPORTED_QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+
+class LatencyHistogram(object):
+    """
+    Log-linear latency histogram in the style of HdrHistogram.
+
+    Latencies are kept in microseconds with about two significant digits of precision, so memory use does
+    not grow with the number of recorded values and percentiles are read without sorting samples.
+    """
+
+    def __init__(self) -> None:
+        self._buckets: dict[int, int] = {}
+        self.count = 0
+        self.sum = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def record(self, latency: float) -> None:
+        """
+        Record a latency, in seconds.
+        """
+        index = _bucket_index(max(0, int(latency * 1_000_000)))
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+        self.count += 1
+        self.sum += latency
+        if self.min is None or latency < self.min:
+            self.min = latency
+        if self.max is None or latency > self.max:
+            self.max = latency
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """
+        Returns the latency, in seconds, below which percentile percent of the recorded latencies fall,
+        or None if nothing was recorded.
+        """
+        if self.count == 0:
+            return None
+        rank = max(1, math.ceil(self.count * percentile / 100))
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= rank:
+                # Report the middle of the bucket, clamped to the recorded range.
+                lower, upper = _bucket_bounds(index)
+                latency = (lower + upper) / 2 / 1_000_000
+                return min(max(latency, self.min), self.max)
+        return self.max
+
+    def _copy(self) -> "LatencyHistogram":
+        histogram = LatencyHistogram()
+        histogram._buckets = dict(self._buckets)
+        histogram.count = self.count
+        histogram.sum = self.sum
+        histogram.min = self.min
+        histogram.max = self.max
+        return histogram
+
+
+def _bucket_index(value: int) -> int:
+    shift = max(0, value.bit_length() - SUB_BUCKET_BITS)
+    return shift * _SUB_BUCKET_HALF + (value >> shift)
+
+
+def _bucket_bounds(index: int) -> tuple[int, int]:
+    shift = max(0, index // _SUB_BUCKET_HALF - 1)
+    mantissa = index - shift * _SUB_BUCKET_HALF
+    return (mantissa << shift, (mantissa + 1) << shift)
+
+
+class RpcMetrics(object):
+    """
+    Metrics of one RPC method sent to one node.
+
+    Attributes:
+        method (str): The full name of the RPC method, such as "aerospike.vector.Transact/Get".
+        node (str): The host:port the channel of the call is connected to.
+        latency (LatencyHistogram): Latencies of the completed calls, from the call start to its status.
+        errors (dict[str, int]): Number of failed calls by gRPC status code name.
+        in_flight (int): Number of calls started and not completed yet.
+        sent_bytes (int): Serialized size of the request messages.
+        received_bytes (int): Serialized size of the response messages.
+    """
+
+    def __init__(self, method: str, node: str) -> None:
+        self.method = method
+        self.node = node
+        self.latency = LatencyHistogram()
+        self.errors: dict[str, int] = {}
+        self.in_flight = 0
+        self.sent_bytes = 0
+        self.received_bytes = 0
+        self._lock = threading.Lock()
+
+    def _begin(self, sent_bytes: int) -> None:
+        with self._lock:
+            self.in_flight += 1
+            self.sent_bytes += sent_bytes
+
+    def _end(
+        self, latency: float, code: grpc.StatusCode, received_bytes: int = 0
+    ) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self.latency.record(latency)
+            self.received_bytes += received_bytes
+            if code != grpc.StatusCode.OK:
+                self.errors[code.name] = self.errors.get(code.name, 0) + 1
+
+    def _add_received(self, received_bytes: int) -> None:
+        with self._lock:
+            self.received_bytes += received_bytes
+
+    def _copy(self) -> "RpcMetrics":
+        with self._lock:
+            rpc_metrics = RpcMetrics(self.method, self.node)
+            rpc_metrics.latency = self.latency._copy()
+            rpc_metrics.errors = dict(self.errors)
+            rpc_metrics.in_flight = self.in_flight
+            rpc_metrics.sent_bytes = self.sent_bytes
+            rpc_metrics.received_bytes = self.received_bytes
+        return rpc_metrics
+
+
+class MetricsSink(abc.ABC):
+    """
+    Destination of exported client metrics. Subclasses implement export.
+    """
+
+    @abc.abstractmethod
+    def export(self, snapshot: list[RpcMetrics]) -> None:
+        """
+        Export a snapshot of the metrics of every method and node.
+        """
+
+
+class PrometheusTextSink(MetricsSink):
+    """
+    Writes client metrics in the Prometheus text exposition format.
+
+    Args:
+        write (Callable[[str], None]): Called with the formatted metrics, for example a file's write method.
+        prefix (str, optional): Prefix of the metric names. Defaults to "avs_client".
+    """
+
+    def __init__(
+        self, write: Callable[[str], None], prefix: str = "avs_client"
+    ) -> None:
+        self._write = write
+        self._prefix = prefix
+
+    def export(self, snapshot: list[RpcMetrics]) -> None:
+        self._write(_to_prometheus_text(snapshot, self._prefix))
+
+
+class ClientMetrics(object):
+    """
+    Collects per RPC method and per node metrics of the channels of the clients it is given to.
+
+    Pass the same instance to Client and AdminClient, sync or asyncio, to aggregate their calls.
+    Collecting metrics adds an interceptor to every channel, no metrics are kept by clients without one.
+    """
+
+    def __init__(self) -> None:
+        self._rpc_metrics: dict[tuple[str, str], RpcMetrics] = {}
+        self._lock = threading.Lock()
+
+    def snapshot(self) -> list[RpcMetrics]:
+        """
+        Returns a consistent copy of the metrics of every method and node called so far.
+        """
+        with self._lock:
+            rpc_metrics = list(self._rpc_metrics.values())
+        return [metrics._copy() for metrics in rpc_metrics]
+
+    def export(self, sink: MetricsSink) -> None:
+        """
+        Export a snapshot of the metrics to sink.
+        """
+        sink.export(self.snapshot())
+
+    def prometheus_text(self, prefix: str = "avs_client") -> str:
+        """
+        Returns a snapshot of the metrics in the Prometheus text exposition format.
+
+        Latency histograms are exported as summaries with the quantiles in EXPORTED_QUANTILES.
+        """
+        return _to_prometheus_text(self.snapshot(), prefix)
+
+    def reset(self) -> None:
+        """
+        Drop every collected metric.
+        """
+        with self._lock:
+            self._rpc_metrics = {}
+
+    def _get_rpc_metrics(self, method: str, node: str) -> RpcMetrics:
+        key = (method, node)
+        rpc_metrics = self._rpc_metrics.get(key)
+        if rpc_metrics is None:
+            with self._lock:
+                rpc_metrics = self._rpc_metrics.setdefault(
+                    key, RpcMetrics(method, node)
+                )
+        return rpc_metrics
+
+
+def _to_prometheus_text(snapshot: list[RpcMetrics], prefix: str) -> str:
+    latency_lines = []
+    error_lines = []
+    in_flight_lines = []
+    sent_lines = []
+    received_lines = []
+    for rpc_metrics in snapshot:
+        labels = 'method="%s",node="%s"' % (
+            _escape_label(rpc_metrics.method),
+            _escape_label(rpc_metrics.node),
+        )
+        for quantile in EXPORTED_QUANTILES:
+            latency = rpc_metrics.latency.percentile(quantile * 100)
+            latency_lines.append(
+                '%s_rpc_latency_seconds{%s,quantile="%s"} %s'
+                % (prefix, labels, quantile, _format_value(latency))
+            )
+        latency_lines.append(
+            "%s_rpc_latency_seconds_sum{%s} %s"
+            % (prefix, labels, _format_value(rpc_metrics.latency.sum))
+        )
+        latency_lines.append(
+            "%s_rpc_latency_seconds_count{%s} %d"
+            % (prefix, labels, rpc_metrics.latency.count)
+        )
+        for code, count in sorted(rpc_metrics.errors.items()):
+            error_lines.append(
+                '%s_rpc_errors_total{%s,code="%s"} %d' % (prefix, labels, code, count)
+            )
+        in_flight_lines.append(
+            "%s_rpc_in_flight{%s} %d" % (prefix, labels, rpc_metrics.in_flight)
+        )
+        sent_lines.append(
+            "%s_rpc_sent_bytes_total{%s} %d" % (prefix, labels, rpc_metrics.sent_bytes)
+        )
+        received_lines.append(
+            "%s_rpc_received_bytes_total{%s} %d"
+            % (prefix, labels, rpc_metrics.received_bytes)
+        )
+
+    lines = []
+    for name, metric_type, help_text, metric_lines in (
+        ("rpc_latency_seconds", "summary", "Latency of completed RPCs.", latency_lines),
+        ("rpc_errors_total", "counter", "RPCs failed, by status code.", error_lines),
+        ("rpc_in_flight", "gauge", "RPCs started and not completed.", in_flight_lines),
+        ("rpc_sent_bytes_total", "counter", "Serialized request bytes.", sent_lines),
+        (
+            "rpc_received_bytes_total",
+            "counter",
+            "Serialized response bytes.",
+            received_lines,
+        ),
+    ):
+        lines.append("# HELP %s_%s %s" % (prefix, name, help_text))
+        lines.append("# TYPE %s_%s %s" % (prefix, name, metric_type))
+        lines.extend(metric_lines)
+    return "\n".join(lines) + "\n"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: Optional[float]) -> str:
+    if value is None:
+        return "NaN"
+    return repr(float(value))
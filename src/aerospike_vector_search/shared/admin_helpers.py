@@ -151,11 +151,14 @@ class BaseClient(object):
         return response.unmergedRecordCount
 
     def _get_index_stub(self):
-        return index_pb2_grpc.IndexServiceStub(self._channel_provider.get_channel())
+        return self._channel_provider.get_stub(index_pb2_grpc.IndexServiceStub)
 
     def _get_index_id(self, namespace, name):
         return types_pb2.IndexId(namespace=namespace, name=name)
 
+    def _handle_rpc_error(self, e, logger):
+        return helpers._handle_rpc_error(self, e, logger)
+
     def _prepare_wait_for_index_waiting(self, namespace, name, wait_interval):
         return helpers._prepare_wait_for_index_waiting(
             self, namespace, name, wait_interval
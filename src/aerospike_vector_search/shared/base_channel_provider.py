@@ -1,24 +1,53 @@
+import itertools
 import logging
-import random
+import time
 
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
 import grpc
 
+from .. import metrics
 from .. import types
+from . import helpers
+from . import load_balancing
+from .proto_generated import types_pb2
 from .proto_generated import vector_db_pb2
 
 logger = logging.getLogger(__name__)
 
+# Upper bound, in seconds, of the tend delay while the cluster is unreachable.
+MAX_TEND_BACKOFF = 30
+
 
 class ChannelAndEndpoints(object):
     def __init__(
         self,
-        channel: Union[grpc.Channel, grpc.aio.Channel],
+        channels: Union[list[grpc.Channel], list[grpc.aio.Channel]],
         endpoints: vector_db_pb2.ServerEndpointList,
+        stats: Optional[load_balancing.NodeStats] = None,
     ) -> None:
-        self.channel = channel
+        # Pool of channels to the node, each with its own HTTP/2 connection.
+        self.channels = channels
         self.endpoints = endpoints
+        # Load statistics of the node, tracked when the load balancing policy needs them.
+        self.stats = stats
+        # Stubs created on each channel of the pool, keyed by stub class. They are dropped
+        # along with this object when tend replaces or removes the node's channels.
+        self.stubs: list[dict[type, Any]] = [{} for _ in channels]
+        self._next_channel = itertools.count()
+
+    @property
+    def channel(self) -> Union[grpc.Channel, grpc.aio.Channel]:
+        return self.channels[0]
+
+    def next_channel(self) -> tuple[Union[grpc.Channel, grpc.aio.Channel], dict]:
+        """
+        Returns the next channel of the pool in turn, along with its stub cache.
+        """
+        if len(self.channels) == 1:
+            return (self.channels[0], self.stubs[0])
+        index = next(self._next_channel) % len(self.channels)
+        return (self.channels[index], self.stubs[index])
 
 
 class BaseChannelProvider(object):
@@ -29,32 +58,140 @@ class BaseChannelProvider(object):
         seeds: tuple[types.HostPort, ...],
         listener_name: Optional[str] = None,
         is_loadbalancer: Optional[bool] = False,
+        tend_interval: Optional[float] = 1,
+        load_balancing_policy: Optional[
+            types.LoadBalancingPolicy
+        ] = types.LoadBalancingPolicy.RANDOM,
+        connections_per_node: Optional[int] = 1,
+        channel_options: Optional[types.ChannelOptions] = None,
+        metrics: Optional[metrics.ClientMetrics] = None,
+        interceptors: Optional[list] = None,
     ) -> None:
+        if connections_per_node < 1:
+            raise Exception("connections_per_node must be at least 1")
+
         self.seeds: tuple[types.HostPort, ...] = seeds
         self.listener_name: Optional[str] = listener_name
         self._is_loadbalancer: Optional[bool] = is_loadbalancer
+        self._node_selector = load_balancing.NodeSelector(load_balancing_policy)
+        self._connections_per_node: int = connections_per_node
+        # gRPC arguments and compression applied to every channel, seeds included.
+        self._channel_options: list[tuple[str, Any]] = []
+        self._compression: bool = False
+        if channel_options is not None:
+            self._channel_options = channel_options._to_grpc_options()
+            self._compression = channel_options.compression
+        # Collects the metrics of every channel when set, seeds included.
+        self._metrics = metrics
+        # User interceptors wrapping every channel, seeds and channels re-created by tends included.
+        self._interceptors: list = list(interceptors or [])
+        self._tend_interval: float = tend_interval
+        # Delay before the next tend, grows while the cluster is unreachable.
+        self._tend_delay: float = tend_interval
+        self._last_requested_tend: float = 0
         # dict of Node Number and ChannelAndEndponts object
         self._node_channels: dict[int, ChannelAndEndpoints] = {}
         self._seedChannels: Union[list[grpc.Channel], list[grpc.Channel.aio]] = [
             self._create_channel_from_host_port(seed) for seed in self.seeds
         ]
+        # Stubs created on the seed channel used when no node has been discovered.
+        self._seed_stubs: dict[type, Any] = {}
         self._closed: bool = False
         self._cluster_id: int = 0
+        # Owning node id for each partition, None until fetched from the cluster.
+        self._partition_owners: Optional[list[Optional[int]]] = None
+
+    def get_channel(
+        self, key: Optional[types_pb2.Key] = None
+    ) -> Union[grpc.aio.Channel, grpc.Channel]:
+        (channel, _) = self._pick_channel(key)
+        return channel
+
+    def get_stub(
+        self,
+        stub_class: type,
+        key: Optional[types_pb2.Key] = None,
+        exclude: Optional[list[Optional[ChannelAndEndpoints]]] = None,
+    ) -> Any:
+        """
+        Returns a stub of stub_class bound to the channel that would be returned by get_channel.
 
-    def get_channel(self) -> Union[grpc.aio.Channel, grpc.Channel]:
+        Stubs are cached per channel, so the method multicallables are only built once per channel.
+        Nodes in exclude are skipped as long as another node is available, which lets retries and
+        hedged requests go to a node that was not tried yet.
+        """
+        (channel, stubs) = self._pick_channel(key, exclude)
+        stub = stubs.get(stub_class)
+        if stub is None:
+            stub = stub_class(channel)
+            stubs[stub_class] = stub
+        return stub
+
+    def _pick_channel(self, key=None, exclude=None):
         if not self._is_loadbalancer:
+            if key is not None and self._partition_owners:
+                # Send the request straight to the node owning the key, unless a
+                # retry or hedge of the request already tried it.
+                channel_endpoints = self._get_owner_channel(key)
+                if (
+                    channel_endpoints
+                    and channel_endpoints.channel
+                    and not (exclude and channel_endpoints in exclude)
+                ):
+                    return channel_endpoints.next_channel()
+
             discovered_channels: list[ChannelAndEndpoints] = list(
                 self._node_channels.values()
             )
             if len(discovered_channels) <= 0:
-                return self._seedChannels[0]
+                return (self._seedChannels[0], self._seed_stubs)
+
+            if exclude:
+                untried_channels = [
+                    channel_endpoints
+                    for channel_endpoints in discovered_channels
+                    if channel_endpoints not in exclude
+                ]
+                if untried_channels:
+                    discovered_channels = untried_channels
+
+            channel_endpoints = self._node_selector.select(discovered_channels)
+            if channel_endpoints.channel:
+                return channel_endpoints.next_channel()
+
+        return (self._seedChannels[0], self._seed_stubs)
+
+    def node_of_stub(self, stub: Any) -> Optional[ChannelAndEndpoints]:
+        """
+        Returns the node a stub returned by get_stub is bound to, or None for the seed channel.
+        """
+        for channel_endpoints in list(self._node_channels.values()):
+            for stubs in channel_endpoints.stubs:
+                if stub in stubs.values():
+                    return channel_endpoints
+        return None
+
+    def _get_owner_channel(self, key) -> Optional[ChannelAndEndpoints]:
+        partition_owners = self._partition_owners
+        partition_id = helpers._get_partition_id(key)
+        if partition_owners is None or partition_id is None:
+            return None
+        return self._node_channels.get(partition_owners[partition_id])
 
-            # Return a random channel.
-            channel = random.choice(discovered_channels).channel
-            if channel:
-                return channel
+    def update_partition_owners(self, response) -> None:
+        partition_owners = [None] * helpers.PARTITION_COUNT
+        for node, owned_partitions in response.partitions.items():
+            for partition_id in owned_partitions.ownedPartitions:
+                if partition_id < helpers.PARTITION_COUNT:
+                    partition_owners[partition_id] = node
+        self._partition_owners = partition_owners
 
-        return self._seedChannels[0]
+    def _get_channel_options(
+        self, options: Optional[list[tuple[str, Any]]] = None
+    ) -> list[tuple[str, Any]]:
+        if options:
+            return self._channel_options + options
+        return self._channel_options
 
     def _create_channel_from_host_port(
         self, host: types.HostPort
@@ -62,7 +199,10 @@ class BaseChannelProvider(object):
         return self._create_channel(host.host, host.port, host.is_tls)
 
     def _create_channel_from_server_endpoint_list(
-        self, endpoints: vector_db_pb2.ServerEndpointList
+        self,
+        endpoints: vector_db_pb2.ServerEndpointList,
+        interceptors: Optional[list] = None,
+        options: Optional[list[tuple[str, Any]]] = None,
     ) -> Union[grpc.aio.Channel, grpc.Channel]:
         # TODO: Create channel with all endpoints
         for endpoint in endpoints.endpoints:
@@ -71,7 +211,11 @@ class BaseChannelProvider(object):
                 continue
             try:
                 return self._create_channel(
-                    endpoint.address, endpoint.port, endpoint.isTls
+                    endpoint.address,
+                    endpoint.port,
+                    endpoint.isTls,
+                    interceptors,
+                    options,
                 )
             except Exception as e:
                 logger.debug("failure creating channel: " + str(e))
@@ -79,8 +223,33 @@ class BaseChannelProvider(object):
     def add_new_channel_to_node_channels(self, node, newEndpoints):
 
         # We have discovered a new node
-        new_channel = self._create_channel_from_server_endpoint_list(newEndpoints)
-        self._node_channels[node] = ChannelAndEndpoints(new_channel, newEndpoints)
+        stats = None
+        interceptors = None
+        if self._node_selector.tracks_stats:
+            stats = load_balancing.NodeStats()
+            interceptors = self._create_node_stats_interceptors(stats)
+
+        options = None
+        if self._connections_per_node > 1:
+            # Channels with the same target and arguments share their connection
+            # through the global subchannel pool, so each pooled channel keeps its own.
+            options = [("grpc.use_local_subchannel_pool", 1)]
+
+        new_channels = [
+            self._create_channel_from_server_endpoint_list(
+                newEndpoints, interceptors, options
+            )
+            for _ in range(self._connections_per_node)
+        ]
+        new_channels = [channel for channel in new_channels if channel is not None]
+        if not new_channels:
+            # No usable endpoint, the node is added again by a later tend.
+            logger.debug("no channel could be created for node: " + str(node))
+            self._node_channels.pop(node, None)
+            return
+        self._node_channels[node] = ChannelAndEndpoints(
+            new_channels, newEndpoints, stats
+        )
 
     def init_tend(self) -> None:
         end_tend = False
@@ -100,6 +269,36 @@ class BaseChannelProvider(object):
         ]
         return (temp_endpoints, update_endpoints_stub, channels, end_tend)
 
+    def next_tend_delay(self, cluster_reachable: bool) -> float:
+        if cluster_reachable:
+            self._tend_delay = self._tend_interval
+        else:
+            # Back off exponentially while no seed or node answers.
+            self._tend_delay = min(
+                self._tend_delay * 2, max(self._tend_interval, MAX_TEND_BACKOFF)
+            )
+        return self._tend_delay
+
+    def should_request_tend(self) -> bool:
+        # A requested tend never overrides the backoff towards an unreachable
+        # cluster and is honoured at most once per tend interval.
+        if self._closed or self._is_loadbalancer:
+            return False
+        if self._tend_delay > self._tend_interval:
+            return False
+        now = time.monotonic()
+        if now - self._last_requested_tend < self._tend_interval:
+            return False
+        self._last_requested_tend = now
+        return True
+
+    def on_rpc_error(self, e: grpc.RpcError) -> None:
+        """
+        Triggers an immediate tend when a request failed because its node was unavailable.
+        """
+        if e.code() == grpc.StatusCode.UNAVAILABLE:
+            self.request_tend()
+
     def check_cluster_id(self, new_cluster_id) -> None:
         if new_cluster_id == self._cluster_id:
             return False
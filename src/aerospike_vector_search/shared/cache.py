@@ -0,0 +1,116 @@
+import collections
+import threading
+import time
+from typing import Any, Hashable, Optional
+
+from .. import types
+
+
+class LRUCache(object):
+    """
+    Thread safe least recently used cache with an optional time to live and hit/miss counters.
+
+    Entries can be tagged with a group, so every entry of a group can be invalidated
+    without scanning the whole cache. A value read from the server while an invalidation
+    ran can be dropped by passing the version read before the request to put.
+    """
+
+    def __init__(self, max_entries: int, ttl: Optional[float] = None) -> None:
+        if max_entries < 1:
+            raise Exception("max_entries must be at least 1")
+
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        # key -> (expiry time or None, group, value), least recently used first.
+        self._entries: collections.OrderedDict = collections.OrderedDict()
+        self._groups: dict[Hashable, set] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        # Number of invalidations so far.
+        self._version = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Returns the value cached for key, or None if it is missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is not None:
+                if entry[0] <= time.monotonic():
+                    self._remove(key)
+                    entry = None
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[2]
+
+    def version(self) -> int:
+        return self._version
+
+    def put(
+        self,
+        key: Hashable,
+        value: Any,
+        group: Optional[Hashable] = None,
+        version: Optional[int] = None,
+    ) -> None:
+        """
+        Caches value for key, unless version is given and an invalidation happened since it was read.
+        """
+        expiry = None
+        if self._ttl is not None:
+            expiry = time.monotonic() + self._ttl
+
+        with self._lock:
+            if version is not None and version != self._version:
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (expiry, group, value)
+            if group is not None:
+                self._groups.setdefault(group, set()).add(key)
+
+            while len(self._entries) > self._max_entries:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._version += 1
+            if key in self._entries:
+                self._remove(key)
+
+    def invalidate_group(self, group: Hashable) -> None:
+        with self._lock:
+            self._version += 1
+            for key in list(self._groups.get(group, ())):
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._version += 1
+            self._entries.clear()
+            self._groups.clear()
+
+    def stats(self) -> types.CacheStats:
+        with self._lock:
+            return types.CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+            )
+
+    def _remove(self, key: Hashable) -> None:
+        (_, group, _) = self._entries.pop(key)
+        if group is not None:
+            keys = self._groups[group]
+            keys.discard(key)
+            if not keys:
+                del self._groups[group]
@@ -1,13 +1,24 @@
 from typing import Any, Optional, Union
+import collections.abc
+import hashlib
+import logging
+import random
 import time
+
+import grpc
 import numpy
+
+from . import cache
 from . import conversions
+from . import latency
 
 from .proto_generated import transact_pb2
 from .proto_generated import transact_pb2_grpc
 from .. import types
 from .proto_generated import types_pb2
 from . import helpers
+from . import index_wait
+from .proto_generated import index_pb2_grpc
 
 
 class BaseClient(object):
@@ -15,35 +26,71 @@ class BaseClient(object):
     def _prepare_seeds(self, seeds) -> None:
         return helpers._prepare_seeds(seeds)
 
+    def _prepare_debug_log(self, debug_log_sample_rate) -> None:
+        if not 0 <= debug_log_sample_rate <= 1:
+            raise Exception("debug_log_sample_rate must be between 0 and 1")
+        self._debug_log_sample_rate = debug_log_sample_rate
+
+    def _validate_max_in_flight(self, max_in_flight: int) -> None:
+        if max_in_flight < 1:
+            raise Exception("max_in_flight must be at least 1")
+
+    def _validate_progress_interval(self, progress_interval: int) -> None:
+        if progress_interval < 1:
+            raise Exception("progress_interval must be at least 1")
+
+    def _prepare_phase_timing(self, phase_timing) -> None:
+        self._phase_timing = phase_timing
+
+    def _report_phase_timing(
+        self, operation, start, prepared, first_response, drained, decoded, responses
+    ) -> None:
+        # Clock readings are time.perf_counter_ns values taken at the end of each phase.
+        if first_response is None:
+            first_response = drained
+        self._phase_timing(
+            types.PhaseTiming(
+                operation=operation,
+                prepare_ns=prepared - start,
+                first_response_ns=first_response - prepared,
+                drain_ns=drained - first_response,
+                decode_ns=decoded - drained,
+                responses=responses,
+            )
+        )
+
+    def _is_debug_logged(self, logger) -> bool:
+        # Logger.isEnabledFor caches its answer until the logging configuration changes,
+        # so per operation debug messages cost a single call while DEBUG is off.
+        if not logger.isEnabledFor(logging.DEBUG):
+            return False
+        return (
+            self._debug_log_sample_rate >= 1
+            or random.random() < self._debug_log_sample_rate
+        )
+
     def _prepare_put(
         self, namespace, key, record_data, set_name, write_type, logger
     ) -> None:
 
-        logger.debug(
-            "Putting record: namespace=%s, key=%s, record_data:%s, set_name:%s",
-            namespace,
-            key,
-            record_data,
-            set_name,
-        )
+        if self._is_debug_logged(logger):
+            logger.debug(
+                "Putting record: namespace=%s, key=%s, record_data:%s, set_name:%s",
+                namespace,
+                key,
+                helpers._summarize_record_data(record_data),
+                set_name,
+            )
 
         key = self._get_key(namespace, set_name, key)
         field_list = []
 
         for k, v in record_data.items():
-            if isinstance(v, numpy.ndarray):
-                field_list.append(
-                    types_pb2.Field(
-                        name=k, value=conversions.toVectorDbValue(v.tolist())
-                    )
-                )
-
-            else:
-                field_list.append(
-                    types_pb2.Field(name=k, value=conversions.toVectorDbValue(v))
-                )
+            field_list.append(
+                types_pb2.Field(name=k, value=conversions.toVectorDbValue(v))
+            )
 
-        transact_stub = self._get_transact_stub()
+        transact_stub = self._get_transact_stub(key)
         put_request = transact_pb2.PutRequest(
             key=key, writeType=write_type, fields=field_list
         )
@@ -77,90 +124,172 @@ class BaseClient(object):
 
     def _prepare_get(self, namespace, key, field_names, set_name, logger) -> None:
 
-        logger.debug(
-            "Getting record: namespace=%s, key=%s, field_names:%s, set_name:%s",
-            namespace,
-            key,
-            field_names,
-            set_name,
-        )
+        if self._is_debug_logged(logger):
+            logger.debug(
+                "Getting record: namespace=%s, key=%s, field_names:%s, set_name:%s",
+                namespace,
+                key,
+                field_names,
+                set_name,
+            )
 
         key = self._get_key(namespace, set_name, key)
         projection_spec = self._get_projection_spec(field_names=field_names)
 
-        transact_stub = self._get_transact_stub()
+        transact_stub = self._get_transact_stub(key)
         get_request = transact_pb2.GetRequest(key=key, projectionSpec=projection_spec)
 
         return (transact_stub, key, get_request)
 
+    def _prepare_get_many(self, namespace, keys, field_names, set_name, logger):
+        # Yields the stub, key and request of each get lazily, logging once for the batch.
+        if self._is_debug_logged(logger):
+            logger.debug(
+                "Getting records: namespace=%s, field_names:%s, set_name:%s",
+                namespace,
+                field_names,
+                set_name,
+            )
+
+        projection_spec = self._get_projection_spec(field_names=field_names)
+        for key in keys:
+            key = self._get_key(namespace, set_name, key)
+            transact_stub = self._get_transact_stub(key)
+            get_request = transact_pb2.GetRequest(
+                key=key, projectionSpec=projection_spec
+            )
+            yield (transact_stub, key, get_request)
+
     def _prepare_exists(self, namespace, key, set_name, logger) -> None:
 
-        logger.debug(
-            "Getting record existence: namespace=%s, key=%s, set_name:%s",
-            namespace,
-            key,
-            set_name,
-        )
+        if self._is_debug_logged(logger):
+            logger.debug(
+                "Getting record existence: namespace=%s, key=%s, set_name:%s",
+                namespace,
+                key,
+                set_name,
+            )
 
         key = self._get_key(namespace, set_name, key)
 
-        transact_stub = self._get_transact_stub()
+        transact_stub = self._get_transact_stub(key)
         exists_request = transact_pb2.ExistsRequest(key=key)
 
         return (transact_stub, exists_request)
 
+    def _prepare_exists_many(self, namespace, keys, set_name, logger):
+        # Yields the stub and request of each existence check lazily.
+        if self._is_debug_logged(logger):
+            logger.debug(
+                "Getting records existence: namespace=%s, set_name:%s",
+                namespace,
+                set_name,
+            )
+
+        for key in keys:
+            key = self._get_key(namespace, set_name, key)
+            transact_stub = self._get_transact_stub(key)
+            yield (transact_stub, transact_pb2.ExistsRequest(key=key))
+
     def _prepare_delete(self, namespace, key, set_name, logger) -> None:
 
-        logger.debug(
-            "Deleting record: key=%s",
-            namespace,
-            key,
-            set_name,
-        )
+        if self._is_debug_logged(logger):
+            logger.debug(
+                "Deleting record: namespace=%s, key=%s, set_name:%s",
+                namespace,
+                key,
+                set_name,
+            )
 
         key = self._get_key(namespace, set_name, key)
 
-        transact_stub = self._get_transact_stub()
+        transact_stub = self._get_transact_stub(key)
         delete_request = transact_pb2.DeleteRequest(key=key)
 
         return (transact_stub, delete_request)
 
+    def _prepare_delete_many(self, namespace, keys, set_name, logger):
+        # Yields the key, stub and request of each delete lazily.
+        if self._is_debug_logged(logger):
+            logger.debug(
+                "Deleting records: namespace=%s, set_name:%s",
+                namespace,
+                set_name,
+            )
+
+        for key in keys:
+            pb_key = self._get_key(namespace, set_name, key)
+            transact_stub = self._get_transact_stub(pb_key)
+            yield (key, transact_stub, transact_pb2.DeleteRequest(key=pb_key))
+
     def _prepare_is_indexed(
         self, namespace, key, index_name, index_namespace, set_name, logger
     ) -> None:
 
-        logger.debug(
-            "Checking if index exists: namespace=%s, key=%s, index_name=%s, index_namespace=%s, set_name=%s",
-            namespace,
-            key,
-            index_name,
-            index_namespace,
-            set_name,
-        )
+        if self._is_debug_logged(logger):
+            logger.debug(
+                "Checking if index exists: namespace=%s, key=%s, index_name=%s, index_namespace=%s, set_name=%s",
+                namespace,
+                key,
+                index_name,
+                index_namespace,
+                set_name,
+            )
 
         if not index_namespace:
             index_namespace = namespace
         index_id = types_pb2.IndexId(namespace=index_namespace, name=index_name)
         key = self._get_key(namespace, set_name, key)
 
-        transact_stub = self._get_transact_stub()
+        transact_stub = self._get_transact_stub(key)
         is_indexed_request = transact_pb2.IsIndexedRequest(key=key, indexId=index_id)
 
         return (transact_stub, is_indexed_request)
 
+    def _prepare_is_indexed_many(
+        self, namespace, keys, index_name, index_namespace, set_name, logger
+    ):
+        # Yields the stub and request of each is indexed check lazily.
+        if self._is_debug_logged(logger):
+            logger.debug(
+                "Checking if records are indexed: namespace=%s, index_name=%s, index_namespace=%s, set_name=%s",
+                namespace,
+                index_name,
+                index_namespace,
+                set_name,
+            )
+
+        if not index_namespace:
+            index_namespace = namespace
+        index_id = types_pb2.IndexId(namespace=index_namespace, name=index_name)
+        for key in keys:
+            key = self._get_key(namespace, set_name, key)
+            transact_stub = self._get_transact_stub(key)
+            yield (
+                transact_stub,
+                transact_pb2.IsIndexedRequest(key=key, indexId=index_id),
+            )
+
+    def _get_key_count(self, keys) -> int:
+        # Number of keys when known up front, -1 for iterators.
+        if isinstance(keys, collections.abc.Sized):
+            return len(keys)
+        return -1
+
     def _prepare_vector_search(
         self, namespace, index_name, query, limit, search_params, field_names, logger
     ) -> None:
 
-        logger.debug(
-            "Performing vector search: namespace=%s, index_name=%s, query=%s, limit=%s, search_params=%s, field_names=%s",
-            namespace,
-            index_name,
-            query,
-            limit,
-            search_params,
-            field_names,
-        )
+        if self._is_debug_logged(logger):
+            logger.debug(
+                "Performing vector search: namespace=%s, index_name=%s, query=%s, limit=%s, search_params=%s, field_names=%s",
+                namespace,
+                index_name,
+                helpers._summarize_value(query),
+                limit,
+                search_params,
+                field_names,
+            )
 
         if search_params != None:
             search_params = search_params._to_pb2()
@@ -169,10 +298,7 @@ class BaseClient(object):
 
         index = types_pb2.IndexId(namespace=namespace, name=index_name)
 
-        if isinstance(query, numpy.ndarray):
-            query_vector = conversions.toVectorDbValue(query.tolist()).vectorValue
-        else:
-            query_vector = conversions.toVectorDbValue(query).vectorValue
+        query_vector = conversions.toVectorDbValue(query).vectorValue
 
         transact_stub = self._get_transact_stub()
 
@@ -186,8 +312,39 @@ class BaseClient(object):
 
         return (transact_stub, vector_search_request)
 
-    def _get_transact_stub(self):
-        return transact_pb2_grpc.TransactStub(self._channel_provider.get_channel())
+    def _prepare_vector_search_arrays(
+        self,
+        namespace,
+        index_name,
+        query,
+        limit,
+        search_params,
+        vector_field_names,
+        logger,
+    ) -> None:
+
+        (transact_stub, vector_search_request) = self._prepare_vector_search(
+            namespace,
+            index_name,
+            query,
+            limit,
+            search_params,
+            vector_field_names,
+            logger,
+        )
+
+        if not vector_field_names:
+            # Only keys and distances are needed, skip sending record fields.
+            vector_search_request.projection.include.type = (
+                transact_pb2.ProjectionType.NONE
+            )
+
+        neighbor_arrays = conversions.NeighborArraysBuilder(limit, vector_field_names)
+
+        return (transact_stub, vector_search_request, neighbor_arrays)
+
+    def _get_transact_stub(self, key=None):
+        return self._channel_provider.get_stub(transact_pb2_grpc.TransactStub, key)
 
     def _respond_get(self, response, key) -> None:
         return types.RecordWithKey(
@@ -250,25 +407,190 @@ class BaseClient(object):
             raise Exception("Invalid key type" + type(key))
         return key
 
-    def _prepare_wait_for_index_waiting(self, namespace, name, wait_interval):
-        return helpers._prepare_wait_for_index_waiting(
-            self, namespace, name, wait_interval
-        )
+    def _handle_rpc_error(self, e, logger):
+        return helpers._handle_rpc_error(self, e, logger)
 
-    def _check_completion_condition(
-        self, start_time, timeout, index_status, unmerged_record_initialized
-    ):
+    def _get_timeout(self, timeout: Optional[float]) -> Optional[float]:
+        if timeout is None:
+            return self._timeout
+        return timeout
+
+    def _prepare_retry(
+        self,
+        retry_policy: Optional[types.RetryPolicy],
+        hedge_policy: Optional[types.HedgePolicy],
+    ) -> None:
+        self._retry_policy = retry_policy
+        self._hedge_policy = hedge_policy
+        # Latencies of the hedged operations, used to derive the hedge delay.
+        self._latency_trackers: dict[str, latency.LatencyTracker] = {}
+        if hedge_policy is not None:
+            for operation in ("get", "vector_search"):
+                self._latency_trackers[operation] = latency.LatencyTracker(
+                    hedge_policy.percentile, hedge_policy.min_samples
+                )
+
+    def _prepare_vector_search_cache(
+        self, vector_search_cache: Optional[types.VectorSearchCachePolicy]
+    ) -> None:
+        self._vector_search_cache: Optional[cache.LRUCache] = None
+        if vector_search_cache is not None:
+            self._vector_search_cache = cache.LRUCache(
+                vector_search_cache.max_entries, vector_search_cache.ttl
+            )
+            self._quantization_step = vector_search_cache.quantization_step
+
+    def _get_vector_search_cache_key(
+        self, namespace, index_name, query, limit, search_params, field_names
+    ) -> tuple:
+        quantized = numpy.round(
+            numpy.asarray(query, dtype=numpy.float64) / self._quantization_step
+        ).astype(numpy.int64)
+        query_hash = hashlib.blake2b(quantized.tobytes(), digest_size=16).digest()
+        ef = None if search_params is None else search_params.ef
+        if field_names is not None:
+            field_names = tuple(field_names)
+        return (namespace, index_name, query_hash, limit, ef, field_names)
+
+    def _get_cached_neighbors(self, cache_key: tuple) -> Optional[list]:
+        neighbors = self._vector_search_cache.get(cache_key)
+        if neighbors is None:
+            return None
+        return self._copy_neighbors(neighbors)
+
+    def _cache_neighbors(
+        self, cache_key: tuple, neighbors: list, group: tuple, version: int
+    ) -> list:
+        cached = self._copy_neighbors(neighbors)
+        self._vector_search_cache.put(cache_key, cached, group, version)
+        return cached
+
+    def _copy_neighbors(self, neighbors: list) -> list[types.Neighbor]:
+        # Callers get their own neighbors and fields, so changing them leaves the cache intact.
+        return [
+            types.Neighbor(
+                key=neighbor.key,
+                fields=dict(neighbor.fields),
+                distance=neighbor.distance,
+            )
+            for neighbor in neighbors
+        ]
 
-        if start_time + 10 < time.monotonic():
-            unmerged_record_initialized = True
+    def _invalidate_vector_search_cache(
+        self, namespace: Optional[str], index_name: Optional[str]
+    ) -> None:
+        if self._vector_search_cache is None:
+            return
+        if index_name is None:
+            self._vector_search_cache.clear()
+        else:
+            self._vector_search_cache.invalidate_group((namespace, index_name))
+
+    def _get_vector_search_cache_stats(self) -> Optional[types.CacheStats]:
+        if self._vector_search_cache is None:
+            return None
+        return self._vector_search_cache.stats()
+
+    def _prepare_record_cache(self, record_cache: Optional[types.CachePolicy]) -> None:
+        self._record_cache: Optional[cache.LRUCache] = None
+        if record_cache is not None:
+            self._record_cache = cache.LRUCache(
+                record_cache.max_entries, record_cache.ttl
+            )
 
-        if index_status.unmergedRecordCount > 0:
-            unmerged_record_initialized = True
+    def _get_record_cache_key(
+        self, key: types_pb2.Key, field_names: Optional[list[str]]
+    ) -> tuple:
+        # Records are grouped by key, so a write drops every cached projection of it.
+        if field_names is not None:
+            field_names = tuple(field_names)
+        return (key.SerializeToString(), field_names)
+
+    def _get_cached_record(self, cache_key: tuple) -> Optional[types.RecordWithKey]:
+        record = self._record_cache.get(cache_key)
+        if record is None:
+            return None
+        return types.RecordWithKey(key=record.key, fields=dict(record.fields))
+
+    def _cache_record(
+        self, cache_key: tuple, record: types.RecordWithKey, version: int
+    ) -> None:
+        self._record_cache.put(
+            cache_key,
+            types.RecordWithKey(key=record.key, fields=dict(record.fields)),
+            cache_key[0],
+            version,
+        )
 
+    def _invalidate_cached_record(self, key: types_pb2.Key) -> None:
+        if self._record_cache is not None:
+            self._record_cache.invalidate_group(key.SerializeToString())
+
+    def _get_record_cache_stats(self) -> Optional[types.CacheStats]:
+        if self._record_cache is None:
+            return None
+        return self._record_cache.stats()
+
+    def _get_deadline(self, timeout: Optional[float]) -> Optional[float]:
+        timeout = self._get_timeout(timeout)
+        if timeout is None:
+            return None
+        return time.monotonic() + timeout
+
+    def _get_remaining(self, deadline: Optional[float]) -> Optional[float]:
+        if deadline is None:
+            return None
+        return deadline - time.monotonic()
+
+    def _get_retry_backoff(
+        self, attempt: int, e: grpc.RpcError, deadline: Optional[float]
+    ) -> Optional[float]:
+        # Returns the delay before the next attempt, or None if e must be raised.
+        policy = self._retry_policy
         if (
-            index_status.unmergedRecordCount == 0
-            and unmerged_record_initialized == True
+            policy is None
+            or attempt >= policy.max_attempts
+            or e.code() not in policy.retryable_codes
         ):
-            return True
-        else:
-            return False
+            return None
+
+        backoff = random.uniform(
+            0,
+            min(
+                policy.max_backoff,
+                policy.initial_backoff * policy.backoff_multiplier ** (attempt - 1),
+            ),
+        )
+        if deadline is not None and time.monotonic() + backoff >= deadline:
+            return None
+        return backoff
+
+    def _get_hedge_delay(self, operation: str) -> Optional[float]:
+        if self._hedge_policy.delay is not None:
+            return self._hedge_policy.delay
+        return self._latency_trackers[operation].estimate()
+
+    def _prepare_index_completion_waits(
+        self, indexes, timeout, wait_interval, validation_checks, min_wait_interval
+    ) -> list[index_wait.IndexCompletionWait]:
+        return [
+            index_wait.IndexCompletionWait(
+                namespace,
+                name,
+                timeout=timeout,
+                validation_checks=validation_checks,
+                min_wait_interval=min_wait_interval,
+                max_wait_interval=wait_interval,
+            )
+            for (namespace, name) in indexes
+        ]
+
+    def _get_index_stub(self):
+        return self._channel_provider.get_stub(index_pb2_grpc.IndexServiceStub)
+
+    def _on_index_status_unavailable(self, e, wait, logger) -> None:
+        logger.debug(
+            "Index status unavailable: namespace=%s, name=%s", wait.namespace, wait.name
+        )
+        self._channel_provider.on_rpc_error(e)
+        wait.on_unavailable()
@@ -1,11 +1,23 @@
-from typing import Any
+import array
+from typing import Any, Optional
+
+import numpy
 
 from .. import types
 from .proto_generated import types_pb2
 
 
 def toVectorDbValue(value: Any) -> types_pb2.Value:
-    if isinstance(value, str):
+    if isinstance(value, (numpy.ndarray, array.array, memoryview)):
+        float_vector = toFloatVector(value)
+        if float_vector is not None:
+            return toVectorDbFloatVectorValue(float_vector)
+        if isinstance(value, memoryview):
+            raise Exception(
+                "Invalid type " + str(type(value)) + " of format " + value.format
+            )
+        return toVectorDbValue(value.tolist())
+    elif isinstance(value, str):
         return types_pb2.Value(stringValue=value)
     elif isinstance(value, int):
         return types_pb2.Value(longValue=value)
@@ -47,6 +59,36 @@ def toVectorDbValue(value: Any) -> types_pb2.Value:
         raise Exception("Invalid type " + str(type(value)))
 
 
+def toFloatVector(value: Any) -> Optional[list[float]]:
+    """
+    Returns the elements of a one dimensional float vector as Python floats,
+    or None if the value is not one.
+
+    The elements are read by the C implemented tolist methods, so no
+    per-element float() is run in Python.
+    """
+    if isinstance(value, numpy.ndarray):
+        if value.dtype.kind != "f" or value.ndim != 1:
+            return None
+        return value.tolist()
+    elif isinstance(value, array.array):
+        if value.typecode not in ("f", "d"):
+            return None
+        return value.tolist()
+    elif isinstance(value, memoryview):
+        # Only buffers declaring a float format are vectors, raw bytes are not.
+        if value.format.lstrip("@=<>!") not in ("f", "d") or value.ndim != 1:
+            return None
+        return numpy.frombuffer(value, dtype=value.format).tolist()
+    return None
+
+
+def toVectorDbFloatVectorValue(vector: list[float]) -> types_pb2.Value:
+    value = types_pb2.Value()
+    value.vectorValue.floatData.value.extend(vector)
+    return value
+
+
 def toMapKey(value):
     if isinstance(value, str):
         return types_pb2.MapKey(stringValue=value)
@@ -90,6 +132,86 @@ def fromVectorDbNeighbor(input: types_pb2.Neighbor) -> types.Neighbor:
     )
 
 
+def fromVectorDbKeyValue(key: types_pb2.Key) -> Any:
+    field = key.WhichOneof("value")
+    if field is None:
+        return None
+    return getattr(key, field)
+
+
+class NeighborArraysBuilder(object):
+    """
+    Accumulates streamed Neighbor messages into the columns of a types.NeighborArrays,
+    without creating a types.Neighbor, Key or field dictionary per result.
+    """
+
+    def __init__(self, limit: int, vector_field_names: Optional[list[str]]) -> None:
+        self._keys = []
+        self._distances = numpy.empty(limit, dtype=numpy.float32)
+        self._vector_field_names = vector_field_names or []
+        self._vectors: dict[str, Optional[numpy.ndarray]] = {
+            name: None for name in self._vector_field_names
+        }
+
+    def add(self, neighbor: types_pb2.Neighbor) -> None:
+        row = len(self._keys)
+        if row == len(self._distances):
+            self._distances = numpy.resize(self._distances, max(1, 2 * row))
+        self._keys.append(fromVectorDbKeyValue(neighbor.key))
+        self._distances[row] = neighbor.distance
+
+        if not self._vector_field_names:
+            return
+
+        for field in neighbor.record.fields:
+            if field.name not in self._vectors or not field.value.HasField(
+                "vectorValue"
+            ):
+                continue
+            vector = field.value.vectorValue
+            if vector.HasField("floatData"):
+                data = vector.floatData.value
+                dtype = numpy.float32
+            else:
+                data = vector.boolData.value
+                dtype = numpy.bool_
+            column = self._vectors[field.name]
+            if column is not None and len(data) != column.shape[1]:
+                raise Exception(
+                    "Vector field "
+                    + field.name
+                    + " of record "
+                    + str(self._keys[row])
+                    + " has "
+                    + str(len(data))
+                    + " dimensions, expected "
+                    + str(column.shape[1])
+                )
+            if column is None or row >= len(column):
+                column = self._grow_column(column, len(data), dtype)
+                self._vectors[field.name] = column
+            column[row] = data
+
+    def _grow_column(self, column, dimensions, dtype) -> numpy.ndarray:
+        rows = max(len(self._distances), len(self._keys))
+        fill = numpy.nan if dtype == numpy.float32 else False
+        grown = numpy.full((rows, dimensions), fill, dtype=dtype)
+        if column is not None:
+            grown[: len(column)] = column
+        return grown
+
+    def build(self) -> types.NeighborArrays:
+        count = len(self._keys)
+        vectors = {}
+        for name, column in self._vectors.items():
+            if column is None:
+                column = numpy.empty((count, 0), dtype=numpy.float32)
+            vectors[name] = column[:count]
+        return types.NeighborArrays(
+            keys=self._keys, distances=self._distances[:count], vectors=vectors
+        )
+
+
 def fromVectorDbValue(input: types_pb2.Value) -> Any:
     if input.HasField("stringValue"):
         return input.stringValue
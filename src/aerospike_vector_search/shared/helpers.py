@@ -1,8 +1,35 @@
+import array
+import hashlib
+import logging
 import time
+from typing import Any, Optional
+
+import grpc
+import numpy
+
 from .. import types
 from .proto_generated import types_pb2
 from .proto_generated import index_pb2_grpc
 
+logger = logging.getLogger(__name__)
+
+# Records are spread over the same 4096 partitions as in Aerospike, identified by
+# the low 12 bits of the RIPEMD-160 digest of the record's set and key.
+PARTITION_COUNT = 4096
+
+# Aerospike particle types used when digesting a key.
+_PARTICLE_TYPE_INTEGER = b"\x01"
+_PARTICLE_TYPE_STRING = b"\x03"
+_PARTICLE_TYPE_BLOB = b"\x04"
+
+try:
+    hashlib.new("ripemd160")
+    _ripemd160_available = True
+except ValueError:
+    # Some OpenSSL builds only ship RIPEMD-160 in the legacy provider.
+    logger.debug("RIPEMD-160 unavailable, partition aware routing is disabled")
+    _ripemd160_available = False
+
 
 def _prepare_seeds(seeds) -> None:
 
@@ -15,13 +42,39 @@ def _prepare_seeds(seeds) -> None:
     return seeds
 
 
+def _summarize_value(value: Any) -> Any:
+    # Vectors are logged as their shape, dtype and norm instead of every element.
+    if isinstance(value, (numpy.ndarray, array.array, memoryview)) or (
+        isinstance(value, list) and value and isinstance(value[0], (float, bool))
+    ):
+        vector = numpy.asarray(value)
+        return "vector(shape=%s, dtype=%s, norm=%.6g)" % (
+            vector.shape,
+            vector.dtype,
+            numpy.linalg.norm(vector.astype(numpy.float64).ravel()),
+        )
+    return value
+
+
+def _summarize_record_data(record_data: dict[str, Any]) -> dict[str, Any]:
+    return {name: _summarize_value(value) for name, value in record_data.items()}
+
+
+def _handle_rpc_error(self, e, logger) -> types.AVSServerError:
+    logger.error("Failed with error: %s", e)
+    self._channel_provider.on_rpc_error(e)
+    if e.code() == grpc.StatusCode.DEADLINE_EXCEEDED:
+        return types.AVSDeadlineExceededError(rpc_error=e)
+    return types.AVSServerError(rpc_error=e)
+
+
 def _prepare_wait_for_index_waiting(self, namespace, name, wait_interval):
 
     unmerged_record_initialized = False
     start_time = time.monotonic()
     consecutive_index_validations = 0
 
-    index_stub = index_pb2_grpc.IndexServiceStub(self._channel_provider.get_channel())
+    index_stub = self._channel_provider.get_stub(index_pb2_grpc.IndexServiceStub)
     index_wait_request = types_pb2.IndexId(namespace=namespace, name=name)
     return (
         index_stub,
@@ -31,3 +84,23 @@ def _prepare_wait_for_index_waiting(self, namespace, name, wait_interval):
         consecutive_index_validations,
         index_wait_request,
     )
+
+
+def _get_partition_id(key: types_pb2.Key) -> Optional[int]:
+    if not _ripemd160_available:
+        return None
+
+    value_type = key.WhichOneof("value")
+    if value_type == "stringValue":
+        particle = _PARTICLE_TYPE_STRING + key.stringValue.encode("utf-8")
+    elif value_type in ("longValue", "intValue"):
+        particle = _PARTICLE_TYPE_INTEGER + getattr(key, value_type).to_bytes(
+            8, "big", signed=True
+        )
+    elif value_type == "bytesValue":
+        particle = _PARTICLE_TYPE_BLOB + key.bytesValue
+    else:
+        return None
+
+    digest = hashlib.new("ripemd160", key.set.encode("utf-8") + particle).digest()
+    return (digest[0] | (digest[1] << 8)) & (PARTITION_COUNT - 1)
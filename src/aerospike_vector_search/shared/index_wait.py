@@ -0,0 +1,151 @@
+import random
+import time
+from typing import Optional
+
+from .. import types
+from .proto_generated import types_pb2
+
+# Seconds after which an index that never reported unmerged records is taken as caught up.
+INITIALIZATION_GRACE = 10
+
+# Weight of the newest sample in the smoothed merge rate.
+RATE_ALPHA = 0.5
+
+
+class IndexCompletionWait(object):
+    """
+    Tracks the index status polls of one index waiting for completion and schedules the next poll.
+
+    The delay between polls starts at min_wait_interval. While the unmerged record count drops it follows
+    half of the estimated time left, so polls get closer as the index catches up. While the count is flat
+    or growing, including the zero readings confirming completion, the delay doubles up to max_wait_interval.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        name: str,
+        *,
+        timeout: float,
+        validation_checks: int,
+        min_wait_interval: float,
+        max_wait_interval: float,
+    ) -> None:
+        self.namespace = namespace
+        self.name = name
+        self.index_id = types_pb2.IndexId(namespace=namespace, name=name)
+        self.done = False
+        # A missing index fails the wait instead of being polled again.
+        self.retries_not_found = False
+        self._start = time.monotonic()
+        self._deadline = self._start + timeout
+        self._validation_checks = validation_checks
+        self._min_wait_interval = min(min_wait_interval, max_wait_interval)
+        self._max_wait_interval = max_wait_interval
+        self._delay = self._min_wait_interval
+        self._initialized = False
+        self._validations = 0
+        self._unavailable = 0
+        self._last_status: Optional[tuple[float, int]] = None
+        self._rate: Optional[float] = None
+        self.next_poll = self._start
+
+    def check_timeout(self) -> None:
+        if self._deadline < time.monotonic():
+            raise Exception(
+                "timed-out waiting for index completion: namespace=%s, name=%s"
+                % (self.namespace, self.name)
+            )
+
+    def on_status(self, unmerged_record_count: int) -> types.IndexCompletionProgress:
+        now = time.monotonic()
+        self._unavailable = 0
+
+        if unmerged_record_count > 0 or self._start + INITIALIZATION_GRACE < now:
+            self._initialized = True
+
+        if unmerged_record_count == 0 and self._initialized:
+            self._validations += 1
+            self.done = self._validations > self._validation_checks
+        else:
+            self._validations = 0
+
+        if self._last_status is not None:
+            (last_time, last_count) = self._last_status
+            if now > last_time:
+                rate = (last_count - unmerged_record_count) / (now - last_time)
+                if self._rate is None:
+                    self._rate = rate
+                else:
+                    self._rate = RATE_ALPHA * rate + (1 - RATE_ALPHA) * self._rate
+        self._last_status = (now, unmerged_record_count)
+
+        eta = self._get_eta(unmerged_record_count)
+        if unmerged_record_count > 0 and eta is not None:
+            self._delay = eta / 2
+        else:
+            self._delay *= 2
+        self._delay = min(
+            max(self._delay, self._min_wait_interval), self._max_wait_interval
+        )
+        self._schedule(now, self._delay)
+
+        return types.IndexCompletionProgress(
+            namespace=self.namespace,
+            name=self.name,
+            unmerged_record_count=unmerged_record_count,
+            rate=self._rate,
+            eta=eta,
+            elapsed=now - self._start,
+        )
+
+    def on_unavailable(self) -> None:
+        # Back off with jitter while the cluster is unreachable.
+        self._unavailable += 1
+        delay = min(
+            self._min_wait_interval * 2**self._unavailable, self._max_wait_interval
+        )
+        self._schedule(time.monotonic(), random.uniform(delay / 2, delay))
+
+    def _get_eta(self, unmerged_record_count: int) -> Optional[float]:
+        if unmerged_record_count == 0:
+            return 0.0
+        if self._rate is None or self._rate <= 0:
+            return None
+        return unmerged_record_count / self._rate
+
+    def _schedule(self, now: float, delay: float) -> None:
+        # Never sleep past the deadline, so timeouts are reported on time.
+        self.next_poll = min(now + delay, self._deadline)
+
+
+class IndexCreationWait(object):
+    """
+    Tracks the index status polls of one index waiting to be created, polling every wait_interval
+    until the index status can be read.
+    """
+
+    def __init__(
+        self, namespace: str, name: str, *, timeout: float, wait_interval: float
+    ) -> None:
+        self.namespace = namespace
+        self.name = name
+        self.index_id = types_pb2.IndexId(namespace=namespace, name=name)
+        self.done = False
+        self.retries_not_found = True
+        self._deadline = time.monotonic() + timeout
+        self._wait_interval = wait_interval
+        self.next_poll = time.monotonic()
+
+    def check_timeout(self) -> None:
+        if self._deadline < time.monotonic():
+            raise Exception(
+                "timed-out waiting for index creation: namespace=%s, name=%s"
+                % (self.namespace, self.name)
+            )
+
+    def on_status(self, unmerged_record_count: int) -> None:
+        self.done = True
+
+    def on_unavailable(self) -> None:
+        self.next_poll = min(time.monotonic() + self._wait_interval, self._deadline)
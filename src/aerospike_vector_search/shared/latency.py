@@ -0,0 +1,47 @@
+import collections
+import math
+import threading
+from typing import Optional
+
+
+class LatencyTracker(object):
+    """
+    Keeps the latencies of the most recent calls of an operation and estimates a percentile of them.
+
+    The estimate is refreshed every refresh_every samples rather than on every read,
+    so reading it is cheap on the request path.
+    """
+
+    def __init__(
+        self,
+        percentile: float,
+        min_samples: int,
+        window: int = 1000,
+        refresh_every: int = 50,
+    ) -> None:
+        self._percentile = percentile
+        self._min_samples = min_samples
+        self._refresh_every = refresh_every
+        self._samples: collections.deque = collections.deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._added_since_refresh = 0
+        self._estimate: Optional[float] = None
+
+    def add(self, latency: float) -> None:
+        with self._lock:
+            self._samples.append(latency)
+            self._added_since_refresh += 1
+            if (
+                self._added_since_refresh >= self._refresh_every
+                or self._estimate is None
+            ) and len(self._samples) >= self._min_samples:
+                ordered = sorted(self._samples)
+                rank = math.ceil(self._percentile / 100 * len(ordered)) - 1
+                self._estimate = ordered[min(max(rank, 0), len(ordered) - 1)]
+                self._added_since_refresh = 0
+
+    def estimate(self) -> Optional[float]:
+        """
+        Returns the estimated percentile latency in seconds, or None until enough samples were added.
+        """
+        return self._estimate
@@ -0,0 +1,130 @@
+import itertools
+import random
+import threading
+import time
+from typing import Any
+
+import grpc
+
+from .. import types
+
+# Weight of the newest sample in a node's latency moving average.
+EWMA_ALPHA = 0.3
+
+
+class NodeStats(object):
+    """
+    In-flight request count and exponentially weighted moving average latency of a node.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.in_flight: int = 0
+        self.ewma_latency: float = 0.0
+
+    def begin(self) -> float:
+        with self._lock:
+            self.in_flight += 1
+        return time.perf_counter()
+
+    def end(self, start: float) -> None:
+        latency = time.perf_counter() - start
+        with self._lock:
+            self.in_flight -= 1
+            if self.ewma_latency:
+                self.ewma_latency += EWMA_ALPHA * (latency - self.ewma_latency)
+            else:
+                self.ewma_latency = latency
+
+
+class NodeSelector(object):
+    """
+    Chooses the node a request without partition affinity is sent to.
+    """
+
+    def __init__(self, policy: types.LoadBalancingPolicy) -> None:
+        self.policy = policy
+        self._round_robin = itertools.count()
+
+    @property
+    def tracks_stats(self) -> bool:
+        return self.policy in (
+            types.LoadBalancingPolicy.LEAST_OUTSTANDING,
+            types.LoadBalancingPolicy.EWMA_LATENCY,
+        )
+
+    def select(self, candidates: list[Any]) -> Any:
+        if len(candidates) == 1 or self.policy == types.LoadBalancingPolicy.RANDOM:
+            return random.choice(candidates)
+
+        if self.policy == types.LoadBalancingPolicy.ROUND_ROBIN:
+            return candidates[next(self._round_robin) % len(candidates)]
+
+        if self.policy == types.LoadBalancingPolicy.LEAST_OUTSTANDING:
+            # Start from a random node so ties do not all land on the first one.
+            offset = random.randrange(len(candidates))
+            rotated = candidates[offset:] + candidates[:offset]
+            return min(rotated, key=lambda candidate: candidate.stats.in_flight)
+
+        # Power of two choices on latency weighted by the queued requests.
+        first, second = random.sample(candidates, 2)
+        if self._cost(second.stats) < self._cost(first.stats):
+            return second
+        return first
+
+    def _cost(self, stats: NodeStats) -> float:
+        return stats.ewma_latency * (stats.in_flight + 1)
+
+
+class NodeStatsInterceptor(
+    grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor
+):
+    """
+    Records in-flight counts and latencies of the calls made on a node's channel.
+    """
+
+    def __init__(self, stats: NodeStats) -> None:
+        self._stats = stats
+
+    def _intercept(self, continuation, client_call_details, request):
+        start = self._stats.begin()
+        call = continuation(client_call_details, request)
+        call.add_done_callback(lambda _: self._stats.end(start))
+        return call
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        return self._intercept(continuation, client_call_details, request)
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        return self._intercept(continuation, client_call_details, request)
+
+
+class _AioNodeStatsInterceptor(object):
+    def __init__(self, stats: NodeStats) -> None:
+        self._stats = stats
+
+    async def _intercept(self, continuation, client_call_details, request):
+        start = self._stats.begin()
+        try:
+            call = await continuation(client_call_details, request)
+        except BaseException:
+            self._stats.end(start)
+            raise
+        call.add_done_callback(lambda _: self._stats.end(start))
+        return call
+
+
+# grpc.aio files every interceptor under a single call type, so unary and
+# streaming calls each need their own interceptor instance.
+class AioUnaryUnaryNodeStatsInterceptor(
+    _AioNodeStatsInterceptor, grpc.aio.UnaryUnaryClientInterceptor
+):
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        return await self._intercept(continuation, client_call_details, request)
+
+
+class AioUnaryStreamNodeStatsInterceptor(
+    _AioNodeStatsInterceptor, grpc.aio.UnaryStreamClientInterceptor
+):
+    async def intercept_unary_stream(self, continuation, client_call_details, request):
+        return await self._intercept(continuation, client_call_details, request)
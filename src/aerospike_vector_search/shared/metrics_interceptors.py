@@ -0,0 +1,135 @@
+import asyncio
+import time
+from typing import Any
+
+import grpc
+
+from .. import metrics
+
+
+def _method_name(method: Any) -> str:
+    if isinstance(method, bytes):
+        method = method.decode("utf-8")
+    return method.lstrip("/")
+
+
+class _RpcMetricsRecorder(object):
+    def __init__(self, client_metrics: metrics.ClientMetrics, node: str) -> None:
+        self._metrics = client_metrics
+        self._node = node
+
+    def _begin(self, client_call_details, request):
+        rpc_metrics = self._metrics._get_rpc_metrics(
+            _method_name(client_call_details.method), self._node
+        )
+        rpc_metrics._begin(request.ByteSize())
+        return (rpc_metrics, time.perf_counter())
+
+
+class _CountingResponseIterator(object):
+    # Counts the bytes of streamed responses as they are read, and passes
+    # everything else through to the underlying call.
+    def __init__(self, call, rpc_metrics: metrics.RpcMetrics) -> None:
+        self._call = call
+        self._rpc_metrics = rpc_metrics
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        response = next(self._call)
+        self._rpc_metrics._add_received(response.ByteSize())
+        return response
+
+    def __getattr__(self, name):
+        return getattr(self._call, name)
+
+
+class MetricsInterceptor(
+    _RpcMetricsRecorder,
+    grpc.UnaryUnaryClientInterceptor,
+    grpc.UnaryStreamClientInterceptor,
+):
+    """
+    Records latency, status, in-flight count and message sizes of the calls made on a channel.
+    """
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        rpc_metrics, start = self._begin(client_call_details, request)
+        call = continuation(client_call_details, request)
+
+        def end(call):
+            code = call.code()
+            received_bytes = 0
+            if code == grpc.StatusCode.OK:
+                received_bytes = call.result().ByteSize()
+            rpc_metrics._end(time.perf_counter() - start, code, received_bytes)
+
+        call.add_done_callback(end)
+        return call
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        rpc_metrics, start = self._begin(client_call_details, request)
+        call = continuation(client_call_details, request)
+        call.add_done_callback(
+            lambda call: rpc_metrics._end(time.perf_counter() - start, call.code())
+        )
+        return _CountingResponseIterator(call, rpc_metrics)
+
+
+class _AioMetricsInterceptor(_RpcMetricsRecorder):
+    async def _start(self, continuation, client_call_details, request):
+        rpc_metrics, start = self._begin(client_call_details, request)
+        try:
+            call = await continuation(client_call_details, request)
+        except BaseException:
+            rpc_metrics._end(time.perf_counter() - start, grpc.StatusCode.UNKNOWN)
+            raise
+        return (call, rpc_metrics, start)
+
+
+# grpc.aio files every interceptor under a single call type, so unary and
+# streaming calls each need their own interceptor instance.
+class AioUnaryUnaryMetricsInterceptor(
+    _AioMetricsInterceptor, grpc.aio.UnaryUnaryClientInterceptor
+):
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        call, rpc_metrics, start = await self._start(
+            continuation, client_call_details, request
+        )
+
+        async def end(call, latency):
+            # The status and response of a done call are available without waiting.
+            code = await call.code()
+            received_bytes = 0
+            if code == grpc.StatusCode.OK:
+                received_bytes = (await call).ByteSize()
+            rpc_metrics._end(latency, code, received_bytes)
+
+        call.add_done_callback(
+            lambda call: asyncio.ensure_future(end(call, time.perf_counter() - start))
+        )
+        return call
+
+
+class AioUnaryStreamMetricsInterceptor(
+    _AioMetricsInterceptor, grpc.aio.UnaryStreamClientInterceptor
+):
+    async def intercept_unary_stream(self, continuation, client_call_details, request):
+        call, rpc_metrics, start = await self._start(
+            continuation, client_call_details, request
+        )
+
+        async def end(call, latency):
+            rpc_metrics._end(latency, await call.code())
+
+        call.add_done_callback(
+            lambda call: asyncio.ensure_future(end(call, time.perf_counter() - start))
+        )
+
+        async def responses():
+            async for response in call:
+                rpc_metrics._add_received(response.ByteSize())
+                yield response
+
+        return responses()
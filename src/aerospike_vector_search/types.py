@@ -1,6 +1,9 @@
 import enum
 from typing import Any, Optional
 
+import grpc
+import numpy
+
 from .shared.proto_generated import types_pb2
 
 
@@ -125,6 +128,50 @@ class Neighbor(object):
         )
 
 
+class NeighborArrays(object):
+    """
+    Represents the neighbors found by a vector search in columnar form.
+    Return value for VectorDbClient.vector_search_arrays.
+
+    Row i of every attribute describes the i-th closest neighbor.
+
+    Args:
+        keys (list[Any]): The key values of the neighboring records.
+        distances (numpy.ndarray): float32 array of the distances between each neighbor and the query vector.
+        vectors (dict[str, numpy.ndarray]): Two dimensional arrays, one per requested vector field, holding the vector of each neighbor.
+            Rows of neighbors without the field are NaN for float vectors and False for boolean vectors.
+    """
+
+    def __init__(
+        self,
+        *,
+        keys: list[Any],
+        distances: numpy.ndarray,
+        vectors: dict[str, numpy.ndarray],
+    ) -> None:
+        self.keys = keys
+        self.distances = distances
+        self.vectors = vectors
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __str__(self):
+        """
+        Returns a string representation of the neighbors.
+        """
+        vectors_info = ""
+        for name, value in self.vectors.items():
+            vectors_info += "\n\t\t{}: shape={}, dtype={}".format(
+                name, value.shape, value.dtype
+            )
+        return "{{\n\tkeys: {},\n\tdistances: {},\n\tvectors: {{{}\n\t}}\n}}".format(
+            self.keys,
+            self.distances,
+            vectors_info,
+        )
+
+
 class VectorDistanceMetric(enum.Enum):
     """
     Enumeration of vector distance metrics.
@@ -141,6 +188,320 @@ class VectorDistanceMetric(enum.Enum):
     HAMMING: types_pb2.VectorDistanceMetric = types_pb2.VectorDistanceMetric.HAMMING
 
 
+class LoadBalancingPolicy(enum.Enum):
+    """
+    Enumeration of policies for choosing the node a request is sent to.
+
+    Requests for a single key are always sent to the node owning the key's partition
+    when the partition map is known. The policy applies to all other requests.
+    """
+
+    RANDOM = "random"
+    """Pick a node uniformly at random."""
+    ROUND_ROBIN = "round_robin"
+    """Cycle through the nodes in turn."""
+    LEAST_OUTSTANDING = "least_outstanding"
+    """Pick the node with the fewest requests in flight."""
+    EWMA_LATENCY = "ewma_latency"
+    """Pick the better of two random nodes by moving average latency and requests in flight."""
+
+
+class ChannelOptions(object):
+    """
+    Options for the gRPC channels opened to the cluster.
+
+    Options left as None keep the gRPC default.
+
+    Args:
+        keepalive_time_ms (Optional[int], optional): Interval in milliseconds between keepalive pings on an idle connection. Keepalive is disabled by default, which lets NATs and load balancers silently drop idle connections. Defaults to None.
+        keepalive_timeout_ms (Optional[int], optional): Time in milliseconds to wait for a keepalive ping acknowledgement before closing the connection. Defaults to None.
+        keepalive_permit_without_calls (Optional[bool], optional): Send keepalive pings even when no call is in flight. Defaults to None.
+        max_send_message_length (Optional[int], optional): Maximum size in bytes of a request message, -1 for unlimited. Defaults to None.
+        max_receive_message_length (Optional[int], optional): Maximum size in bytes of a response message, -1 for unlimited. The gRPC default of 4MB can be too small for searches projecting many fields. Defaults to None.
+        initial_window_size (Optional[int], optional): Initial HTTP/2 stream flow-control window in bytes. Defaults to None.
+        bdp_probe (Optional[bool], optional): Grow the HTTP/2 flow-control windows from bandwidth-delay product estimates. Disable it to keep initial_window_size fixed. Defaults to None.
+        max_frame_size (Optional[int], optional): Maximum HTTP/2 frame size in bytes. Defaults to None.
+        compression (Optional[bool], optional): Compress every request with gzip. Defaults to False.
+        extra_options (Optional[list[tuple[str, Any]]], optional): Additional gRPC channel arguments, passed through unchanged. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        *,
+        keepalive_time_ms: Optional[int] = None,
+        keepalive_timeout_ms: Optional[int] = None,
+        keepalive_permit_without_calls: Optional[bool] = None,
+        max_send_message_length: Optional[int] = None,
+        max_receive_message_length: Optional[int] = None,
+        initial_window_size: Optional[int] = None,
+        bdp_probe: Optional[bool] = None,
+        max_frame_size: Optional[int] = None,
+        compression: Optional[bool] = False,
+        extra_options: Optional[list[tuple[str, Any]]] = None,
+    ) -> None:
+        self.keepalive_time_ms = keepalive_time_ms
+        self.keepalive_timeout_ms = keepalive_timeout_ms
+        self.keepalive_permit_without_calls = keepalive_permit_without_calls
+        self.max_send_message_length = max_send_message_length
+        self.max_receive_message_length = max_receive_message_length
+        self.initial_window_size = initial_window_size
+        self.bdp_probe = bdp_probe
+        self.max_frame_size = max_frame_size
+        self.compression = compression
+        self.extra_options = extra_options
+
+    def _to_grpc_options(self) -> list[tuple[str, Any]]:
+        options = []
+        for name, value in (
+            ("grpc.keepalive_time_ms", self.keepalive_time_ms),
+            ("grpc.keepalive_timeout_ms", self.keepalive_timeout_ms),
+            (
+                "grpc.keepalive_permit_without_calls",
+                self.keepalive_permit_without_calls,
+            ),
+            ("grpc.max_send_message_length", self.max_send_message_length),
+            ("grpc.max_receive_message_length", self.max_receive_message_length),
+            ("grpc.http2.lookahead_bytes", self.initial_window_size),
+            ("grpc.http2.bdp_probe", self.bdp_probe),
+            ("grpc.http2.max_frame_size", self.max_frame_size),
+        ):
+            if value is not None:
+                options.append((name, int(value)))
+
+        if self.extra_options:
+            options.extend(self.extra_options)
+        return options
+
+
+class RetryPolicy(object):
+    """
+    Policy for retrying idempotent reads: get, exists, is_indexed and vector_search.
+
+    Each retry is sent to a node that has not been tried yet when the cluster has one.
+    Retries stop early when the call's timeout would expire during the backoff.
+
+    Args:
+        max_attempts (Optional[int], optional): Maximum number of attempts, including the first one. 1 disables retries. Defaults to 3.
+        initial_backoff (Optional[float], optional): Upper bound in seconds of the delay before the first retry. Defaults to 0.01.
+        max_backoff (Optional[float], optional): Upper bound in seconds of the delay before any retry. Defaults to 1.
+        backoff_multiplier (Optional[float], optional): Factor the backoff bound grows by after each retry. The delay is drawn uniformly between 0 and the bound. Defaults to 2.
+        retryable_codes (Optional[list[grpc.StatusCode]], optional): Status codes that are retried. Defaults to [grpc.StatusCode.UNAVAILABLE].
+    """
+
+    def __init__(
+        self,
+        *,
+        max_attempts: Optional[int] = 3,
+        initial_backoff: Optional[float] = 0.01,
+        max_backoff: Optional[float] = 1,
+        backoff_multiplier: Optional[float] = 2,
+        retryable_codes: Optional[list[grpc.StatusCode]] = None,
+    ) -> None:
+        self.max_attempts = max_attempts
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.backoff_multiplier = backoff_multiplier
+        if retryable_codes is None:
+            retryable_codes = [grpc.StatusCode.UNAVAILABLE]
+        self.retryable_codes = frozenset(retryable_codes)
+
+
+class HedgePolicy(object):
+    """
+    Policy for hedging get and vector_search.
+
+    When the first attempt has not completed after the hedge delay, a second attempt is sent to another node.
+    The first result to arrive is returned and the other attempt is cancelled.
+
+    Args:
+        delay (Optional[float], optional): Fixed hedge delay in seconds. If None, the delay is the observed
+            percentile latency of the operation. Defaults to None.
+        percentile (Optional[float], optional): Latency percentile used as the hedge delay. Defaults to 95.
+        min_samples (Optional[int], optional): Number of latencies observed before requests are hedged
+            when no fixed delay is set. Defaults to 100.
+    """
+
+    def __init__(
+        self,
+        *,
+        delay: Optional[float] = None,
+        percentile: Optional[float] = 95,
+        min_samples: Optional[int] = 100,
+    ) -> None:
+        self.delay = delay
+        self.percentile = percentile
+        self.min_samples = min_samples
+
+
+class CachePolicy(object):
+    """
+    Size and lifetime of a client side cache.
+
+    Args:
+        max_entries (Optional[int], optional): Maximum number of cached entries. The least recently used entry is evicted
+            when the cache is full, which bounds the memory used by the cache. Defaults to 10000.
+        ttl (Optional[float], optional): Time in seconds an entry stays valid after it was cached. None keeps entries until
+            they are evicted or invalidated. Defaults to 60.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: Optional[int] = 10000,
+        ttl: Optional[float] = 60,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+
+
+class VectorSearchCachePolicy(CachePolicy):
+    """
+    Size and lifetime of the client side vector_search result cache.
+
+    Searches share a cache entry when their namespace, index, limit, ef, field names and query vector,
+    rounded to a multiple of quantization_step, are equal.
+
+    Args:
+        max_entries (Optional[int], optional): Maximum number of cached searches. Defaults to 10000.
+        ttl (Optional[float], optional): Time in seconds a search result stays valid. Defaults to 60.
+        quantization_step (Optional[float], optional): Query vector components are rounded to a multiple of this value
+            before hashing, so nearly identical queries hit the same entry. Defaults to 1e-6.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: Optional[int] = 10000,
+        ttl: Optional[float] = 60,
+        quantization_step: Optional[float] = 1e-6,
+    ) -> None:
+        super().__init__(max_entries=max_entries, ttl=ttl)
+        self.quantization_step = quantization_step
+
+
+class CacheStats(object):
+    """
+    Counters of a client side cache.
+
+    Args:
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups that went to the server.
+        evictions (int): Number of entries evicted to keep the cache within its size.
+        size (int): Number of entries currently cached.
+    """
+
+    def __init__(self, *, hits: int, misses: int, evictions: int, size: int) -> None:
+        self.hits = hits
+        self.misses = misses
+        self.evictions = evictions
+        self.size = size
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Fraction of lookups answered from the cache, 0 before the first lookup.
+        """
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0.0
+        return self.hits / lookups
+
+    def __str__(self):
+        return "CacheStats(hits={}, misses={}, evictions={}, size={})".format(
+            self.hits, self.misses, self.evictions, self.size
+        )
+
+
+class IndexCompletionProgress(object):
+    """
+    Progress of an index towards having no pending index update operations.
+
+    Args:
+        namespace (str): The namespace of the index.
+        name (str): The name of the index.
+        unmerged_record_count (int): Number of records waiting to be merged into the index.
+        rate (Optional[float]): Smoothed number of records merged per second, None until two statuses were read.
+        eta (Optional[float]): Estimated seconds until every record is merged, None while the rate is unknown or not positive.
+        elapsed (float): Seconds since the wait started.
+    """
+
+    def __init__(
+        self,
+        *,
+        namespace: str,
+        name: str,
+        unmerged_record_count: int,
+        rate: Optional[float],
+        eta: Optional[float],
+        elapsed: float,
+    ) -> None:
+        self.namespace = namespace
+        self.name = name
+        self.unmerged_record_count = unmerged_record_count
+        self.rate = rate
+        self.eta = eta
+        self.elapsed = elapsed
+
+    def __str__(self):
+        return "IndexCompletionProgress(namespace={}, name={}, unmerged_record_count={}, rate={}, eta={}, elapsed={})".format(
+            self.namespace,
+            self.name,
+            self.unmerged_record_count,
+            self.rate,
+            self.eta,
+            self.elapsed,
+        )
+
+
+class PhaseTiming(object):
+    """
+    Client side time spent in each phase of one call, in nanoseconds measured with time.perf_counter_ns.
+
+    Args:
+        operation (str): The client method that made the call, such as "vector_search" or "get".
+        prepare_ns (int): Converting the arguments into the request message.
+        first_response_ns (int): From the end of prepare until the first response message is received,
+        including retries and hedged attempts.
+        drain_ns (int): From the first response message until the end of the response stream. 0 for unary calls.
+        decode_ns (int): Converting the response messages into the returned objects.
+        responses (int): Number of response messages received.
+    """
+
+    def __init__(
+        self,
+        *,
+        operation: str,
+        prepare_ns: int,
+        first_response_ns: int,
+        drain_ns: int,
+        decode_ns: int,
+        responses: int,
+    ) -> None:
+        self.operation = operation
+        self.prepare_ns = prepare_ns
+        self.first_response_ns = first_response_ns
+        self.drain_ns = drain_ns
+        self.decode_ns = decode_ns
+        self.responses = responses
+
+    @property
+    def total_ns(self) -> int:
+        """
+        Time spent in all phases of the call.
+        """
+        return self.prepare_ns + self.first_response_ns + self.drain_ns + self.decode_ns
+
+    def __str__(self):
+        return "PhaseTiming(operation={}, prepare_ns={}, first_response_ns={}, drain_ns={}, decode_ns={}, responses={})".format(
+            self.operation,
+            self.prepare_ns,
+            self.first_response_ns,
+            self.drain_ns,
+            self.decode_ns,
+            self.responses,
+        )
+
+
 class HnswBatchingParams(object):
     """
     Parameters for configuring batching behaviour for batch based index update.
@@ -251,3 +612,16 @@ class AVSServerError(AVSError):
 
     def __init__(self, *, rpc_error) -> None:
         self.rpc_error = rpc_error
+
+
+class AVSDeadlineExceededError(AVSServerError):
+    """
+    Custom exception raised when a request did not complete before its timeout expired.
+
+    The request may still have been applied by the server.
+
+    Args:
+        rpc_error (Exception): The original gRPC error object, with status DEADLINE_EXCEEDED.
+    """
+
+    pass
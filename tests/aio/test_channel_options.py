@@ -0,0 +1,57 @@
+import pytest
+from aerospike_vector_search import AVSServerError, ChannelOptions, types
+from aerospike_vector_search.aio import Client
+from aerospike_vector_search.aio.admin import Client as AdminClient
+
+from .conftest import host, port
+
+
+@pytest.mark.parametrize(
+    "channel_options",
+    [
+        ChannelOptions(),
+        ChannelOptions(
+            keepalive_time_ms=30000,
+            keepalive_timeout_ms=5000,
+            keepalive_permit_without_calls=True,
+            max_send_message_length=64 * 1024 * 1024,
+            max_receive_message_length=64 * 1024 * 1024,
+            initial_window_size=1024 * 1024,
+            bdp_probe=False,
+            compression=True,
+        ),
+    ],
+)
+async def test_channel_options(channel_options):
+    async with Client(
+        seeds=types.HostPort(host=host, port=port), channel_options=channel_options
+    ) as client:
+        record_data = {"english": [float(i) for i in range(1024)]}
+        await client.upsert(
+            namespace="test", key="aio/channel_options/1", record_data=record_data
+        )
+        result = await client.get(namespace="test", key="aio/channel_options/1")
+        assert result.fields["english"] == record_data["english"]
+        await client.delete(namespace="test", key="aio/channel_options/1")
+
+    async with AdminClient(
+        seeds=types.HostPort(host=host, port=port), channel_options=channel_options
+    ) as client:
+        assert isinstance(await client.index_list(), list)
+
+
+async def test_channel_options_max_receive_message_length():
+    async with Client(seeds=types.HostPort(host=host, port=port)) as client:
+        await client.upsert(
+            namespace="test",
+            key="aio/channel_options/2",
+            record_data={"english": [float(i) for i in range(1024)]},
+        )
+
+    async with Client(
+        seeds=types.HostPort(host=host, port=port),
+        channel_options=ChannelOptions(max_receive_message_length=1024),
+    ) as client:
+        with pytest.raises(AVSServerError):
+            await client.get(namespace="test", key="aio/channel_options/2")
+        await client.delete(namespace="test", key="aio/channel_options/2")
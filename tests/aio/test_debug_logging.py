@@ -0,0 +1,34 @@
+import logging
+
+import numpy as np
+from aerospike_vector_search import types
+from aerospike_vector_search.aio import Client
+
+from .conftest import host, port
+
+
+async def test_debug_logging_summarizes_vectors(caplog):
+    async with Client(seeds=types.HostPort(host=host, port=port)) as client:
+        with caplog.at_level(logging.DEBUG, logger="aerospike_vector_search"):
+            await client.upsert(
+                namespace="test",
+                key="aio/debug_logging/1",
+                record_data={"vector": np.ones(1536, dtype=np.float32), "a": 1},
+            )
+
+    messages = [record.getMessage() for record in caplog.records]
+    put_messages = [message for message in messages if "Putting record" in message]
+    assert len(put_messages) == 1
+    assert "vector(shape=(1536,), dtype=float32, norm=39.1918)" in put_messages[0]
+
+
+async def test_debug_logging_sampled(caplog):
+    async with Client(
+        seeds=types.HostPort(host=host, port=port), debug_log_sample_rate=0
+    ) as client:
+        with caplog.at_level(logging.DEBUG, logger="aerospike_vector_search"):
+            await client.upsert(
+                namespace="test", key="aio/debug_logging/2", record_data={"a": 1}
+            )
+
+    assert not any("Putting record" in r.getMessage() for r in caplog.records)
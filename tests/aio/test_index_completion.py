@@ -0,0 +1,104 @@
+import asyncio
+import socket
+import time
+
+import pytest
+from aerospike_vector_search import AVSServerError, types
+from aerospike_vector_search.aio import Client
+
+from .conftest import host, port
+
+
+async def test_wait_for_indexes_completion(session_vector_client, session_admin_client):
+    names = ["aio_index_completion_1", "aio_index_completion_2"]
+    for name in names:
+        await session_admin_client.index_create(
+            namespace="test", name=name, vector_field=name, dimensions=2
+        )
+
+    progress = []
+    await session_vector_client.wait_for_indexes_completion(
+        indexes=[("test", name) for name in names],
+        min_wait_interval=0.1,
+        wait_interval=1,
+        progress=progress.append,
+    )
+
+    assert {p.name for p in progress} == set(names)
+    assert all(p.unmerged_record_count == 0 for p in progress)
+
+    start = time.monotonic()
+    with pytest.raises(Exception, match="timed-out"):
+        await session_vector_client.wait_for_index_completion(
+            namespace="test", name=names[0], timeout=1
+        )
+    assert time.monotonic() - start < 3
+
+    for name in names:
+        await session_admin_client.index_drop(namespace="test", name=name)
+
+
+async def test_wait_for_index_completion_missing_index(session_vector_client):
+    with pytest.raises(AVSServerError):
+        await session_vector_client.wait_for_index_completion(
+            namespace="test", name="aio_index_completion_missing"
+        )
+
+
+async def test_wait_for_index_completion_unavailable():
+    with socket.socket() as sock:
+        sock.bind((host, 0))
+        unused_port = sock.getsockname()[1]
+
+    async with Client(
+        seeds=types.HostPort(host=host, port=unused_port), is_loadbalancer=True
+    ) as client:
+        start = time.monotonic()
+        with pytest.raises(Exception, match="timed-out"):
+            await client.wait_for_index_completion(
+                namespace="test", name="aio_index_completion_1", timeout=2
+            )
+        assert time.monotonic() - start < 4
+
+
+async def test_watch_index_completion(session_admin_client):
+    names = [f"aio_index_watch_{i}" for i in range(5)]
+    # Concurrent creations share the admin client's status poller.
+    await asyncio.gather(
+        *(
+            session_admin_client.index_create(
+                namespace="test", name=name, vector_field=name, dimensions=2
+            )
+            for name in names
+        )
+    )
+
+    async with Client(seeds=types.HostPort(host=host, port=port)) as client:
+        progress = []
+        handles = [
+            client.watch_index_completion(
+                namespace="test",
+                name=name,
+                min_wait_interval=0.1,
+                wait_interval=1,
+                progress=progress.append,
+            )
+            for name in names
+        ]
+        missing = client.watch_index_completion(
+            namespace="test", name="aio_index_watch_missing"
+        )
+
+        done, _ = await asyncio.wait([missing], timeout=5)
+        assert done == {missing}
+        assert isinstance(missing.exception(), AVSServerError)
+        assert not any(handle.done() for handle in handles)
+
+        handles[0].cancel()
+        done, pending = await asyncio.wait(handles[1:], timeout=20)
+        assert not pending
+        assert all(handle.exception() is None for handle in done)
+        assert {p.name for p in progress} >= set(names[1:])
+
+    for name in names:
+        await session_admin_client.index_drop(namespace="test", name=name)
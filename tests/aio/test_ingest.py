@@ -0,0 +1,59 @@
+import json
+
+import numpy as np
+import pytest
+from aerospike_vector_search.aio import ingest
+
+
+async def test_ingest(session_vector_client, tmp_path):
+    vectors = np.arange(40, dtype=np.float32).reshape(10, 4)
+    path = str(tmp_path / "vectors.fvecs")
+    with open(path, "wb") as file:
+        for vector in vectors:
+            file.write(np.int32(4).tobytes())
+            file.write(vector.tobytes())
+    checkpoint_path = str(tmp_path / "checkpoint.json")
+    with open(checkpoint_path, "w") as file:
+        json.dump({"path": path, "offset": 4}, file)
+
+    progress = []
+    written = await ingest.ingest(
+        session_vector_client,
+        namespace="test",
+        path=path,
+        vector_field="vector",
+        key_function=lambda i: f"aio/ingest/{i}",
+        chunk_size=4,
+        max_in_flight=2,
+        progress=lambda done, total: progress.append((done, total)),
+        checkpoint_path=checkpoint_path,
+    )
+
+    assert written == 6
+    assert progress == [(8, 10), (10, 10)]
+    with open(checkpoint_path) as file:
+        assert json.load(file)["offset"] == 10
+
+    exists = await session_vector_client.exists_many(
+        namespace="test", keys=[f"aio/ingest/{i}" for i in range(10)]
+    )
+    assert exists.tolist() == [False] * 4 + [True] * 6
+    record = await session_vector_client.get(namespace="test", key="aio/ingest/5")
+    assert record.fields["vector"] == vectors[5].tolist()
+
+
+async def test_ingest_rejects_ivecs(session_vector_client, tmp_path):
+    path = str(tmp_path / "neighbors.ivecs")
+    with open(path, "wb") as file:
+        for vector in np.arange(8, dtype=np.int32).reshape(2, 4):
+            file.write(np.int32(4).tobytes())
+            file.write(vector.tobytes())
+
+    with pytest.raises(Exception) as e_info:
+        await ingest.ingest(
+            session_vector_client,
+            namespace="test",
+            path=path,
+            vector_field="vector",
+        )
+    assert ".ivecs" in str(e_info.value)
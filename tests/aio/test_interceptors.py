@@ -0,0 +1,64 @@
+import grpc
+import numpy as np
+import pytest
+from aerospike_vector_search import AVSServerError, types
+from aerospike_vector_search.aio import AdminClient, Client
+
+from .conftest import host, port
+
+
+class RecordingUnaryUnaryInterceptor(grpc.aio.UnaryUnaryClientInterceptor):
+    def __init__(self, methods):
+        self.methods = methods
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        self.methods.append(client_call_details.method.decode())
+        return await continuation(client_call_details, request)
+
+
+class RecordingUnaryStreamInterceptor(grpc.aio.UnaryStreamClientInterceptor):
+    def __init__(self, methods):
+        self.methods = methods
+
+    async def intercept_unary_stream(self, continuation, client_call_details, request):
+        self.methods.append(client_call_details.method.decode())
+        return await continuation(client_call_details, request)
+
+
+async def test_client_interceptors():
+    methods = []
+    async with Client(
+        seeds=types.HostPort(host=host, port=port),
+        interceptors=[
+            RecordingUnaryUnaryInterceptor(methods),
+            RecordingUnaryStreamInterceptor(methods),
+        ],
+    ) as client:
+        await client.upsert(
+            namespace="test",
+            key="aio/interceptors/1",
+            record_data={"a": np.ones(8, dtype=np.float32)},
+        )
+        with pytest.raises(AVSServerError):
+            await client.vector_search(
+                namespace="test",
+                index_name="aio_interceptors_missing",
+                query=[1.0],
+                limit=1,
+            )
+
+    assert "/aerospike.vector.Transact/Put" in methods
+    assert "/aerospike.vector.Transact/VectorSearch" in methods
+    # Cluster tends go through the interceptors too.
+    assert "/aerospike.vector.ClusterInfo/GetClusterEndpoints" in methods
+
+
+async def test_admin_client_interceptors():
+    methods = []
+    async with AdminClient(
+        seeds=types.HostPort(host=host, port=port),
+        interceptors=[RecordingUnaryUnaryInterceptor(methods)],
+    ) as client:
+        await client.index_list()
+
+    assert "/aerospike.vector.IndexService/List" in methods
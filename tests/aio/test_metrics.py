@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+from aerospike_vector_search import AVSServerError, types
+from aerospike_vector_search.aio import AdminClient, Client, ClientMetrics
+
+from .conftest import host, port
+
+
+def by_method(snapshot, method):
+    return [rpc for rpc in snapshot if rpc.method == method]
+
+
+async def test_client_metrics():
+    client_metrics = ClientMetrics()
+    async with (
+        Client(
+            seeds=types.HostPort(host=host, port=port), metrics=client_metrics
+        ) as client,
+        AdminClient(
+            seeds=types.HostPort(host=host, port=port), metrics=client_metrics
+        ) as admin_client,
+    ):
+        for i in range(5):
+            await client.upsert(
+                namespace="test", key=f"aio/metrics/{i}", record_data={"a": [1.0] * 8}
+            )
+        await client.get(namespace="test", key="aio/metrics/0")
+        with pytest.raises(AVSServerError):
+            await client.get(namespace="test", key="aio/metrics/missing")
+        with pytest.raises(AVSServerError):
+            await client.vector_search(
+                namespace="test", index_name="aio_metrics_missing", query=[1.0], limit=1
+            )
+        await admin_client.index_list()
+        # Calls are recorded by done callbacks scheduled on the event loop.
+        await asyncio.sleep(0.1)
+
+    snapshot = client_metrics.snapshot()
+    (put,) = by_method(snapshot, "aerospike.vector.Transact/Put")
+    assert put.latency.count == 5
+    assert put.sent_bytes > 0
+    assert put.in_flight == 0
+
+    (get,) = by_method(snapshot, "aerospike.vector.Transact/Get")
+    assert get.latency.count == 2
+    assert get.errors == {"NOT_FOUND": 1}
+    assert get.received_bytes > 0
+
+    (search,) = by_method(snapshot, "aerospike.vector.Transact/VectorSearch")
+    assert search.latency.count == 1
+    assert sum(search.errors.values()) == 1
+
+    assert by_method(snapshot, "aerospike.vector.IndexService/List")
+    assert "avs_client_rpc_in_flight" in client_metrics.prometheus_text()
@@ -0,0 +1,54 @@
+import numpy as np
+from aerospike_vector_search import types
+from aerospike_vector_search.aio import Client
+
+from .conftest import host, port
+
+
+async def test_phase_timing(session_admin_client):
+    timings = []
+    await session_admin_client.index_create(
+        namespace="test",
+        name="aio_phase_timing",
+        vector_field="aio_phase_timing_vector",
+        dimensions=8,
+    )
+    async with Client(
+        seeds=types.HostPort(host=host, port=port), phase_timing=timings.append
+    ) as client:
+        for i in range(10):
+            await client.upsert(
+                namespace="test",
+                key=f"aio/phase_timing/{i}",
+                record_data={
+                    "aio_phase_timing_vector": np.full(8, i, dtype=np.float32)
+                },
+            )
+        await client.wait_for_index_completion(
+            namespace="test", name="aio_phase_timing", wait_interval=1
+        )
+        assert timings == []
+
+        await client.get(namespace="test", key="aio/phase_timing/0")
+        neighbors = await client.vector_search(
+            namespace="test",
+            index_name="aio_phase_timing",
+            query=np.zeros(8, dtype=np.float32),
+            limit=3,
+        )
+
+    get_timing, search_timing = timings
+    assert get_timing.operation == "get"
+    assert get_timing.responses == 1
+    assert get_timing.drain_ns == 0
+    assert search_timing.operation == "vector_search"
+    assert search_timing.responses == len(neighbors) == 3
+    for timing in timings:
+        assert timing.prepare_ns >= 0
+        assert timing.first_response_ns > 0
+        assert timing.total_ns == (
+            timing.prepare_ns
+            + timing.first_response_ns
+            + timing.drain_ns
+            + timing.decode_ns
+        )
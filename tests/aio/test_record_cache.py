@@ -0,0 +1,58 @@
+import time
+
+import pytest
+from aerospike_vector_search import CachePolicy, types
+from aerospike_vector_search.aio import Client
+
+from .conftest import host, port
+
+
+async def test_record_cache():
+    async with Client(
+        seeds=types.HostPort(host=host, port=port),
+        record_cache=CachePolicy(max_entries=2),
+    ) as client:
+        key = "aio/record_cache/1"
+        await client.upsert(namespace="test", key=key, record_data={"a": 1, "b": 2})
+        assert (await client.get(namespace="test", key=key)).fields == {"a": 1, "b": 2}
+        assert (await client.get(namespace="test", key=key)).fields == {"a": 1, "b": 2}
+
+        # Projections are cached separately.
+        result = await client.get(namespace="test", key=key, field_names=["a"])
+        assert result.fields == {"a": 1}
+
+        stats = client.record_cache_stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 2, 2)
+
+        # Writes through the client drop every cached projection of the record.
+        await client.update(namespace="test", key=key, record_data={"a": 3})
+        assert client.record_cache_stats().size == 0
+        assert (await client.get(namespace="test", key=key)).fields == {"a": 3, "b": 2}
+
+        await client.upsert_many(namespace="test", records=[(key, {"b": 4})])
+        assert (await client.get(namespace="test", key=key)).fields == {"a": 3, "b": 4}
+
+        await client.delete(namespace="test", key=key)
+        with pytest.raises(types.AVSServerError):
+            await client.get(namespace="test", key=key)
+
+
+async def test_record_cache_ttl():
+    async with Client(
+        seeds=types.HostPort(host=host, port=port),
+        record_cache=CachePolicy(ttl=0.05),
+    ) as client:
+        key = "aio/record_cache/2"
+        await client.upsert(namespace="test", key=key, record_data={"a": 1})
+        await client.get(namespace="test", key=key)
+        await client.get(namespace="test", key=key)
+        time.sleep(0.1)
+        await client.get(namespace="test", key=key)
+
+        stats = client.record_cache_stats()
+        assert (stats.hits, stats.misses) == (1, 2)
+        await client.delete(namespace="test", key=key)
+
+
+async def test_record_cache_disabled(session_vector_client):
+    assert session_vector_client.record_cache_stats() is None
@@ -0,0 +1,58 @@
+import pytest
+from aerospike_vector_search import AVSDeadlineExceededError, types
+from aerospike_vector_search.aio import Client
+
+from .conftest import host, port
+
+# A deadline that has already passed fails calls without depending on server latency.
+expired_timeout = -1
+
+
+async def test_call_timeout(session_vector_client):
+    await session_vector_client.upsert(
+        namespace="test", key="aio/timeout/1", record_data={"english": [1.0, 2.0]}
+    )
+    with pytest.raises(AVSDeadlineExceededError):
+        await session_vector_client.get(
+            namespace="test", key="aio/timeout/1", timeout=expired_timeout
+        )
+    with pytest.raises(AVSDeadlineExceededError):
+        await session_vector_client.vector_search(
+            namespace="test",
+            index_name="aio_timeout",
+            query=[1.0, 2.0],
+            limit=1,
+            timeout=expired_timeout,
+        )
+    assert await session_vector_client.exists(
+        namespace="test", key="aio/timeout/1", timeout=10
+    )
+    await session_vector_client.delete(
+        namespace="test", key="aio/timeout/1", timeout=10
+    )
+
+
+async def test_client_timeout():
+    async with Client(
+        seeds=types.HostPort(host=host, port=port), timeout=expired_timeout
+    ) as client:
+        with pytest.raises(AVSDeadlineExceededError):
+            await client.exists(namespace="test", key="aio/timeout/2")
+
+        results = await client.upsert_many(
+            namespace="test",
+            records=[
+                (f"aio/timeout/{i}", {"english": [1.0, 2.0]}) for i in range(3, 6)
+            ],
+        )
+        assert all(isinstance(error, AVSDeadlineExceededError) for error in results)
+
+        # A per call timeout overrides the client default.
+        await client.upsert(
+            namespace="test",
+            key="aio/timeout/2",
+            record_data={"english": [1.0, 2.0]},
+            timeout=10,
+        )
+        assert await client.exists(namespace="test", key="aio/timeout/2", timeout=10)
+        await client.delete(namespace="test", key="aio/timeout/2", timeout=10)
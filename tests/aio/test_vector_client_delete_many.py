@@ -0,0 +1,33 @@
+import pytest
+from aerospike_vector_search import types
+
+
+@pytest.mark.parametrize("max_in_flight", [1, 8])
+async def test_vector_delete_many(session_vector_client, max_in_flight):
+    keys = [f"aio/delete_many/{max_in_flight}/{i}" for i in range(10)]
+    for key in keys:
+        await session_vector_client.upsert(
+            namespace="test", key=key, record_data={"a": 1}
+        )
+
+    failures = await session_vector_client.delete_many(
+        namespace="test",
+        keys=(key for key in keys),
+        max_in_flight=max_in_flight,
+    )
+
+    assert failures == []
+    exists = await session_vector_client.exists_many(namespace="test", keys=keys)
+    assert not exists.any()
+
+
+async def test_vector_delete_many_failures(session_vector_client):
+    keys = [f"aio/delete_many/failures/{i}" for i in range(3)]
+
+    failures = await session_vector_client.delete_many(
+        namespace="test", keys=iter(keys), timeout=-1
+    )
+
+    assert [key for (key, _) in failures] == keys
+    for _, error in failures:
+        assert isinstance(error, types.AVSDeadlineExceededError)
@@ -1,3 +1,6 @@
+import array
+
+import numpy as np
 import pytest
 
 class get_test_case:
@@ -36,6 +39,30 @@ class get_test_case:
             set_name=None,
             record_data={"english": [float(i) for i in range(1024)]},
             expected_fields={"english": [float(i) for i in range(1024)]}
+        ),
+        get_test_case(
+            namespace="test",
+            key="aio/get/3",
+            field_names=['english'],
+            set_name=None,
+            record_data={"english": np.arange(1024, dtype=np.float32)},
+            expected_fields={"english": [float(i) for i in range(1024)]}
+        ),
+        get_test_case(
+            namespace="test",
+            key="aio/get/4",
+            field_names=['english'],
+            set_name=None,
+            record_data={"english": array.array('f', range(1024))},
+            expected_fields={"english": [float(i) for i in range(1024)]}
+        ),
+        get_test_case(
+            namespace="test",
+            key="aio/get/5",
+            field_names=['english'],
+            set_name=None,
+            record_data={"english": np.ones((2, 3), dtype=np.float32)},
+            expected_fields={"english": [[1.0, 1.0, 1.0], [1.0, 1.0, 1.0]]}
         )
     ],
 )
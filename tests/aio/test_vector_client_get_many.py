@@ -0,0 +1,36 @@
+import pytest
+
+
+@pytest.mark.parametrize("max_in_flight", [1, 8])
+async def test_vector_get_many(session_vector_client, max_in_flight):
+    keys = [f"aio/get_many/{max_in_flight}/{i}" for i in range(10)]
+    for i, key in enumerate(keys):
+        await session_vector_client.upsert(
+            namespace="test", key=key, record_data={"a": i, "b": str(i)}
+        )
+
+    results = await session_vector_client.get_many(
+        namespace="test",
+        keys=iter(keys[:5] + ["aio/get_many/missing"] + keys[5:]),
+        max_in_flight=max_in_flight,
+    )
+
+    assert len(results) == 11
+    assert results[5] is None
+    records = results[:5] + results[6:]
+    for i, (key, record) in enumerate(zip(keys, records)):
+        assert record.key.key == key
+        assert record.fields == {"a": i, "b": str(i)}
+
+
+async def test_vector_get_many_field_names(session_vector_client):
+    await session_vector_client.upsert(
+        namespace="test", key="aio/get_many/fields", record_data={"a": 1, "b": 2}
+    )
+
+    results = await session_vector_client.get_many(
+        namespace="test", keys=["aio/get_many/fields"], field_names=["a"]
+    )
+
+    assert results[0].fields == {"a": 1}
+    assert await session_vector_client.get_many(namespace="test", keys=[]) == []
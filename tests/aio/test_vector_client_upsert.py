@@ -62,4 +62,13 @@ async def test_vector_upsert_with_existing_record(session_vector_client, test_ca
         key=test_case.key,
         record_data=test_case.record_data,
         set_name=test_case.set_name
-    )
\ No newline at end of file
+    )
+
+
+async def test_vector_upsert_rejects_byte_memoryview(session_vector_client):
+    with pytest.raises(Exception):
+        await session_vector_client.upsert(
+            namespace="test",
+            key="aio/upsert/memoryview",
+            record_data={"english": memoryview(b"abcd")},
+        )
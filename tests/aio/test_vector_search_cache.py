@@ -0,0 +1,121 @@
+import asyncio
+
+import numpy as np
+import pytest
+from aerospike_vector_search import VectorSearchCachePolicy, types
+from aerospike_vector_search.aio import Client
+
+from .conftest import host, port
+
+
+@pytest.fixture(scope="module")
+async def cache_index(session_vector_client, session_admin_client):
+    await session_admin_client.index_create(
+        namespace="test",
+        name="aio_search_cache",
+        vector_field="aio_search_cache_vector",
+        dimensions=4,
+    )
+    await session_vector_client.upsert_many(
+        namespace="test",
+        records=[
+            (
+                f"aio/search_cache/{i}",
+                {"aio_search_cache_vector": np.full(4, i, dtype=np.float32)},
+            )
+            for i in range(10)
+        ],
+    )
+    await session_vector_client.wait_for_index_completion(
+        namespace="test", name="aio_search_cache", wait_interval=1
+    )
+    return "aio_search_cache"
+
+
+async def search(client, index_name, value, limit=3):
+    return await client.vector_search(
+        namespace="test",
+        index_name=index_name,
+        query=[value] * 4,
+        limit=limit,
+    )
+
+
+async def test_vector_search_cache(cache_index):
+    async with Client(
+        seeds=types.HostPort(host=host, port=port),
+        vector_search_cache=VectorSearchCachePolicy(max_entries=2),
+    ) as client:
+        first = await search(client, cache_index, 1.0)
+        second = await search(client, cache_index, 1.0 + 1e-9)
+        assert [n.key.key for n in first] == [n.key.key for n in second]
+        assert first[0].key.key == "aio/search_cache/1"
+
+        stats = client.vector_search_cache_stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+        await search(client, cache_index, 2.0)
+        await search(client, cache_index, 3.0)
+        stats = client.vector_search_cache_stats()
+        assert (stats.evictions, stats.size) == (1, 2)
+
+        client.invalidate_vector_search_cache()
+        assert client.vector_search_cache_stats().size == 0
+
+
+async def test_vector_search_cache_single_flight(cache_index):
+    async with Client(
+        seeds=types.HostPort(host=host, port=port),
+        vector_search_cache=VectorSearchCachePolicy(),
+    ) as client:
+        searches = 0
+        uncached_search = client._vector_search
+
+        async def counting_search(*args):
+            nonlocal searches
+            searches += 1
+            return await uncached_search(*args)
+
+        client._vector_search = counting_search
+        results = await asyncio.gather(
+            *[search(client, cache_index, 4.0) for _ in range(10)]
+        )
+        assert searches == 1
+        for neighbors in results:
+            assert neighbors[0].key.key == "aio/search_cache/4"
+
+
+async def test_vector_search_cache_returns_copies(cache_index):
+    async with Client(
+        seeds=types.HostPort(host=host, port=port),
+        vector_search_cache=VectorSearchCachePolicy(),
+    ) as client:
+        results = await asyncio.gather(
+            *[search(client, cache_index, 5.0) for _ in range(2)]
+        )
+        # Searches sharing one flight get their own neighbors too.
+        assert results[0][0] is not results[1][0]
+        results[0][0].fields["changed"] = True
+        results[0].pop()
+        cached = await search(client, cache_index, 5.0)
+        assert len(cached) == 3
+        assert "changed" not in cached[0].fields
+        assert "changed" not in results[1][0].fields
+
+
+async def test_vector_search_cache_invalidated_during_search(cache_index):
+    async with Client(
+        seeds=types.HostPort(host=host, port=port),
+        vector_search_cache=VectorSearchCachePolicy(),
+    ) as client:
+        uncached_search = client._vector_search
+
+        async def racing_search(*args):
+            neighbors = await uncached_search(*args)
+            client.invalidate_vector_search_cache()
+            return neighbors
+
+        client._vector_search = racing_search
+        await search(client, cache_index, 6.0)
+        # The result read before the invalidation is not cached.
+        assert client.vector_search_cache_stats().size == 0
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+
+class vector_search_many_test_case:
+    def __init__(
+        self,
+        *,
+        index_name,
+        vector_field,
+        dimensions,
+        record_count,
+        query_count,
+        limit,
+        max_in_flight
+    ):
+        self.index_name = index_name
+        self.vector_field = vector_field
+        self.dimensions = dimensions
+        self.record_count = record_count
+        self.query_count = query_count
+        self.limit = limit
+        self.max_in_flight = max_in_flight
+
+
+@pytest.mark.parametrize(
+    "test_case",
+    [
+        vector_search_many_test_case(
+            index_name="aio_search_many_1",
+            vector_field="aio_search_many_1_vector",
+            dimensions=8,
+            record_count=50,
+            query_count=40,
+            limit=3,
+            max_in_flight=4
+        )
+    ],
+)
+async def test_vector_search_many(session_vector_client, session_admin_client, test_case):
+    await session_admin_client.index_create(
+        namespace="test",
+        name=test_case.index_name,
+        vector_field=test_case.vector_field,
+        dimensions=test_case.dimensions,
+    )
+    await session_vector_client.upsert_many(
+        namespace="test",
+        records=[
+            (
+                f"{test_case.index_name}/{i}",
+                {test_case.vector_field: np.full(test_case.dimensions, i, dtype=np.float32)},
+            )
+            for i in range(test_case.record_count)
+        ],
+    )
+    await session_vector_client.wait_for_index_completion(
+        namespace="test", name=test_case.index_name, wait_interval=1
+    )
+
+    queries = np.repeat(
+        np.arange(test_case.query_count, dtype=np.float32)[:, np.newaxis],
+        test_case.dimensions,
+        axis=1,
+    )
+    results = await session_vector_client.vector_search_many(
+        namespace="test",
+        index_name=test_case.index_name,
+        queries=queries,
+        limit=test_case.limit,
+        max_in_flight=test_case.max_in_flight,
+    )
+
+    assert len(results) == test_case.query_count
+    for i, neighbors in enumerate(results):
+        assert len(neighbors) == test_case.limit
+        assert neighbors[0].key.key == f"{test_case.index_name}/{i}"
+        assert neighbors[0].distance == 0
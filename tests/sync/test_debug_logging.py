@@ -0,0 +1,38 @@
+import logging
+
+import numpy as np
+import pytest
+from aerospike_vector_search import Client, types
+
+from .conftest import host, port
+
+
+def test_debug_logging_summarizes_vectors(caplog):
+    with Client(seeds=types.HostPort(host=host, port=port)) as client:
+        with caplog.at_level(logging.DEBUG, logger="aerospike_vector_search"):
+            client.upsert(
+                namespace="test",
+                key="debug_logging/1",
+                record_data={"vector": np.ones(1536, dtype=np.float32), "a": 1},
+            )
+
+    messages = [record.getMessage() for record in caplog.records]
+    put_messages = [message for message in messages if "Putting record" in message]
+    assert len(put_messages) == 1
+    assert "vector(shape=(1536,), dtype=float32, norm=39.1918)" in put_messages[0]
+    assert "'a': 1" in put_messages[0]
+
+
+def test_debug_logging_sampled(caplog):
+    with Client(
+        seeds=types.HostPort(host=host, port=port), debug_log_sample_rate=0
+    ) as client:
+        with caplog.at_level(logging.DEBUG, logger="aerospike_vector_search"):
+            client.upsert(namespace="test", key="debug_logging/2", record_data={"a": 1})
+
+    assert not any("Putting record" in r.getMessage() for r in caplog.records)
+
+
+def test_debug_logging_invalid_sample_rate():
+    with pytest.raises(Exception):
+        Client(seeds=types.HostPort(host=host, port=port), debug_log_sample_rate=2)
@@ -0,0 +1,79 @@
+import socket
+import time
+
+import pytest
+from aerospike_vector_search import AVSServerError, Client, types
+
+from .conftest import host, port
+
+
+@pytest.fixture(scope="module")
+def completion_indexes(session_admin_client):
+    names = ["index_completion_1", "index_completion_2"]
+    for name in names:
+        session_admin_client.index_create(
+            namespace="test", name=name, vector_field=name, dimensions=2
+        )
+    yield names
+    for name in names:
+        session_admin_client.index_drop(namespace="test", name=name)
+
+
+def test_wait_for_index_completion_progress(session_vector_client, completion_indexes):
+    progress = []
+    session_vector_client.wait_for_index_completion(
+        namespace="test",
+        name=completion_indexes[0],
+        min_wait_interval=0.1,
+        wait_interval=1,
+        progress=progress.append,
+    )
+
+    assert len(progress) >= 3
+    assert progress[-1].unmerged_record_count == 0
+    assert progress[-1].eta == 0
+    assert all(p.name == completion_indexes[0] for p in progress)
+
+
+def test_wait_for_indexes_completion(session_vector_client, completion_indexes):
+    progress = []
+    session_vector_client.wait_for_indexes_completion(
+        indexes=[("test", name) for name in completion_indexes],
+        min_wait_interval=0.1,
+        wait_interval=1,
+        progress=progress.append,
+    )
+
+    assert {p.name for p in progress} == set(completion_indexes)
+
+
+def test_wait_for_index_completion_timeout(session_vector_client, completion_indexes):
+    start = time.monotonic()
+    with pytest.raises(Exception, match="timed-out"):
+        session_vector_client.wait_for_index_completion(
+            namespace="test", name=completion_indexes[0], timeout=1
+        )
+    assert time.monotonic() - start < 3
+
+
+def test_wait_for_index_completion_missing_index(session_vector_client):
+    with pytest.raises(AVSServerError):
+        session_vector_client.wait_for_index_completion(
+            namespace="test", name="index_completion_missing"
+        )
+
+
+def test_wait_for_index_completion_unavailable():
+    with socket.socket() as sock:
+        sock.bind((host, 0))
+        unused_port = sock.getsockname()[1]
+
+    with Client(
+        seeds=types.HostPort(host=host, port=unused_port), is_loadbalancer=True
+    ) as client:
+        start = time.monotonic()
+        with pytest.raises(Exception, match="timed-out"):
+            client.wait_for_index_completion(
+                namespace="test", name="index_completion_1", timeout=2
+            )
+        assert time.monotonic() - start < 4
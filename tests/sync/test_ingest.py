@@ -0,0 +1,136 @@
+import json
+
+import numpy as np
+import pytest
+from aerospike_vector_search import ingest
+
+
+def write_vecs(path, vectors):
+    with open(path, "wb") as file:
+        for vector in vectors:
+            file.write(np.int32(len(vector)).tobytes())
+            file.write(vector.tobytes())
+
+
+@pytest.mark.parametrize(
+    "suffix,dtype", [(".fvecs", np.float32), (".ivecs", np.int32), (".bvecs", np.uint8)]
+)
+def test_open_vecs(tmp_path, suffix, dtype):
+    vectors = np.arange(20, dtype=dtype).reshape(5, 4)
+    path = str(tmp_path / ("vectors" + suffix))
+    write_vecs(path, vectors)
+
+    mapped = ingest.open_vectors(path)
+
+    assert mapped.shape == (5, 4)
+    assert not mapped.flags.writeable
+    np.testing.assert_array_equal(mapped, vectors)
+
+    chunks = list(ingest.iter_vector_chunks(path, 2, start=1))
+    assert [offset for (offset, _) in chunks] == [1, 3]
+    np.testing.assert_array_equal(np.concatenate([c for (_, c) in chunks]), vectors[1:])
+    assert not any(chunk.flags.owndata for (_, chunk) in chunks)
+
+
+def test_open_vecs_malformed(tmp_path):
+    path = str(tmp_path / "vectors.fvecs")
+    write_vecs(path, np.zeros((2, 4), dtype=np.float32))
+    with open(path, "ab") as file:
+        file.write(b"\0")
+
+    with pytest.raises(Exception):
+        ingest.open_vectors(path)
+
+
+def test_iter_parquet_chunks(tmp_path):
+    pyarrow = pytest.importorskip("pyarrow")
+    import pyarrow.parquet
+
+    vectors = np.arange(20, dtype=np.float32).reshape(5, 4)
+    path = str(tmp_path / "vectors.parquet")
+    pyarrow.parquet.write_table(
+        pyarrow.table({"id": range(5), "vector": list(vectors)}), path, row_group_size=2
+    )
+
+    assert ingest.count_vectors(path) == 5
+    chunks = list(ingest.iter_vector_chunks(path, 2, start=3, column="vector"))
+    assert [offset for (offset, _) in chunks] == [3, 4]
+    np.testing.assert_array_equal(np.concatenate([c for (_, c) in chunks]), vectors[3:])
+
+
+def test_ingest(session_vector_client, tmp_path):
+    vectors = np.arange(40, dtype=np.float32).reshape(10, 4)
+    path = str(tmp_path / "vectors.npy")
+    np.save(path, vectors)
+    checkpoint_path = str(tmp_path / "checkpoint.json")
+    with open(checkpoint_path, "w") as file:
+        json.dump({"path": path, "offset": 4}, file)
+
+    progress = []
+    written = ingest.ingest(
+        session_vector_client,
+        namespace="test",
+        path=path,
+        vector_field="vector",
+        key_function=lambda i: f"ingest/{i}",
+        chunk_size=4,
+        max_in_flight=2,
+        progress=lambda done, total: progress.append((done, total)),
+        checkpoint_path=checkpoint_path,
+    )
+
+    assert written == 6
+    assert progress == [(8, 10), (10, 10)]
+    with open(checkpoint_path) as file:
+        assert json.load(file)["offset"] == 10
+
+    exists = session_vector_client.exists_many(
+        namespace="test", keys=[f"ingest/{i}" for i in range(10)]
+    )
+    assert exists.tolist() == [False] * 4 + [True] * 6
+    record = session_vector_client.get(namespace="test", key="ingest/5")
+    assert record.fields["vector"] == vectors[5].tolist()
+
+    # A finished ingest resumes past the end of the file.
+    assert (
+        ingest.ingest(
+            session_vector_client,
+            namespace="test",
+            path=path,
+            vector_field="vector",
+            checkpoint_path=checkpoint_path,
+        )
+        == 0
+    )
+
+
+def test_ingest_bvecs(session_vector_client, tmp_path):
+    vectors = np.arange(12, dtype=np.uint8).reshape(3, 4)
+    path = str(tmp_path / "vectors.bvecs")
+    write_vecs(path, vectors)
+
+    written = ingest.ingest(
+        session_vector_client,
+        namespace="test",
+        path=path,
+        vector_field="vector",
+        key_function=lambda i: f"ingest_bvecs/{i}",
+    )
+
+    assert written == 3
+    record = session_vector_client.get(namespace="test", key="ingest_bvecs/2")
+    assert record.fields["vector"] == [8.0, 9.0, 10.0, 11.0]
+
+
+def test_ingest_rejects_ivecs(session_vector_client, tmp_path):
+    path = str(tmp_path / "neighbors.ivecs")
+    write_vecs(path, np.arange(8, dtype=np.int32).reshape(2, 4))
+
+    with pytest.raises(Exception) as e_info:
+        ingest.ingest(
+            session_vector_client,
+            namespace="test",
+            path=path,
+            vector_field="vector",
+        )
+    assert ".ivecs" in str(e_info.value)
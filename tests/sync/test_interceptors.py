@@ -0,0 +1,55 @@
+import grpc
+import numpy as np
+import pytest
+from aerospike_vector_search import AdminClient, AVSServerError, Client, types
+
+from .conftest import host, port
+
+
+class RecordingInterceptor(
+    grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor
+):
+    def __init__(self):
+        self.methods = []
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        self.methods.append(client_call_details.method)
+        return continuation(client_call_details, request)
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        self.methods.append(client_call_details.method)
+        return continuation(client_call_details, request)
+
+
+def test_client_interceptors():
+    interceptor = RecordingInterceptor()
+    with Client(
+        seeds=types.HostPort(host=host, port=port), interceptors=[interceptor]
+    ) as client:
+        client.upsert(
+            namespace="test",
+            key="interceptors/1",
+            record_data={"a": np.ones(8, dtype=np.float32)},
+        )
+        with pytest.raises(AVSServerError):
+            client.vector_search(
+                namespace="test",
+                index_name="interceptors_missing",
+                query=[1.0],
+                limit=1,
+            )
+
+    assert "/aerospike.vector.Transact/Put" in interceptor.methods
+    assert "/aerospike.vector.Transact/VectorSearch" in interceptor.methods
+    # Cluster tends go through the interceptors too.
+    assert "/aerospike.vector.ClusterInfo/GetClusterEndpoints" in interceptor.methods
+
+
+def test_admin_client_interceptors():
+    interceptor = RecordingInterceptor()
+    with AdminClient(
+        seeds=types.HostPort(host=host, port=port), interceptors=[interceptor]
+    ) as client:
+        client.index_list()
+
+    assert "/aerospike.vector.IndexService/List" in interceptor.methods
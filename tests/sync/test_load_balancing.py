@@ -0,0 +1,77 @@
+import pytest
+from aerospike_vector_search import Client, LoadBalancingPolicy, types
+from aerospike_vector_search.shared.proto_generated import vector_db_pb2
+
+from .conftest import host, port
+
+
+@pytest.mark.parametrize(
+    "policy",
+    [
+        LoadBalancingPolicy.RANDOM,
+        LoadBalancingPolicy.ROUND_ROBIN,
+        LoadBalancingPolicy.LEAST_OUTSTANDING,
+        LoadBalancingPolicy.EWMA_LATENCY,
+    ],
+)
+def test_load_balancing_policy(policy):
+    with Client(
+        seeds=types.HostPort(host=host, port=port), load_balancing_policy=policy
+    ) as client:
+        keys = [f"load_balancing/{policy.value}/{i}" for i in range(20)]
+        results = client.upsert_many(
+            namespace="test",
+            records=[(key, {"english": [1.0, 2.0]}) for key in keys],
+        )
+        assert results == [None] * len(keys)
+        for key in keys:
+            assert client.exists(namespace="test", key=key)
+            client.delete(namespace="test", key=key)
+
+        tracks_stats = policy in (
+            LoadBalancingPolicy.LEAST_OUTSTANDING,
+            LoadBalancingPolicy.EWMA_LATENCY,
+        )
+        for channel_endpoints in client._channel_provider._node_channels.values():
+            if tracks_stats:
+                assert channel_endpoints.stats.in_flight == 0
+                assert channel_endpoints.stats.ewma_latency > 0
+            else:
+                assert channel_endpoints.stats is None
+
+
+@pytest.mark.parametrize("connections_per_node", [1, 3])
+def test_connections_per_node(connections_per_node):
+    with Client(
+        seeds=types.HostPort(host=host, port=port),
+        connections_per_node=connections_per_node,
+    ) as client:
+        keys = [f"connections_per_node/{connections_per_node}/{i}" for i in range(20)]
+        results = client.upsert_many(
+            namespace="test",
+            records=[(key, {"english": [1.0, 2.0]}) for key in keys],
+        )
+        assert results == [None] * len(keys)
+        for key in keys:
+            client.delete(namespace="test", key=key)
+
+        for channel_endpoints in client._channel_provider._node_channels.values():
+            assert len(channel_endpoints.channels) == connections_per_node
+
+
+def test_connections_per_node_invalid():
+    with pytest.raises(Exception):
+        Client(seeds=types.HostPort(host=host, port=port), connections_per_node=0)
+
+
+def test_node_without_usable_endpoint():
+    with Client(seeds=types.HostPort(host=host, port=port)) as client:
+        channel_provider = client._channel_provider
+        # IPv6 endpoints are skipped, so no channel can be created for this node.
+        channel_provider.add_new_channel_to_node_channels(
+            -1,
+            vector_db_pb2.ServerEndpointList(
+                endpoints=[vector_db_pb2.ServerEndpoint(address="::1", port=port)]
+            ),
+        )
+        assert -1 not in channel_provider._node_channels
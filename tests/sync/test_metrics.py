@@ -0,0 +1,82 @@
+import pytest
+from aerospike_vector_search import (
+    AdminClient,
+    AVSServerError,
+    Client,
+    ClientMetrics,
+    MetricsSink,
+    PrometheusTextSink,
+    types,
+)
+
+from .conftest import host, port
+
+
+def by_method(snapshot, method):
+    return [rpc for rpc in snapshot if rpc.method == method]
+
+
+def test_client_metrics():
+    client_metrics = ClientMetrics()
+    with (
+        Client(
+            seeds=types.HostPort(host=host, port=port), metrics=client_metrics
+        ) as client,
+        AdminClient(
+            seeds=types.HostPort(host=host, port=port), metrics=client_metrics
+        ) as admin_client,
+    ):
+        for i in range(5):
+            client.upsert(
+                namespace="test", key=f"metrics/{i}", record_data={"a": [1.0] * 8}
+            )
+        client.get(namespace="test", key="metrics/0")
+        with pytest.raises(AVSServerError):
+            client.get(namespace="test", key="metrics/missing")
+        with pytest.raises(AVSServerError):
+            client.vector_search(
+                namespace="test", index_name="metrics_missing", query=[1.0], limit=1
+            )
+        admin_client.index_list()
+
+    snapshot = client_metrics.snapshot()
+    (put,) = by_method(snapshot, "aerospike.vector.Transact/Put")
+    assert put.node.endswith(f":{port}")
+    assert put.latency.count == 5
+    assert put.latency.percentile(50) > 0
+    assert put.sent_bytes > 0
+    assert put.in_flight == 0
+
+    (get,) = by_method(snapshot, "aerospike.vector.Transact/Get")
+    assert get.latency.count == 2
+    assert get.errors == {"NOT_FOUND": 1}
+    assert get.received_bytes > 0
+
+    (search,) = by_method(snapshot, "aerospike.vector.Transact/VectorSearch")
+    assert search.latency.count == 1
+    assert sum(search.errors.values()) == 1
+
+    assert by_method(snapshot, "aerospike.vector.IndexService/List")
+
+    text = client_metrics.prometheus_text()
+    assert "# TYPE avs_client_rpc_latency_seconds summary" in text
+    assert (
+        'avs_client_rpc_errors_total{method="aerospike.vector.Transact/Get",node="%s",code="NOT_FOUND"} 1'
+        % get.node
+        in text
+    )
+
+    exported = []
+    client_metrics.export(PrometheusTextSink(exported.append, prefix="test"))
+    assert exported[0].startswith("# HELP test_rpc_latency_seconds")
+
+    client_metrics.reset()
+    assert client_metrics.snapshot() == []
+
+
+def test_metrics_sink_requires_export():
+    class IncompleteSink(MetricsSink):
+        pass
+
+    with pytest.raises(TypeError):
+        IncompleteSink()
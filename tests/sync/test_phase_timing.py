@@ -0,0 +1,53 @@
+import numpy as np
+from aerospike_vector_search import Client, types
+
+from .conftest import host, port
+
+
+def test_phase_timing(session_admin_client):
+    timings = []
+    session_admin_client.index_create(
+        namespace="test",
+        name="phase_timing",
+        vector_field="phase_timing_vector",
+        dimensions=8,
+    )
+    with Client(
+        seeds=types.HostPort(host=host, port=port), phase_timing=timings.append
+    ) as client:
+        for i in range(10):
+            client.upsert(
+                namespace="test",
+                key=f"phase_timing/{i}",
+                record_data={"phase_timing_vector": np.full(8, i, dtype=np.float32)},
+            )
+        client.wait_for_index_completion(
+            namespace="test", name="phase_timing", wait_interval=1
+        )
+        assert timings == []
+
+        client.get(namespace="test", key="phase_timing/0")
+        neighbors = client.vector_search(
+            namespace="test",
+            index_name="phase_timing",
+            query=np.zeros(8, dtype=np.float32),
+            limit=3,
+        )
+
+    get_timing, search_timing = timings
+    assert get_timing.operation == "get"
+    assert get_timing.responses == 1
+    assert get_timing.drain_ns == 0
+    assert search_timing.operation == "vector_search"
+    assert search_timing.responses == len(neighbors) == 3
+    for timing in timings:
+        assert timing.prepare_ns >= 0
+        assert timing.first_response_ns > 0
+        assert timing.drain_ns >= 0
+        assert timing.decode_ns >= 0
+        assert timing.total_ns == (
+            timing.prepare_ns
+            + timing.first_response_ns
+            + timing.drain_ns
+            + timing.decode_ns
+        )
@@ -0,0 +1,69 @@
+import time
+
+import pytest
+from aerospike_vector_search import CachePolicy, Client, types
+
+from .conftest import host, port
+
+
+def test_record_cache():
+    with Client(
+        seeds=types.HostPort(host=host, port=port),
+        record_cache=CachePolicy(max_entries=2),
+    ) as client:
+        client.upsert(
+            namespace="test", key="record_cache/1", record_data={"a": 1, "b": 2}
+        )
+        assert client.get(namespace="test", key="record_cache/1").fields == {
+            "a": 1,
+            "b": 2,
+        }
+        assert client.get(namespace="test", key="record_cache/1").fields == {
+            "a": 1,
+            "b": 2,
+        }
+
+        # Projections are cached separately.
+        result = client.get(namespace="test", key="record_cache/1", field_names=["a"])
+        assert result.fields == {"a": 1}
+
+        stats = client.record_cache_stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 2, 2)
+
+        # Writes through the client drop every cached projection of the record.
+        client.update(namespace="test", key="record_cache/1", record_data={"a": 3})
+        assert client.record_cache_stats().size == 0
+        assert client.get(namespace="test", key="record_cache/1").fields == {
+            "a": 3,
+            "b": 2,
+        }
+
+        client.upsert_many(namespace="test", records=[("record_cache/1", {"b": 4})])
+        assert client.get(namespace="test", key="record_cache/1").fields == {
+            "a": 3,
+            "b": 4,
+        }
+
+        client.delete(namespace="test", key="record_cache/1")
+        with pytest.raises(types.AVSServerError):
+            client.get(namespace="test", key="record_cache/1")
+
+
+def test_record_cache_ttl():
+    with Client(
+        seeds=types.HostPort(host=host, port=port),
+        record_cache=CachePolicy(ttl=0.05),
+    ) as client:
+        client.upsert(namespace="test", key="record_cache/2", record_data={"a": 1})
+        client.get(namespace="test", key="record_cache/2")
+        client.get(namespace="test", key="record_cache/2")
+        time.sleep(0.1)
+        client.get(namespace="test", key="record_cache/2")
+
+        stats = client.record_cache_stats()
+        assert (stats.hits, stats.misses) == (1, 2)
+        client.delete(namespace="test", key="record_cache/2")
+
+
+def test_record_cache_disabled(session_vector_client):
+    assert session_vector_client.record_cache_stats() is None
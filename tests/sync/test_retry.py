@@ -0,0 +1,130 @@
+import socket
+import time
+
+import pytest
+from aerospike_vector_search import (
+    AVSServerError,
+    Client,
+    HedgePolicy,
+    RetryPolicy,
+    types,
+)
+from aerospike_vector_search.shared.proto_generated import (
+    transact_pb2_grpc,
+    vector_db_pb2,
+)
+
+from .conftest import host, port
+
+
+@pytest.mark.parametrize(
+    "retry_policy, hedge_policy",
+    [
+        (None, None),
+        (RetryPolicy(max_attempts=5, initial_backoff=0.001), None),
+        (RetryPolicy(), HedgePolicy(delay=0.0001)),
+        (RetryPolicy(), HedgePolicy(percentile=50, min_samples=5)),
+    ],
+)
+def test_retry_and_hedge_policies(retry_policy, hedge_policy):
+    with Client(
+        seeds=types.HostPort(host=host, port=port),
+        retry_policy=retry_policy,
+        hedge_policy=hedge_policy,
+    ) as client:
+        record_data = {"english": [1.0, 2.0]}
+        client.upsert(namespace="test", key="retry/1", record_data=record_data)
+        for _ in range(10):
+            result = client.get(namespace="test", key="retry/1")
+            assert result.fields["english"] == record_data["english"]
+            assert client.exists(namespace="test", key="retry/1")
+
+        with pytest.raises(AVSServerError):
+            client.vector_search(
+                namespace="test",
+                index_name="retry_missing_index",
+                query=[1.0, 2.0],
+                limit=1,
+            )
+        client.delete(namespace="test", key="retry/1")
+
+
+def set_node_endpoint(channel_provider, node, node_port):
+    channel_provider.add_new_channel_to_node_channels(
+        node,
+        vector_db_pb2.ServerEndpointList(
+            endpoints=[vector_db_pb2.ServerEndpoint(address=host, port=node_port)]
+        ),
+    )
+
+
+def open_two_node_client(owner_port, **kwargs):
+    # The node owning every partition is pointed at owner_port, and a second node at the server,
+    # so reads routed to the owner only succeed by being retried or hedged on the other node.
+    client = Client(
+        seeds=types.HostPort(host=host, port=port), tend_interval=1000, **kwargs
+    )
+    channel_provider = client._channel_provider
+    # Keep tends from restoring the cluster's real endpoints during the test.
+    channel_provider.request_tend = lambda: None
+    (owner,) = channel_provider._node_channels
+    set_node_endpoint(channel_provider, owner, owner_port)
+    set_node_endpoint(channel_provider, owner + 1, port)
+    return client
+
+
+def test_retry_on_another_node():
+    with Client(seeds=types.HostPort(host=host, port=port)) as client:
+        client.upsert(namespace="test", key="retry/2", record_data={"a": 1})
+
+    with socket.socket() as unused:
+        unused.bind((host, 0))
+        closed_port = unused.getsockname()[1]
+
+    with open_two_node_client(closed_port) as client:
+        with pytest.raises(AVSServerError):
+            client.get(namespace="test", key="retry/2")
+
+    with open_two_node_client(
+        closed_port, retry_policy=RetryPolicy(initial_backoff=0.001)
+    ) as client:
+        assert client.get(namespace="test", key="retry/2").fields == {"a": 1}
+
+
+def test_hedge_on_another_node():
+    with Client(seeds=types.HostPort(host=host, port=port)) as client:
+        client.upsert(namespace="test", key="retry/3", record_data={"a": 1})
+
+    # Accepts connections but never answers, so calls to it hang.
+    with socket.socket() as unresponsive:
+        unresponsive.bind((host, 0))
+        unresponsive.listen()
+        with open_two_node_client(
+            unresponsive.getsockname()[1], hedge_policy=HedgePolicy(delay=0.2)
+        ) as client:
+            start = time.monotonic()
+            result = client.get(namespace="test", key="retry/3", timeout=5)
+            elapsed = time.monotonic() - start
+
+    assert result.fields == {"a": 1}
+    assert 0.2 <= elapsed < 5
+
+
+def test_excluded_owner_is_not_routed_to():
+    with open_two_node_client(port) as client:
+        channel_provider = client._channel_provider
+        owner, other = sorted(channel_provider._node_channels)
+        key = client._get_key("test", None, "retry/4")
+        owner_stub = channel_provider.get_stub(transact_pb2_grpc.TransactStub, key)
+        assert channel_provider.node_of_stub(owner_stub) is (
+            channel_provider._node_channels[owner]
+        )
+
+        retry_stub = channel_provider.get_stub(
+            transact_pb2_grpc.TransactStub,
+            key,
+            exclude=[channel_provider._node_channels[owner]],
+        )
+        assert channel_provider.node_of_stub(retry_stub) is (
+            channel_provider._node_channels[other]
+        )
@@ -0,0 +1,51 @@
+import pytest
+from aerospike_vector_search import AVSDeadlineExceededError, Client, types
+
+from .conftest import host, port
+
+# A deadline that has already passed fails calls without depending on server latency.
+expired_timeout = -1
+
+
+def test_call_timeout(session_vector_client):
+    session_vector_client.upsert(
+        namespace="test", key="timeout/1", record_data={"english": [1.0, 2.0]}
+    )
+    with pytest.raises(AVSDeadlineExceededError):
+        session_vector_client.get(
+            namespace="test", key="timeout/1", timeout=expired_timeout
+        )
+    with pytest.raises(AVSDeadlineExceededError):
+        session_vector_client.vector_search(
+            namespace="test",
+            index_name="timeout",
+            query=[1.0, 2.0],
+            limit=1,
+            timeout=expired_timeout,
+        )
+    assert session_vector_client.exists(namespace="test", key="timeout/1", timeout=10)
+    session_vector_client.delete(namespace="test", key="timeout/1", timeout=10)
+
+
+def test_client_timeout():
+    with Client(
+        seeds=types.HostPort(host=host, port=port), timeout=expired_timeout
+    ) as client:
+        with pytest.raises(AVSDeadlineExceededError):
+            client.exists(namespace="test", key="timeout/2")
+
+        results = client.upsert_many(
+            namespace="test",
+            records=[(f"timeout/{i}", {"english": [1.0, 2.0]}) for i in range(3, 6)],
+        )
+        assert all(isinstance(error, AVSDeadlineExceededError) for error in results)
+
+        # A per call timeout overrides the client default.
+        client.upsert(
+            namespace="test",
+            key="timeout/2",
+            record_data={"english": [1.0, 2.0]},
+            timeout=10,
+        )
+        assert client.exists(namespace="test", key="timeout/2", timeout=10)
+        client.delete(namespace="test", key="timeout/2", timeout=10)
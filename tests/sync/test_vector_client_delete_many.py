@@ -0,0 +1,64 @@
+import pytest
+from aerospike_vector_search import types
+from .test_vector_client_get_many import record_transact_stubs
+
+
+@pytest.mark.parametrize("max_in_flight", [1, 8])
+def test_vector_delete_many(session_vector_client, max_in_flight):
+    keys = [f"delete_many/{max_in_flight}/{i}" for i in range(10)]
+    for key in keys:
+        session_vector_client.upsert(namespace="test", key=key, record_data={"a": 1})
+
+    failures = session_vector_client.delete_many(
+        namespace="test",
+        keys=(key for key in keys),
+        max_in_flight=max_in_flight,
+    )
+
+    assert failures == []
+    assert not session_vector_client.exists_many(namespace="test", keys=keys).any()
+
+
+def test_vector_delete_many_failures(session_vector_client):
+    keys = [f"delete_many/failures/{i}" for i in range(3)]
+
+    failures = session_vector_client.delete_many(
+        namespace="test", keys=iter(keys), timeout=-1
+    )
+
+    assert [key for (key, _) in failures] == keys
+    for _, error in failures:
+        assert isinstance(error, types.AVSDeadlineExceededError)
+
+
+def test_vector_delete_many_one_failure(session_vector_client, monkeypatch):
+    started = record_transact_stubs(session_vector_client, monkeypatch)
+    keys = ["delete_many/one/0", "delete_many/one/fail", "delete_many/one/2"]
+
+    failures = session_vector_client.delete_many(
+        namespace="test", keys=keys, max_in_flight=2
+    )
+
+    assert [key for (key, _) in failures] == ["delete_many/one/fail"]
+    assert isinstance(failures[0][1], types.AVSDeadlineExceededError)
+    assert len(started) == 3
+    assert not any(future.cancelled for future in started)
+
+
+def test_vector_delete_many_key_error_cancels_outstanding_deletes(
+    session_vector_client, monkeypatch
+):
+    started = record_transact_stubs(session_vector_client, monkeypatch)
+
+    def keys():
+        yield "delete_many/key_error/0"
+        yield "delete_many/key_error/1"
+        raise Exception("key source failed")
+
+    with pytest.raises(Exception, match="key source failed"):
+        session_vector_client.delete_many(
+            namespace="test", keys=keys(), max_in_flight=4
+        )
+
+    assert len(started) == 2
+    assert all(future.cancelled for future in started)
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+
+@pytest.mark.parametrize("max_in_flight", [1, 8])
+def test_vector_exists_many(session_vector_client, max_in_flight):
+    keys = [f"exists_many/{max_in_flight}/{i}" for i in range(10)]
+    for key in keys[::2]:
+        session_vector_client.upsert(namespace="test", key=key, record_data={"a": 1})
+
+    progress = []
+    result = session_vector_client.exists_many(
+        namespace="test",
+        keys=(key for key in keys),
+        max_in_flight=max_in_flight,
+        progress=progress.append,
+        progress_interval=4,
+    )
+
+    assert result.dtype == bool
+    assert result.tolist() == [i % 2 == 0 for i in range(10)]
+    assert progress == [4, 8, 10]
+
+
+def test_vector_is_indexed_many(session_vector_client, session_admin_client):
+    session_admin_client.index_create(
+        namespace="test",
+        name="is_indexed_many",
+        vector_field="is_indexed_many_vector",
+        dimensions=4,
+    )
+    keys = [f"is_indexed_many/{i}" for i in range(5)]
+    for i, key in enumerate(keys):
+        session_vector_client.upsert(
+            namespace="test",
+            key=key,
+            record_data={"is_indexed_many_vector": np.full(4, i, dtype=np.float32)},
+        )
+    session_vector_client.wait_for_index_completion(
+        namespace="test", name="is_indexed_many", wait_interval=1
+    )
+
+    result = session_vector_client.is_indexed_many(
+        namespace="test",
+        keys=keys + ["is_indexed_many/missing"],
+        index_name="is_indexed_many",
+    )
+
+    assert result.tolist() == [True] * 5 + [False]
+
+
+@pytest.mark.parametrize("progress_interval", [0, -1])
+def test_vector_check_many_rejects_progress_interval(
+    session_vector_client, progress_interval
+):
+    with pytest.raises(Exception, match="progress_interval"):
+        session_vector_client.exists_many(
+            namespace="test",
+            keys=["exists_many/progress_interval"],
+            progress=print,
+            progress_interval=progress_interval,
+        )
+    with pytest.raises(Exception, match="progress_interval"):
+        session_vector_client.is_indexed_many(
+            namespace="test",
+            keys=["exists_many/progress_interval"],
+            index_name="is_indexed_many",
+            progress=print,
+            progress_interval=progress_interval,
+        )
@@ -0,0 +1,116 @@
+import pytest
+from aerospike_vector_search import types
+
+
+@pytest.mark.parametrize("max_in_flight", [1, 8])
+def test_vector_get_many(session_vector_client, max_in_flight):
+    keys = [f"get_many/{max_in_flight}/{i}" for i in range(10)]
+    for i, key in enumerate(keys):
+        session_vector_client.upsert(
+            namespace="test", key=key, record_data={"a": i, "b": str(i)}
+        )
+
+    results = session_vector_client.get_many(
+        namespace="test",
+        keys=iter(keys[:5] + ["get_many/missing"] + keys[5:]),
+        max_in_flight=max_in_flight,
+    )
+
+    assert len(results) == 11
+    assert results[5] is None
+    records = results[:5] + results[6:]
+    for i, (key, record) in enumerate(zip(keys, records)):
+        assert record.key.key == key
+        assert record.fields == {"a": i, "b": str(i)}
+
+
+def test_vector_get_many_field_names(session_vector_client):
+    session_vector_client.upsert(
+        namespace="test", key="get_many/fields", record_data={"a": 1, "b": 2}
+    )
+
+    results = session_vector_client.get_many(
+        namespace="test", keys=["get_many/fields"], field_names=["a"]
+    )
+
+    assert results[0].fields == {"a": 1}
+    assert session_vector_client.get_many(namespace="test", keys=[]) == []
+
+
+class RecordingFuture:
+    def __init__(self, future):
+        self.future = future
+        self.cancelled = False
+
+    def result(self):
+        return self.future.result()
+
+    def add_done_callback(self, callback):
+        self.future.add_done_callback(lambda _: callback(self))
+
+    def cancel(self):
+        self.cancelled = True
+        return self.future.cancel()
+
+
+class RecordingMethod:
+    # Records the futures started through a unary stub method. Requests for
+    # keys ending in "/fail" get a negative timeout, so they fail.
+    def __init__(self, method, started):
+        self.method = method
+        self.started = started
+
+    def future(self, request, timeout=None):
+        if request.key.stringValue.endswith("/fail"):
+            timeout = -1
+        future = RecordingFuture(self.method.future(request, timeout=timeout))
+        self.started.append(future)
+        return future
+
+
+class RecordingStub:
+    def __init__(self, transact_stub, started):
+        self.Get = RecordingMethod(transact_stub.Get, started)
+        self.Delete = RecordingMethod(transact_stub.Delete, started)
+
+
+def record_transact_stubs(client, monkeypatch):
+    started = []
+    get_transact_stub = client._get_transact_stub
+    monkeypatch.setattr(
+        client,
+        "_get_transact_stub",
+        lambda key: RecordingStub(get_transact_stub(key), started),
+    )
+    return started
+
+
+def test_vector_get_many_failure_cancels_outstanding_gets(
+    session_vector_client, monkeypatch
+):
+    started = record_transact_stubs(session_vector_client, monkeypatch)
+    keys = ["get_many/cancel/fail"] + [f"get_many/cancel/{i}" for i in range(7)]
+
+    with pytest.raises(types.AVSDeadlineExceededError):
+        session_vector_client.get_many(namespace="test", keys=keys, max_in_flight=4)
+
+    assert len(started) == 4
+    assert not started[0].cancelled
+    assert all(future.cancelled for future in started[1:])
+
+
+def test_vector_get_many_key_error_cancels_outstanding_gets(
+    session_vector_client, monkeypatch
+):
+    started = record_transact_stubs(session_vector_client, monkeypatch)
+
+    def keys():
+        yield "get_many/key_error/0"
+        yield "get_many/key_error/1"
+        raise Exception("key source failed")
+
+    with pytest.raises(Exception, match="key source failed"):
+        session_vector_client.get_many(namespace="test", keys=keys(), max_in_flight=4)
+
+    assert len(started) == 2
+    assert all(future.cancelled for future in started)
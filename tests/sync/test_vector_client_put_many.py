@@ -0,0 +1,120 @@
+import pytest
+from aerospike_vector_search import AVSServerError
+
+
+class put_many_test_case:
+    def __init__(
+        self,
+        *,
+        namespace,
+        keys,
+        record_data,
+        set_name,
+        max_in_flight
+    ):
+        self.namespace = namespace
+        self.keys = keys
+        self.record_data = record_data
+        self.set_name = set_name
+        self.max_in_flight = max_in_flight
+
+
+@pytest.mark.parametrize(
+    "test_case",
+    [
+        put_many_test_case(
+            namespace="test",
+            keys=[f"upsert_many/{i}" for i in range(100)],
+            record_data={"english": [float(i) for i in range(1024)]},
+            set_name=None,
+            max_in_flight=8
+        ),
+        put_many_test_case(
+            namespace="test",
+            keys=[f"upsert_many/{i}" for i in range(100, 110)],
+            record_data={"english": [bool(i) for i in range(1024)]},
+            set_name=None,
+            max_in_flight=64
+        )
+    ],
+)
+def test_vector_upsert_many(session_vector_client, test_case):
+    results = session_vector_client.upsert_many(
+        namespace=test_case.namespace,
+        records=[(key, test_case.record_data) for key in test_case.keys],
+        set_name=test_case.set_name,
+        max_in_flight=test_case.max_in_flight
+    )
+    assert results == [None] * len(test_case.keys)
+    for key in test_case.keys:
+        assert session_vector_client.exists(namespace=test_case.namespace, key=key)
+
+
+@pytest.mark.parametrize(
+    "test_case",
+    [
+        put_many_test_case(
+            namespace="test",
+            keys=[f"insert_many/{i}" for i in range(10)],
+            record_data={"math": [i for i in range(1024)]},
+            set_name=None,
+            max_in_flight=4
+        )
+    ],
+)
+def test_vector_insert_many_with_existing_record(session_vector_client, test_case):
+    session_vector_client.insert(
+        namespace=test_case.namespace,
+        key=test_case.keys[3],
+        record_data=test_case.record_data,
+        set_name=test_case.set_name
+    )
+    results = session_vector_client.insert_many(
+        namespace=test_case.namespace,
+        records=[(key, test_case.record_data) for key in test_case.keys],
+        set_name=test_case.set_name,
+        max_in_flight=test_case.max_in_flight
+    )
+    assert len(results) == len(test_case.keys)
+    for i, result in enumerate(results):
+        if i == 3:
+            assert isinstance(result, AVSServerError)
+        else:
+            assert result is None
+
+
+@pytest.mark.parametrize(
+    "test_case",
+    [
+        put_many_test_case(
+            namespace="test",
+            keys=[f"update_many/{i}" for i in range(10)],
+            record_data={"math": [i for i in range(1024)]},
+            set_name=None,
+            max_in_flight=4
+        )
+    ],
+)
+def test_vector_update_many_without_existing_record(session_vector_client, test_case):
+    results = session_vector_client.update_many(
+        namespace=test_case.namespace,
+        records=((key, test_case.record_data) for key in test_case.keys),
+        set_name=test_case.set_name,
+        max_in_flight=test_case.max_in_flight
+    )
+    assert len(results) == len(test_case.keys)
+    for result in results:
+        assert isinstance(result, AVSServerError)
+
+
+@pytest.mark.parametrize("max_in_flight", [0, -1])
+def test_vector_upsert_many_rejects_max_in_flight(session_vector_client, max_in_flight):
+    with pytest.raises(Exception, match="max_in_flight"):
+        session_vector_client.upsert_many(
+            namespace="test",
+            records=[("upsert_many/max_in_flight", {"a": 1})],
+            max_in_flight=max_in_flight,
+        )
+    assert not session_vector_client.exists(
+        namespace="test", key="upsert_many/max_in_flight"
+    )
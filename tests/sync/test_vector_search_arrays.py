@@ -0,0 +1,124 @@
+import numpy as np
+import pytest
+
+
+class vector_search_arrays_test_case:
+    def __init__(
+        self,
+        *,
+        index_name,
+        vector_field,
+        dimensions,
+        record_count,
+        limit,
+        vector_field_names
+    ):
+        self.index_name = index_name
+        self.vector_field = vector_field
+        self.dimensions = dimensions
+        self.record_count = record_count
+        self.limit = limit
+        self.vector_field_names = vector_field_names
+
+
+@pytest.mark.parametrize(
+    "test_case",
+    [
+        vector_search_arrays_test_case(
+            index_name="arrays_1",
+            vector_field="arrays_1_vector",
+            dimensions=8,
+            record_count=20,
+            limit=5,
+            vector_field_names=["arrays_1_vector"]
+        ),
+        vector_search_arrays_test_case(
+            index_name="arrays_2",
+            vector_field="arrays_2_vector",
+            dimensions=8,
+            record_count=20,
+            limit=5,
+            vector_field_names=None
+        )
+    ],
+)
+def test_vector_search_arrays(session_vector_client, session_admin_client, test_case):
+    session_admin_client.index_create(
+        namespace="test",
+        name=test_case.index_name,
+        vector_field=test_case.vector_field,
+        dimensions=test_case.dimensions,
+    )
+    for i in range(test_case.record_count):
+        session_vector_client.upsert(
+            namespace="test",
+            key=f"{test_case.index_name}/{i}",
+            record_data={
+                test_case.vector_field: np.full(test_case.dimensions, i, dtype=np.float32)
+            },
+        )
+    session_vector_client.wait_for_index_completion(
+        namespace="test", name=test_case.index_name, wait_interval=1
+    )
+
+    result = session_vector_client.vector_search_arrays(
+        namespace="test",
+        index_name=test_case.index_name,
+        query=np.zeros(test_case.dimensions, dtype=np.float32),
+        limit=test_case.limit,
+        vector_field_names=test_case.vector_field_names,
+    )
+
+    assert len(result) == test_case.limit
+    assert result.keys == [f"{test_case.index_name}/{i}" for i in range(test_case.limit)]
+    assert result.distances.dtype == np.float32
+    assert result.distances.shape == (test_case.limit,)
+    assert np.all(np.diff(result.distances) >= 0)
+    if test_case.vector_field_names:
+        vectors = result.vectors[test_case.vector_field]
+        assert vectors.shape == (test_case.limit, test_case.dimensions)
+        for i in range(test_case.limit):
+            assert np.all(vectors[i] == i)
+    else:
+        assert result.vectors == {}
+
+
+def test_vector_search_arrays_rejects_mixed_dimensions(
+    session_vector_client, session_admin_client
+):
+    session_admin_client.index_create(
+        namespace="test",
+        name="arrays_mixed",
+        vector_field="arrays_mixed_vector",
+        dimensions=4,
+    )
+    session_vector_client.upsert(
+        namespace="test",
+        key="arrays_mixed/0",
+        record_data={
+            "arrays_mixed_vector": np.zeros(4, dtype=np.float32),
+            "arrays_mixed_other": np.zeros(2, dtype=np.float32),
+        },
+    )
+    session_vector_client.upsert(
+        namespace="test",
+        key="arrays_mixed/1",
+        record_data={
+            "arrays_mixed_vector": np.ones(4, dtype=np.float32),
+            "arrays_mixed_other": np.ones(3, dtype=np.float32),
+        },
+    )
+    session_vector_client.wait_for_index_completion(
+        namespace="test", name="arrays_mixed", wait_interval=1
+    )
+
+    with pytest.raises(Exception) as e_info:
+        session_vector_client.vector_search_arrays(
+            namespace="test",
+            index_name="arrays_mixed",
+            query=np.zeros(4, dtype=np.float32),
+            limit=2,
+            vector_field_names=["arrays_mixed_other"],
+        )
+    assert "arrays_mixed_other" in str(e_info.value)
+    assert "arrays_mixed/1" in str(e_info.value)
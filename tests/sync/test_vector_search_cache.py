@@ -0,0 +1,117 @@
+import time
+
+import numpy as np
+import pytest
+from aerospike_vector_search import Client, VectorSearchCachePolicy, types
+
+from .conftest import host, port
+
+
+@pytest.fixture(scope="module")
+def cache_index(session_vector_client, session_admin_client):
+    session_admin_client.index_create(
+        namespace="test",
+        name="search_cache",
+        vector_field="search_cache_vector",
+        dimensions=4,
+    )
+    session_vector_client.upsert_many(
+        namespace="test",
+        records=[
+            (
+                f"search_cache/{i}",
+                {"search_cache_vector": np.full(4, i, dtype=np.float32)},
+            )
+            for i in range(10)
+        ],
+    )
+    session_vector_client.wait_for_index_completion(
+        namespace="test", name="search_cache", wait_interval=1
+    )
+    return "search_cache"
+
+
+def search(client, index_name, value, limit=3):
+    return client.vector_search(
+        namespace="test",
+        index_name=index_name,
+        query=[value] * 4,
+        limit=limit,
+    )
+
+
+def test_vector_search_cache(cache_index):
+    with Client(
+        seeds=types.HostPort(host=host, port=port),
+        vector_search_cache=VectorSearchCachePolicy(max_entries=2),
+    ) as client:
+        first = search(client, cache_index, 1.0)
+        second = search(client, cache_index, 1.0 + 1e-9)
+        assert [n.key.key for n in first] == [n.key.key for n in second]
+        assert first[0].key.key == "search_cache/1"
+
+        stats = client.vector_search_cache_stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+        assert stats.hit_rate == 0.5
+
+        # A different limit is a different search.
+        assert len(search(client, cache_index, 1.0, limit=2)) == 2
+        search(client, cache_index, 2.0)
+        stats = client.vector_search_cache_stats()
+        assert (stats.misses, stats.evictions, stats.size) == (3, 1, 2)
+
+        client.invalidate_vector_search_cache(namespace="test", index_name=cache_index)
+        assert client.vector_search_cache_stats().size == 0
+        search(client, cache_index, 2.0)
+        assert client.vector_search_cache_stats().misses == 4
+
+
+def test_vector_search_cache_ttl(cache_index):
+    with Client(
+        seeds=types.HostPort(host=host, port=port),
+        vector_search_cache=VectorSearchCachePolicy(ttl=0.05),
+    ) as client:
+        search(client, cache_index, 3.0)
+        search(client, cache_index, 3.0)
+        time.sleep(0.1)
+        search(client, cache_index, 3.0)
+
+        stats = client.vector_search_cache_stats()
+        assert (stats.hits, stats.misses) == (1, 2)
+
+
+def test_vector_search_cache_disabled(session_vector_client):
+    assert session_vector_client.vector_search_cache_stats() is None
+
+
+def test_vector_search_cache_returns_copies(cache_index):
+    with Client(
+        seeds=types.HostPort(host=host, port=port),
+        vector_search_cache=VectorSearchCachePolicy(),
+    ) as client:
+        first = search(client, cache_index, 5.0)
+        first[0].fields["changed"] = True
+        first.pop()
+        second = search(client, cache_index, 5.0)
+        assert len(second) == 3
+        assert "changed" not in second[0].fields
+        second[0].fields["changed"] = True
+        assert "changed" not in search(client, cache_index, 5.0)[0].fields
+
+
+def test_vector_search_cache_invalidated_during_search(cache_index):
+    with Client(
+        seeds=types.HostPort(host=host, port=port),
+        vector_search_cache=VectorSearchCachePolicy(),
+    ) as client:
+        uncached_search = client._vector_search
+
+        def racing_search(*args):
+            neighbors = uncached_search(*args)
+            client.invalidate_vector_search_cache()
+            return neighbors
+
+        client._vector_search = racing_search
+        search(client, cache_index, 6.0)
+        # The result read before the invalidation is not cached.
+        assert client.vector_search_cache_stats().size == 0